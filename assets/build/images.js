@@ -0,0 +1,120 @@
+// Generated by scripts/build_images.py from assets/build/images.json, do not edit
+const IMAGE_SOURCES = {
+  "background_space.png": {"image/avif": "assets/build/background_space-640.48a773d0d0.avif 640w, assets/build/background_space-1280.48a773d0d0.avif 1280w, assets/build/background_space-1920.48a773d0d0.avif 1920w", "image/webp": "assets/build/background_space-640.48a773d0d0.webp 640w, assets/build/background_space-1280.48a773d0d0.webp 1280w, assets/build/background_space-1920.48a773d0d0.webp 1920w"},
+  "cards/Burnt.webp": {"image/avif": "assets/build/cards/Burnt-300.d9e0a984ef.avif 300w, assets/build/cards/Burnt-600.d9e0a984ef.avif 600w, assets/build/cards/Burnt-1000.d9e0a984ef.avif 1000w", "image/webp": "assets/build/cards/Burnt-300.d9e0a984ef.webp 300w, assets/build/cards/Burnt-600.d9e0a984ef.webp 600w, assets/build/cards/Burnt-1000.d9e0a984ef.webp 1000w"},
+  "cards/assassin.jpeg": {"image/avif": "assets/build/cards/assassin-300.4f940785c7.avif 300w, assets/build/cards/assassin-600.4f940785c7.avif 600w, assets/build/cards/assassin-1200.4f940785c7.avif 1200w", "image/webp": "assets/build/cards/assassin-300.4f940785c7.webp 300w, assets/build/cards/assassin-600.4f940785c7.webp 600w, assets/build/cards/assassin-1200.4f940785c7.webp 1200w"},
+  "cards/blaster.jpg": {"image/avif": "assets/build/cards/blaster-300.ad782240c8.avif 300w, assets/build/cards/blaster-600.ad782240c8.avif 600w, assets/build/cards/blaster-1200.ad782240c8.avif 1200w", "image/webp": "assets/build/cards/blaster-300.ad782240c8.webp 300w, assets/build/cards/blaster-600.ad782240c8.webp 600w, assets/build/cards/blaster-1200.ad782240c8.webp 1200w"},
+  "cards/bounty-hunter.png": {"image/avif": "assets/build/cards/bounty-hunter-300.7486560466.avif 300w, assets/build/cards/bounty-hunter-600.7486560466.avif 600w, assets/build/cards/bounty-hunter-1200.7486560466.avif 1200w", "image/webp": "assets/build/cards/bounty-hunter-300.7486560466.webp 300w, assets/build/cards/bounty-hunter-600.7486560466.webp 600w, assets/build/cards/bounty-hunter-1200.7486560466.webp 1200w"},
+  "cards/burial.png": {"image/avif": "assets/build/cards/burial-300.84940906e3.avif 300w, assets/build/cards/burial-600.84940906e3.avif 600w, assets/build/cards/burial-1135.84940906e3.avif 1135w", "image/webp": "assets/build/cards/burial-300.84940906e3.webp 300w, assets/build/cards/burial-600.84940906e3.webp 600w, assets/build/cards/burial-1135.84940906e3.webp 1135w"},
+  "cards/chiss.png": {"image/avif": "assets/build/cards/chiss-300.602100bdda.avif 300w, assets/build/cards/chiss-600.602100bdda.avif 600w, assets/build/cards/chiss-1200.602100bdda.avif 1200w", "image/webp": "assets/build/cards/chiss-300.602100bdda.webp 300w, assets/build/cards/chiss-600.602100bdda.webp 600w, assets/build/cards/chiss-1200.602100bdda.webp 1200w"},
+  "cards/coruscant-sack.jpg": {"image/avif": "assets/build/cards/coruscant-sack-300.8caccbdc11.avif 300w, assets/build/cards/coruscant-sack-600.8caccbdc11.avif 600w, assets/build/cards/coruscant-sack-1000.8caccbdc11.avif 1000w", "image/webp": "assets/build/cards/coruscant-sack-300.8caccbdc11.webp 300w, assets/build/cards/coruscant-sack-600.8caccbdc11.webp 600w, assets/build/cards/coruscant-sack-1000.8caccbdc11.webp 1000w"},
+  "cards/credits.jpeg": {"image/avif": "assets/build/cards/credits-300.5a2fdf5e3b.avif 300w, assets/build/cards/credits-600.5a2fdf5e3b.avif 600w, assets/build/cards/credits-1200.5a2fdf5e3b.avif 1200w", "image/webp": "assets/build/cards/credits-300.5a2fdf5e3b.webp 300w, assets/build/cards/credits-600.5a2fdf5e3b.webp 600w, assets/build/cards/credits-1200.5a2fdf5e3b.webp 1200w"},
+  "cards/depths.png": {"image/avif": "assets/build/cards/depths-300.39f43a3968.avif 300w, assets/build/cards/depths-600.39f43a3968.avif 600w, assets/build/cards/depths-1200.39f43a3968.avif 1200w", "image/webp": "assets/build/cards/depths-300.39f43a3968.webp 300w, assets/build/cards/depths-600.39f43a3968.webp 600w, assets/build/cards/depths-1200.39f43a3968.webp 1200w"},
+  "cards/documents.webp": {"image/avif": "assets/build/cards/documents-300.cbd7f98a4f.avif 300w, assets/build/cards/documents-600.cbd7f98a4f.avif 600w, assets/build/cards/documents-1000.cbd7f98a4f.avif 1000w", "image/webp": "assets/build/cards/documents-300.cbd7f98a4f.webp 300w, assets/build/cards/documents-600.cbd7f98a4f.webp 600w, assets/build/cards/documents-1000.cbd7f98a4f.webp 1000w"},
+  "cards/double-agent.png": {"image/avif": "assets/build/cards/double-agent-300.4f6c0ef835.avif 300w, assets/build/cards/double-agent-600.4f6c0ef835.avif 600w, assets/build/cards/double-agent-1140.4f6c0ef835.avif 1140w", "image/webp": "assets/build/cards/double-agent-300.4f6c0ef835.webp 300w, assets/build/cards/double-agent-600.4f6c0ef835.webp 600w, assets/build/cards/double-agent-1140.4f6c0ef835.webp 1140w"},
+  "cards/duel.webp": {"image/avif": "assets/build/cards/duel-300.79495063f8.avif 300w, assets/build/cards/duel-600.79495063f8.avif 600w, assets/build/cards/duel-616.79495063f8.avif 616w", "image/webp": "assets/build/cards/duel-300.79495063f8.webp 300w, assets/build/cards/duel-600.79495063f8.webp 600w, assets/build/cards/duel-616.79495063f8.webp 616w"},
+  "cards/gala.jpg": {"image/avif": "assets/build/cards/gala-300.1fe1d2d4c4.avif 300w, assets/build/cards/gala-564.1fe1d2d4c4.avif 564w", "image/webp": "assets/build/cards/gala-300.1fe1d2d4c4.webp 300w, assets/build/cards/gala-564.1fe1d2d4c4.webp 564w"},
+  "cards/genoharadan.png": {"image/avif": "assets/build/cards/genoharadan-300.16d9f30504.avif 300w, assets/build/cards/genoharadan-600.16d9f30504.avif 600w, assets/build/cards/genoharadan-1200.16d9f30504.avif 1200w", "image/webp": "assets/build/cards/genoharadan-300.16d9f30504.webp 300w, assets/build/cards/genoharadan-600.16d9f30504.webp 600w, assets/build/cards/genoharadan-1200.16d9f30504.webp 1200w"},
+  "cards/hideout.webp": {"image/avif": "assets/build/cards/hideout-300.f29d7f2b4b.avif 300w", "image/webp": "assets/build/cards/hideout-300.f29d7f2b4b.webp 300w"},
+  "cards/hutt.webp": {"image/avif": "assets/build/cards/hutt-300.d8bf1a3cf5.avif 300w, assets/build/cards/hutt-600.d8bf1a3cf5.avif 600w, assets/build/cards/hutt-601.d8bf1a3cf5.avif 601w", "image/webp": "assets/build/cards/hutt-300.d8bf1a3cf5.webp 300w, assets/build/cards/hutt-600.d8bf1a3cf5.webp 600w, assets/build/cards/hutt-601.d8bf1a3cf5.webp 601w"},
+  "cards/imperial-agent.png": {"image/avif": "assets/build/cards/imperial-agent-300.5fb3564dbf.avif 300w, assets/build/cards/imperial-agent-600.5fb3564dbf.avif 600w, assets/build/cards/imperial-agent-1000.5fb3564dbf.avif 1000w", "image/webp": "assets/build/cards/imperial-agent-300.5fb3564dbf.webp 300w, assets/build/cards/imperial-agent-600.5fb3564dbf.webp 600w, assets/build/cards/imperial-agent-1000.5fb3564dbf.webp 1000w"},
+  "cards/innocent.png": {"image/avif": "assets/build/cards/innocent-300.93b3b23db6.avif 300w, assets/build/cards/innocent-600.93b3b23db6.avif 600w, assets/build/cards/innocent-970.93b3b23db6.avif 970w", "image/webp": "assets/build/cards/innocent-300.93b3b23db6.webp 300w, assets/build/cards/innocent-600.93b3b23db6.webp 600w, assets/build/cards/innocent-970.93b3b23db6.webp 970w"},
+  "cards/kajidic.jpg": {"image/avif": "assets/build/cards/kajidic-300.4577945a01.avif 300w, assets/build/cards/kajidic-600.4577945a01.avif 600w", "image/webp": "assets/build/cards/kajidic-300.4577945a01.webp 300w, assets/build/cards/kajidic-600.4577945a01.webp 600w"},
+  "cards/lab.webp": {"image/avif": "assets/build/cards/lab-300.d8907753b2.avif 300w, assets/build/cards/lab-600.d8907753b2.avif 600w, assets/build/cards/lab-1000.d8907753b2.avif 1000w", "image/webp": "assets/build/cards/lab-300.d8907753b2.webp 300w, assets/build/cards/lab-600.d8907753b2.webp 600w, assets/build/cards/lab-1000.d8907753b2.webp 1000w"},
+  "cards/madalore.webp": {"image/avif": "assets/build/cards/madalore-300.b8a74ea918.avif 300w, assets/build/cards/madalore-600.b8a74ea918.avif 600w, assets/build/cards/madalore-1000.b8a74ea918.avif 1000w", "image/webp": "assets/build/cards/madalore-300.b8a74ea918.webp 300w, assets/build/cards/madalore-600.b8a74ea918.webp 600w, assets/build/cards/madalore-1000.b8a74ea918.webp 1000w"},
+  "cards/psychic.webp": {"image/avif": "assets/build/cards/psychic-300.5fbebadae5.avif 300w, assets/build/cards/psychic-500.5fbebadae5.avif 500w", "image/webp": "assets/build/cards/psychic-300.5fbebadae5.webp 300w, assets/build/cards/psychic-500.5fbebadae5.webp 500w"},
+  "cards/relic.jpg": {"image/avif": "assets/build/cards/relic-272.cdb4762287.avif 272w", "image/webp": "assets/build/cards/relic-272.cdb4762287.webp 272w"},
+  "cards/revan.png": {"image/avif": "assets/build/cards/revan-300.99545425f3.avif 300w, assets/build/cards/revan-600.99545425f3.avif 600w, assets/build/cards/revan-1200.99545425f3.avif 1200w", "image/webp": "assets/build/cards/revan-300.99545425f3.webp 300w, assets/build/cards/revan-600.99545425f3.webp 600w, assets/build/cards/revan-1200.99545425f3.webp 1200w"},
+  "cards/starcabal.png": {"image/avif": "assets/build/cards/starcabal-300.3393d8040b.avif 300w, assets/build/cards/starcabal-600.3393d8040b.avif 600w, assets/build/cards/starcabal-1200.3393d8040b.avif 1200w", "image/webp": "assets/build/cards/starcabal-300.3393d8040b.webp 300w, assets/build/cards/starcabal-600.3393d8040b.webp 600w, assets/build/cards/starcabal-1200.3393d8040b.webp 1200w"},
+  "cards/starcharts.webp": {"image/avif": "assets/build/cards/starcharts-300.518a0cb27c.avif 300w, assets/build/cards/starcharts-600.518a0cb27c.avif 600w, assets/build/cards/starcharts-779.518a0cb27c.avif 779w", "image/webp": "assets/build/cards/starcharts-300.518a0cb27c.webp 300w, assets/build/cards/starcharts-600.518a0cb27c.webp 600w, assets/build/cards/starcharts-779.518a0cb27c.webp 779w"},
+  "cards/truce.webp": {"image/avif": "assets/build/cards/truce-300.7d247909f8.avif 300w, assets/build/cards/truce-600.7d247909f8.avif 600w", "image/webp": "assets/build/cards/truce-300.7d247909f8.webp 300w, assets/build/cards/truce-600.7d247909f8.webp 600w"},
+  "cards/ulgo.webp": {"image/avif": "assets/build/cards/ulgo-300.f8b93bb539.avif 300w, assets/build/cards/ulgo-600.f8b93bb539.avif 600w, assets/build/cards/ulgo-1080.f8b93bb539.avif 1080w", "image/webp": "assets/build/cards/ulgo-300.f8b93bb539.webp 300w, assets/build/cards/ulgo-600.f8b93bb539.webp 600w, assets/build/cards/ulgo-1080.f8b93bb539.webp 1080w"},
+  "cards/weapons.webp": {"image/avif": "assets/build/cards/weapons-300.e20ed8b66c.avif 300w, assets/build/cards/weapons-600.e20ed8b66c.avif 600w, assets/build/cards/weapons-652.e20ed8b66c.avif 652w", "image/webp": "assets/build/cards/weapons-300.e20ed8b66c.webp 300w, assets/build/cards/weapons-600.e20ed8b66c.webp 600w, assets/build/cards/weapons-652.e20ed8b66c.webp 652w"},
+  "cards/witness.png": {"image/avif": "assets/build/cards/witness-300.079bafe24f.avif 300w, assets/build/cards/witness-325.079bafe24f.avif 325w", "image/webp": "assets/build/cards/witness-300.079bafe24f.webp 300w, assets/build/cards/witness-325.079bafe24f.webp 325w"},
+  "cards/witness.webp": {"image/avif": "assets/build/cards/witness-300.bb541940c1.avif 300w, assets/build/cards/witness-325.bb541940c1.avif 325w", "image/webp": "assets/build/cards/witness-300.bb541940c1.webp 300w, assets/build/cards/witness-325.bb541940c1.webp 325w"},
+  "factions/Czerka.webp": {"image/avif": "assets/build/factions/Czerka-128.6d26905ba4.avif 128w, assets/build/factions/Czerka-256.6d26905ba4.avif 256w, assets/build/factions/Czerka-512.6d26905ba4.avif 512w", "image/webp": "assets/build/factions/Czerka-128.6d26905ba4.webp 128w, assets/build/factions/Czerka-256.6d26905ba4.webp 256w, assets/build/factions/Czerka-512.6d26905ba4.webp 512w"},
+  "factions/Revan.webp": {"image/avif": "assets/build/factions/Revan-128.3427d0ec51.avif 128w, assets/build/factions/Revan-256.3427d0ec51.avif 256w, assets/build/factions/Revan-512.3427d0ec51.avif 512w", "image/webp": "assets/build/factions/Revan-128.3427d0ec51.webp 128w, assets/build/factions/Revan-256.3427d0ec51.webp 256w, assets/build/factions/Revan-512.3427d0ec51.webp 512w"},
+  "factions/Sith.png": {"image/avif": "assets/build/factions/Sith-128.61dbe2546e.avif 128w, assets/build/factions/Sith-256.61dbe2546e.avif 256w, assets/build/factions/Sith-512.61dbe2546e.avif 512w", "image/webp": "assets/build/factions/Sith-128.61dbe2546e.webp 128w, assets/build/factions/Sith-256.61dbe2546e.webp 256w, assets/build/factions/Sith-512.61dbe2546e.webp 512w"},
+  "factions/Thul.webp": {"image/avif": "assets/build/factions/Thul-128.8bac170851.avif 128w, assets/build/factions/Thul-256.8bac170851.avif 256w, assets/build/factions/Thul-512.8bac170851.avif 512w", "image/webp": "assets/build/factions/Thul-128.8bac170851.webp 128w, assets/build/factions/Thul-256.8bac170851.webp 256w, assets/build/factions/Thul-512.8bac170851.webp 512w"},
+  "factions/bountyguild.jpg": {"image/avif": "assets/build/factions/bountyguild-128.2cbee5a5cf.avif 128w, assets/build/factions/bountyguild-256.2cbee5a5cf.avif 256w, assets/build/factions/bountyguild-512.2cbee5a5cf.avif 512w", "image/webp": "assets/build/factions/bountyguild-128.2cbee5a5cf.webp 128w, assets/build/factions/bountyguild-256.2cbee5a5cf.webp 256w, assets/build/factions/bountyguild-512.2cbee5a5cf.webp 512w"},
+  "factions/dread masters.jpg": {"image/avif": "assets/build/factions/dread%20masters-128.f9d188e2ab.avif 128w, assets/build/factions/dread%20masters-256.f9d188e2ab.avif 256w, assets/build/factions/dread%20masters-512.f9d188e2ab.avif 512w", "image/webp": "assets/build/factions/dread%20masters-128.f9d188e2ab.webp 128w, assets/build/factions/dread%20masters-256.f9d188e2ab.webp 256w, assets/build/factions/dread%20masters-512.f9d188e2ab.webp 512w"},
+  "factions/genoharadan.png": {"image/avif": "assets/build/factions/genoharadan-128.129cc129f8.avif 128w, assets/build/factions/genoharadan-256.129cc129f8.avif 256w, assets/build/factions/genoharadan-512.129cc129f8.avif 512w", "image/webp": "assets/build/factions/genoharadan-128.129cc129f8.webp 128w, assets/build/factions/genoharadan-256.129cc129f8.webp 256w, assets/build/factions/genoharadan-512.129cc129f8.webp 512w"},
+  "factions/imperial_intel.jpg": {"image/avif": "assets/build/factions/imperial_intel-128.2fd5863dc8.avif 128w, assets/build/factions/imperial_intel-256.2fd5863dc8.avif 256w, assets/build/factions/imperial_intel-512.2fd5863dc8.avif 512w", "image/webp": "assets/build/factions/imperial_intel-128.2fd5863dc8.webp 128w, assets/build/factions/imperial_intel-256.2fd5863dc8.webp 256w, assets/build/factions/imperial_intel-512.2fd5863dc8.webp 512w"},
+  "factions/mandal.jpg": {"image/avif": "assets/build/factions/mandal-128.e5d320d8ad.avif 128w, assets/build/factions/mandal-256.e5d320d8ad.avif 256w, assets/build/factions/mandal-512.e5d320d8ad.avif 512w", "image/webp": "assets/build/factions/mandal-128.e5d320d8ad.webp 128w, assets/build/factions/mandal-256.e5d320d8ad.webp 256w, assets/build/factions/mandal-512.e5d320d8ad.webp 512w"},
+  "factions/organa.jpg": {"image/avif": "assets/build/factions/organa-128.458f115d1d.avif 128w, assets/build/factions/organa-256.458f115d1d.avif 256w, assets/build/factions/organa-512.458f115d1d.avif 512w", "image/webp": "assets/build/factions/organa-128.458f115d1d.webp 128w, assets/build/factions/organa-256.458f115d1d.webp 256w, assets/build/factions/organa-512.458f115d1d.webp 512w"},
+  "factions/starcabal.png": {"image/avif": "assets/build/factions/starcabal-128.3393d8040b.avif 128w, assets/build/factions/starcabal-256.3393d8040b.avif 256w, assets/build/factions/starcabal-512.3393d8040b.avif 512w", "image/webp": "assets/build/factions/starcabal-128.3393d8040b.webp 128w, assets/build/factions/starcabal-256.3393d8040b.webp 256w, assets/build/factions/starcabal-512.3393d8040b.webp 512w"},
+  "factions/ulgo.webp": {"image/avif": "assets/build/factions/ulgo-128.dc524a3a60.avif 128w, assets/build/factions/ulgo-204.dc524a3a60.avif 204w", "image/webp": "assets/build/factions/ulgo-128.dc524a3a60.webp 128w, assets/build/factions/ulgo-204.dc524a3a60.webp 204w"},
+  "locations/ambiance/Alderaan.webp": {"image/avif": "assets/build/locations/ambiance/Alderaan-640.1fdeb0b5cf.avif 640w, assets/build/locations/ambiance/Alderaan-1000.1fdeb0b5cf.avif 1000w", "image/webp": "assets/build/locations/ambiance/Alderaan-640.1fdeb0b5cf.webp 640w, assets/build/locations/ambiance/Alderaan-1000.1fdeb0b5cf.webp 1000w"},
+  "locations/ambiance/Balmorra.webp": {"image/avif": "assets/build/locations/ambiance/Balmorra-640.d736d11df2.avif 640w, assets/build/locations/ambiance/Balmorra-1000.d736d11df2.avif 1000w", "image/webp": "assets/build/locations/ambiance/Balmorra-640.d736d11df2.webp 640w, assets/build/locations/ambiance/Balmorra-1000.d736d11df2.webp 1000w"},
+  "locations/ambiance/Belsavis.webp": {"image/avif": "assets/build/locations/ambiance/Belsavis-640.6760116d1f.avif 640w, assets/build/locations/ambiance/Belsavis-1000.6760116d1f.avif 1000w", "image/webp": "assets/build/locations/ambiance/Belsavis-640.6760116d1f.webp 640w, assets/build/locations/ambiance/Belsavis-1000.6760116d1f.webp 1000w"},
+  "locations/ambiance/CarrickStation.webp": {"image/avif": "assets/build/locations/ambiance/CarrickStation-640.31a4b9f2d1.avif 640w, assets/build/locations/ambiance/CarrickStation-1080.31a4b9f2d1.avif 1080w", "image/webp": "assets/build/locations/ambiance/CarrickStation-640.31a4b9f2d1.webp 640w, assets/build/locations/ambiance/CarrickStation-1080.31a4b9f2d1.webp 1080w"},
+  "locations/ambiance/Corellia.webp": {"image/avif": "assets/build/locations/ambiance/Corellia-640.b45637d9c8.avif 640w, assets/build/locations/ambiance/Corellia-1000.b45637d9c8.avif 1000w", "image/webp": "assets/build/locations/ambiance/Corellia-640.b45637d9c8.webp 640w, assets/build/locations/ambiance/Corellia-1000.b45637d9c8.webp 1000w"},
+  "locations/ambiance/Coruscant.webp": {"image/avif": "assets/build/locations/ambiance/Coruscant-640.a33d6531f7.avif 640w, assets/build/locations/ambiance/Coruscant-1000.a33d6531f7.avif 1000w", "image/webp": "assets/build/locations/ambiance/Coruscant-640.a33d6531f7.webp 640w, assets/build/locations/ambiance/Coruscant-1000.a33d6531f7.webp 1000w"},
+  "locations/ambiance/Hoth.webp": {"image/avif": "assets/build/locations/ambiance/Hoth-640.04fb3f8064.avif 640w, assets/build/locations/ambiance/Hoth-1000.04fb3f8064.avif 1000w", "image/webp": "assets/build/locations/ambiance/Hoth-640.04fb3f8064.webp 640w, assets/build/locations/ambiance/Hoth-1000.04fb3f8064.webp 1000w"},
+  "locations/ambiance/Ilum.webp": {"image/avif": "assets/build/locations/ambiance/Ilum-640.24c34b5193.avif 640w, assets/build/locations/ambiance/Ilum-1000.24c34b5193.avif 1000w", "image/webp": "assets/build/locations/ambiance/Ilum-640.24c34b5193.webp 640w, assets/build/locations/ambiance/Ilum-1000.24c34b5193.webp 1000w"},
+  "locations/ambiance/Kashyyyk.jpg": {"image/avif": "assets/build/locations/ambiance/Kashyyyk-640.4213c00409.avif 640w, assets/build/locations/ambiance/Kashyyyk-672.4213c00409.avif 672w", "image/webp": "assets/build/locations/ambiance/Kashyyyk-640.4213c00409.webp 640w, assets/build/locations/ambiance/Kashyyyk-672.4213c00409.webp 672w"},
+  "locations/ambiance/Mustafar.png": {"image/avif": "assets/build/locations/ambiance/Mustafar-640.9ab77d8db7.avif 640w, assets/build/locations/ambiance/Mustafar-941.9ab77d8db7.avif 941w", "image/webp": "assets/build/locations/ambiance/Mustafar-640.9ab77d8db7.webp 640w, assets/build/locations/ambiance/Mustafar-941.9ab77d8db7.webp 941w"},
+  "locations/ambiance/NarShaddaa.png": {"image/avif": "assets/build/locations/ambiance/NarShaddaa-640.3b1f063118.avif 640w, assets/build/locations/ambiance/NarShaddaa-672.3b1f063118.avif 672w", "image/webp": "assets/build/locations/ambiance/NarShaddaa-640.3b1f063118.webp 640w, assets/build/locations/ambiance/NarShaddaa-672.3b1f063118.webp 672w"},
+  "locations/ambiance/Quesh.webp": {"image/avif": "assets/build/locations/ambiance/Quesh-640.f6387a4724.avif 640w, assets/build/locations/ambiance/Quesh-1000.f6387a4724.avif 1000w", "image/webp": "assets/build/locations/ambiance/Quesh-640.f6387a4724.webp 640w, assets/build/locations/ambiance/Quesh-1000.f6387a4724.webp 1000w"},
+  "locations/ambiance/Taris.webp": {"image/avif": "assets/build/locations/ambiance/Taris-640.d9e916155f.avif 640w, assets/build/locations/ambiance/Taris-1000.d9e916155f.avif 1000w", "image/webp": "assets/build/locations/ambiance/Taris-640.d9e916155f.webp 640w, assets/build/locations/ambiance/Taris-1000.d9e916155f.webp 1000w"},
+  "locations/ambiance/Tatooine.webp": {"image/avif": "assets/build/locations/ambiance/Tatooine-640.78e7321ba5.avif 640w, assets/build/locations/ambiance/Tatooine-1000.78e7321ba5.avif 1000w", "image/webp": "assets/build/locations/ambiance/Tatooine-640.78e7321ba5.webp 640w, assets/build/locations/ambiance/Tatooine-1000.78e7321ba5.webp 1000w"},
+  "locations/ambiance/VaikenSpacedock.jpg": {"image/avif": "assets/build/locations/ambiance/VaikenSpacedock-640.6e2c4b4149.avif 640w, assets/build/locations/ambiance/VaikenSpacedock-700.6e2c4b4149.avif 700w", "image/webp": "assets/build/locations/ambiance/VaikenSpacedock-640.6e2c4b4149.webp 640w, assets/build/locations/ambiance/VaikenSpacedock-700.6e2c4b4149.webp 700w"},
+  "locations/ambiance/Voss.webp": {"image/avif": "assets/build/locations/ambiance/Voss-640.3017578b44.avif 640w, assets/build/locations/ambiance/Voss-1000.3017578b44.avif 1000w", "image/webp": "assets/build/locations/ambiance/Voss-640.3017578b44.webp 640w, assets/build/locations/ambiance/Voss-1000.3017578b44.webp 1000w"},
+  "locations/planets/Alderaan.webp": {"image/avif": "assets/build/locations/planets/Alderaan-400.d00b2276f3.avif 400w, assets/build/locations/planets/Alderaan-560.d00b2276f3.avif 560w", "image/webp": "assets/build/locations/planets/Alderaan-400.d00b2276f3.webp 400w, assets/build/locations/planets/Alderaan-560.d00b2276f3.webp 560w"},
+  "locations/planets/Balmorra.webp": {"image/avif": "assets/build/locations/planets/Balmorra-400.4331048885.avif 400w, assets/build/locations/planets/Balmorra-475.4331048885.avif 475w", "image/webp": "assets/build/locations/planets/Balmorra-400.4331048885.webp 400w, assets/build/locations/planets/Balmorra-475.4331048885.webp 475w"},
+  "locations/planets/Belsavis.webp": {"image/avif": "assets/build/locations/planets/Belsavis-400.52d6fa713a.avif 400w, assets/build/locations/planets/Belsavis-469.52d6fa713a.avif 469w", "image/webp": "assets/build/locations/planets/Belsavis-400.52d6fa713a.webp 400w, assets/build/locations/planets/Belsavis-469.52d6fa713a.webp 469w"},
+  "locations/planets/CarrickStation.webp": {"image/avif": "assets/build/locations/planets/CarrickStation-400.8bda8c5752.avif 400w, assets/build/locations/planets/CarrickStation-636.8bda8c5752.avif 636w", "image/webp": "assets/build/locations/planets/CarrickStation-400.8bda8c5752.webp 400w, assets/build/locations/planets/CarrickStation-636.8bda8c5752.webp 636w"},
+  "locations/planets/Corellia.webp": {"image/avif": "assets/build/locations/planets/Corellia-400.54a277b135.avif 400w, assets/build/locations/planets/Corellia-800.54a277b135.avif 800w", "image/webp": "assets/build/locations/planets/Corellia-400.54a277b135.webp 400w, assets/build/locations/planets/Corellia-800.54a277b135.webp 800w"},
+  "locations/planets/Coruscant.webp": {"image/avif": "assets/build/locations/planets/Coruscant-400.9c2de4a891.avif 400w, assets/build/locations/planets/Coruscant-800.9c2de4a891.avif 800w", "image/webp": "assets/build/locations/planets/Coruscant-400.9c2de4a891.webp 400w, assets/build/locations/planets/Coruscant-800.9c2de4a891.webp 800w"},
+  "locations/planets/Hoth.webp": {"image/avif": "assets/build/locations/planets/Hoth-400.18a9fe3c61.avif 400w, assets/build/locations/planets/Hoth-700.18a9fe3c61.avif 700w", "image/webp": "assets/build/locations/planets/Hoth-400.18a9fe3c61.webp 400w, assets/build/locations/planets/Hoth-700.18a9fe3c61.webp 700w"},
+  "locations/planets/Ilum.webp": {"image/avif": "assets/build/locations/planets/Ilum-400.07ea18015f.avif 400w, assets/build/locations/planets/Ilum-735.07ea18015f.avif 735w", "image/webp": "assets/build/locations/planets/Ilum-400.07ea18015f.webp 400w, assets/build/locations/planets/Ilum-735.07ea18015f.webp 735w"},
+  "locations/planets/Kashyyyk.webp": {"image/avif": "assets/build/locations/planets/Kashyyyk-400.8128737542.avif 400w, assets/build/locations/planets/Kashyyyk-700.8128737542.avif 700w", "image/webp": "assets/build/locations/planets/Kashyyyk-400.8128737542.webp 400w, assets/build/locations/planets/Kashyyyk-700.8128737542.webp 700w"},
+  "locations/planets/Mustafar.webp": {"image/avif": "assets/build/locations/planets/Mustafar-400.ed3298917c.avif 400w, assets/build/locations/planets/Mustafar-800.ed3298917c.avif 800w, assets/build/locations/planets/Mustafar-1000.ed3298917c.avif 1000w", "image/webp": "assets/build/locations/planets/Mustafar-400.ed3298917c.webp 400w, assets/build/locations/planets/Mustafar-800.ed3298917c.webp 800w, assets/build/locations/planets/Mustafar-1000.ed3298917c.webp 1000w"},
+  "locations/planets/NarShaddaa.webp": {"image/avif": "assets/build/locations/planets/NarShaddaa-400.e84c6cccea.avif 400w, assets/build/locations/planets/NarShaddaa-800.e84c6cccea.avif 800w, assets/build/locations/planets/NarShaddaa-1000.e84c6cccea.avif 1000w", "image/webp": "assets/build/locations/planets/NarShaddaa-400.e84c6cccea.webp 400w, assets/build/locations/planets/NarShaddaa-800.e84c6cccea.webp 800w, assets/build/locations/planets/NarShaddaa-1000.e84c6cccea.webp 1000w"},
+  "locations/planets/Quesh.webp": {"image/avif": "assets/build/locations/planets/Quesh-400.f88180feab.avif 400w, assets/build/locations/planets/Quesh-500.f88180feab.avif 500w", "image/webp": "assets/build/locations/planets/Quesh-400.f88180feab.webp 400w, assets/build/locations/planets/Quesh-500.f88180feab.webp 500w"},
+  "locations/planets/Taris.webp": {"image/avif": "assets/build/locations/planets/Taris-400.8202b0e952.avif 400w, assets/build/locations/planets/Taris-800.8202b0e952.avif 800w, assets/build/locations/planets/Taris-1000.8202b0e952.avif 1000w", "image/webp": "assets/build/locations/planets/Taris-400.8202b0e952.webp 400w, assets/build/locations/planets/Taris-800.8202b0e952.webp 800w, assets/build/locations/planets/Taris-1000.8202b0e952.webp 1000w"},
+  "locations/planets/Tatooine.webp": {"image/avif": "assets/build/locations/planets/Tatooine-400.b724359682.avif 400w, assets/build/locations/planets/Tatooine-800.b724359682.avif 800w", "image/webp": "assets/build/locations/planets/Tatooine-400.b724359682.webp 400w, assets/build/locations/planets/Tatooine-800.b724359682.webp 800w"},
+  "locations/planets/VaikenSpacedock.webp": {"image/avif": "assets/build/locations/planets/VaikenSpacedock-400.ac5831ea12.avif 400w, assets/build/locations/planets/VaikenSpacedock-601.ac5831ea12.avif 601w", "image/webp": "assets/build/locations/planets/VaikenSpacedock-400.ac5831ea12.webp 400w, assets/build/locations/planets/VaikenSpacedock-601.ac5831ea12.webp 601w"},
+  "locations/planets/Voss.webp": {"image/avif": "assets/build/locations/planets/Voss-400.fcb9c2eb80.avif 400w, assets/build/locations/planets/Voss-500.fcb9c2eb80.avif 500w", "image/webp": "assets/build/locations/planets/Voss-400.fcb9c2eb80.webp 400w, assets/build/locations/planets/Voss-500.fcb9c2eb80.webp 500w"},
+  "species/anzat.webp": {"image/avif": "assets/build/species/anzat-200.02c9bb2845.avif 200w, assets/build/species/anzat-400.02c9bb2845.avif 400w, assets/build/species/anzat-800.02c9bb2845.avif 800w", "image/webp": "assets/build/species/anzat-200.02c9bb2845.webp 200w, assets/build/species/anzat-400.02c9bb2845.webp 400w, assets/build/species/anzat-800.02c9bb2845.webp 800w"},
+  "species/arkanian.webp": {"image/avif": "assets/build/species/arkanian-200.f615bf8d83.avif 200w, assets/build/species/arkanian-400.f615bf8d83.avif 400w, assets/build/species/arkanian-555.f615bf8d83.avif 555w", "image/webp": "assets/build/species/arkanian-200.f615bf8d83.webp 200w, assets/build/species/arkanian-400.f615bf8d83.webp 400w, assets/build/species/arkanian-555.f615bf8d83.webp 555w"},
+  "species/bith.webp": {"image/avif": "assets/build/species/bith-200.590db0be98.avif 200w, assets/build/species/bith-400.590db0be98.avif 400w, assets/build/species/bith-800.590db0be98.avif 800w", "image/webp": "assets/build/species/bith-200.590db0be98.webp 200w, assets/build/species/bith-400.590db0be98.webp 400w, assets/build/species/bith-800.590db0be98.webp 800w"},
+  "species/bothan.webp": {"image/avif": "assets/build/species/bothan-200.5341acb587.avif 200w, assets/build/species/bothan-344.5341acb587.avif 344w", "image/webp": "assets/build/species/bothan-200.5341acb587.webp 200w, assets/build/species/bothan-344.5341acb587.webp 344w"},
+  "species/cathar.png": {"image/avif": "assets/build/species/cathar-200.545b769d07.avif 200w, assets/build/species/cathar-400.545b769d07.avif 400w, assets/build/species/cathar-439.545b769d07.avif 439w", "image/webp": "assets/build/species/cathar-200.545b769d07.webp 200w, assets/build/species/cathar-400.545b769d07.webp 400w, assets/build/species/cathar-439.545b769d07.webp 439w"},
+  "species/cerean.webp": {"image/avif": "assets/build/species/cerean-200.b8c2acd057.avif 200w, assets/build/species/cerean-400.b8c2acd057.avif 400w, assets/build/species/cerean-800.b8c2acd057.avif 800w", "image/webp": "assets/build/species/cerean-200.b8c2acd057.webp 200w, assets/build/species/cerean-400.b8c2acd057.webp 400w, assets/build/species/cerean-800.b8c2acd057.webp 800w"},
+  "species/chiss.jpg": {"image/avif": "assets/build/species/chiss-200.85454b8a55.avif 200w, assets/build/species/chiss-400.85454b8a55.avif 400w, assets/build/species/chiss-800.85454b8a55.avif 800w", "image/webp": "assets/build/species/chiss-200.85454b8a55.webp 200w, assets/build/species/chiss-400.85454b8a55.webp 400w, assets/build/species/chiss-800.85454b8a55.webp 800w"},
+  "species/devaronian.webp": {"image/avif": "assets/build/species/devaronian-200.bddf0feb82.avif 200w, assets/build/species/devaronian-400.bddf0feb82.avif 400w, assets/build/species/devaronian-450.bddf0feb82.avif 450w", "image/webp": "assets/build/species/devaronian-200.bddf0feb82.webp 200w, assets/build/species/devaronian-400.bddf0feb82.webp 400w, assets/build/species/devaronian-450.bddf0feb82.webp 450w"},
+  "species/duros.png": {"image/avif": "assets/build/species/duros-200.37773cab25.avif 200w, assets/build/species/duros-250.37773cab25.avif 250w", "image/webp": "assets/build/species/duros-200.37773cab25.webp 200w, assets/build/species/duros-250.37773cab25.webp 250w"},
+  "species/ewok.png": {"image/avif": "assets/build/species/ewok-200.e4fa1d01a5.avif 200w, assets/build/species/ewok-400.e4fa1d01a5.avif 400w, assets/build/species/ewok-620.e4fa1d01a5.avif 620w", "image/webp": "assets/build/species/ewok-200.e4fa1d01a5.webp 200w, assets/build/species/ewok-400.e4fa1d01a5.webp 400w, assets/build/species/ewok-620.e4fa1d01a5.webp 620w"},
+  "species/falleen.webp": {"image/avif": "assets/build/species/falleen-200.498efbbed7.avif 200w, assets/build/species/falleen-400.498efbbed7.avif 400w, assets/build/species/falleen-722.498efbbed7.avif 722w", "image/webp": "assets/build/species/falleen-200.498efbbed7.webp 200w, assets/build/species/falleen-400.498efbbed7.webp 400w, assets/build/species/falleen-722.498efbbed7.webp 722w"},
+  "species/gamorrean.webp": {"image/avif": "assets/build/species/gamorrean-200.67555ae65a.avif 200w, assets/build/species/gamorrean-400.67555ae65a.avif 400w, assets/build/species/gamorrean-800.67555ae65a.avif 800w", "image/webp": "assets/build/species/gamorrean-200.67555ae65a.webp 200w, assets/build/species/gamorrean-400.67555ae65a.webp 400w, assets/build/species/gamorrean-800.67555ae65a.webp 800w"},
+  "species/gand.jpg": {"image/avif": "assets/build/species/gand-200.11e14669ea.avif 200w, assets/build/species/gand-400.11e14669ea.avif 400w, assets/build/species/gand-500.11e14669ea.avif 500w", "image/webp": "assets/build/species/gand-200.11e14669ea.webp 200w, assets/build/species/gand-400.11e14669ea.webp 400w, assets/build/species/gand-500.11e14669ea.webp 500w"},
+  "species/gran.webp": {"image/avif": "assets/build/species/gran-200.07061fb558.avif 200w, assets/build/species/gran-400.07061fb558.avif 400w, assets/build/species/gran-795.07061fb558.avif 795w", "image/webp": "assets/build/species/gran-200.07061fb558.webp 200w, assets/build/species/gran-400.07061fb558.webp 400w, assets/build/species/gran-795.07061fb558.webp 795w"},
+  "species/gungan.webp": {"image/avif": "assets/build/species/gungan-200.6a9232cefe.avif 200w, assets/build/species/gungan-400.6a9232cefe.avif 400w, assets/build/species/gungan-800.6a9232cefe.avif 800w", "image/webp": "assets/build/species/gungan-200.6a9232cefe.webp 200w, assets/build/species/gungan-400.6a9232cefe.webp 400w, assets/build/species/gungan-800.6a9232cefe.webp 800w"},
+  "species/humain.png": {"image/avif": "assets/build/species/humain-200.011fcc831d.avif 200w, assets/build/species/humain-400.011fcc831d.avif 400w, assets/build/species/humain-800.011fcc831d.avif 800w", "image/webp": "assets/build/species/humain-200.011fcc831d.webp 200w, assets/build/species/humain-400.011fcc831d.webp 400w, assets/build/species/humain-800.011fcc831d.webp 800w"},
+  "species/hutt.png": {"image/avif": "assets/build/species/hutt-200.be3e3b4aa9.avif 200w, assets/build/species/hutt-400.be3e3b4aa9.avif 400w, assets/build/species/hutt-800.be3e3b4aa9.avif 800w", "image/webp": "assets/build/species/hutt-200.be3e3b4aa9.webp 200w, assets/build/species/hutt-400.be3e3b4aa9.webp 400w, assets/build/species/hutt-800.be3e3b4aa9.webp 800w"},
+  "species/iktotchi.webp": {"image/avif": "assets/build/species/iktotchi-200.c349e8c47c.avif 200w, assets/build/species/iktotchi-400.c349e8c47c.avif 400w, assets/build/species/iktotchi-500.c349e8c47c.avif 500w", "image/webp": "assets/build/species/iktotchi-200.c349e8c47c.webp 200w, assets/build/species/iktotchi-400.c349e8c47c.webp 400w, assets/build/species/iktotchi-500.c349e8c47c.webp 500w"},
+  "species/ithorian.webp": {"image/avif": "assets/build/species/ithorian-200.02db1aaeaa.avif 200w, assets/build/species/ithorian-400.02db1aaeaa.avif 400w, assets/build/species/ithorian-800.02db1aaeaa.avif 800w", "image/webp": "assets/build/species/ithorian-200.02db1aaeaa.webp 200w, assets/build/species/ithorian-400.02db1aaeaa.webp 400w, assets/build/species/ithorian-800.02db1aaeaa.webp 800w"},
+  "species/jawa.webp": {"image/avif": "assets/build/species/jawa-200.8c62482841.avif 200w, assets/build/species/jawa-400.8c62482841.avif 400w, assets/build/species/jawa-800.8c62482841.avif 800w", "image/webp": "assets/build/species/jawa-200.8c62482841.webp 200w, assets/build/species/jawa-400.8c62482841.webp 400w, assets/build/species/jawa-800.8c62482841.webp 800w"},
+  "species/kaleesh.webp": {"image/avif": "assets/build/species/kaleesh-200.d8cd7ce45f.avif 200w, assets/build/species/kaleesh-400.d8cd7ce45f.avif 400w, assets/build/species/kaleesh-800.d8cd7ce45f.avif 800w", "image/webp": "assets/build/species/kaleesh-200.d8cd7ce45f.webp 200w, assets/build/species/kaleesh-400.d8cd7ce45f.webp 400w, assets/build/species/kaleesh-800.d8cd7ce45f.webp 800w"},
+  "species/keldor.webp": {"image/avif": "assets/build/species/keldor-200.d3df594ab8.avif 200w, assets/build/species/keldor-400.d3df594ab8.avif 400w, assets/build/species/keldor-800.d3df594ab8.avif 800w", "image/webp": "assets/build/species/keldor-200.d3df594ab8.webp 200w, assets/build/species/keldor-400.d3df594ab8.webp 400w, assets/build/species/keldor-800.d3df594ab8.webp 800w"},
+  "species/miraluka.webp": {"image/avif": "assets/build/species/miraluka-200.b7fea7d92b.avif 200w, assets/build/species/miraluka-400.b7fea7d92b.avif 400w, assets/build/species/miraluka-515.b7fea7d92b.avif 515w", "image/webp": "assets/build/species/miraluka-200.b7fea7d92b.webp 200w, assets/build/species/miraluka-400.b7fea7d92b.webp 400w, assets/build/species/miraluka-515.b7fea7d92b.webp 515w"},
+  "species/mirialan.webp": {"image/avif": "assets/build/species/mirialan-200.54daa7f8f8.avif 200w, assets/build/species/mirialan-350.54daa7f8f8.avif 350w", "image/webp": "assets/build/species/mirialan-200.54daa7f8f8.webp 200w, assets/build/species/mirialan-350.54daa7f8f8.webp 350w"},
+  "species/mon_calamari.webp": {"image/avif": "assets/build/species/mon_calamari-200.782cdd46ef.avif 200w, assets/build/species/mon_calamari-400.782cdd46ef.avif 400w, assets/build/species/mon_calamari-471.782cdd46ef.avif 471w", "image/webp": "assets/build/species/mon_calamari-200.782cdd46ef.webp 200w, assets/build/species/mon_calamari-400.782cdd46ef.webp 400w, assets/build/species/mon_calamari-471.782cdd46ef.webp 471w"},
+  "species/nautolan.webp": {"image/avif": "assets/build/species/nautolan-200.9e07616c28.avif 200w, assets/build/species/nautolan-400.9e07616c28.avif 400w, assets/build/species/nautolan-800.9e07616c28.avif 800w", "image/webp": "assets/build/species/nautolan-200.9e07616c28.webp 200w, assets/build/species/nautolan-400.9e07616c28.webp 400w, assets/build/species/nautolan-800.9e07616c28.webp 800w"},
+  "species/nikto.jpg": {"image/avif": "assets/build/species/nikto-200.3f3fb89c68.avif 200w, assets/build/species/nikto-400.3f3fb89c68.avif 400w, assets/build/species/nikto-800.3f3fb89c68.avif 800w", "image/webp": "assets/build/species/nikto-200.3f3fb89c68.webp 200w, assets/build/species/nikto-400.3f3fb89c68.webp 400w, assets/build/species/nikto-800.3f3fb89c68.webp 800w"},
+  "species/pureblood_massassi.webp": {"image/avif": "assets/build/species/pureblood_massassi-200.a00668681a.avif 200w, assets/build/species/pureblood_massassi-400.a00668681a.avif 400w, assets/build/species/pureblood_massassi-537.a00668681a.avif 537w", "image/webp": "assets/build/species/pureblood_massassi-200.a00668681a.webp 200w, assets/build/species/pureblood_massassi-400.a00668681a.webp 400w, assets/build/species/pureblood_massassi-537.a00668681a.webp 537w"},
+  "species/quarren.png": {"image/avif": "assets/build/species/quarren-200.fd1ada88b3.avif 200w, assets/build/species/quarren-400.fd1ada88b3.avif 400w, assets/build/species/quarren-800.fd1ada88b3.avif 800w", "image/webp": "assets/build/species/quarren-200.fd1ada88b3.webp 200w, assets/build/species/quarren-400.fd1ada88b3.webp 400w, assets/build/species/quarren-800.fd1ada88b3.webp 800w"},
+  "species/rakata.webp": {"image/avif": "assets/build/species/rakata-200.32240e48e4.avif 200w, assets/build/species/rakata-400.32240e48e4.avif 400w, assets/build/species/rakata-448.32240e48e4.avif 448w", "image/webp": "assets/build/species/rakata-200.32240e48e4.webp 200w, assets/build/species/rakata-400.32240e48e4.webp 400w, assets/build/species/rakata-448.32240e48e4.webp 448w"},
+  "species/rattataki.png": {"image/avif": "assets/build/species/rattataki-200.86c5a13e4b.avif 200w, assets/build/species/rattataki-400.86c5a13e4b.avif 400w, assets/build/species/rattataki-670.86c5a13e4b.avif 670w", "image/webp": "assets/build/species/rattataki-200.86c5a13e4b.webp 200w, assets/build/species/rattataki-400.86c5a13e4b.webp 400w, assets/build/species/rattataki-670.86c5a13e4b.webp 670w"},
+  "species/rodian.webp": {"image/avif": "assets/build/species/rodian-200.6f1ddfb3cb.avif 200w, assets/build/species/rodian-400.6f1ddfb3cb.avif 400w, assets/build/species/rodian-800.6f1ddfb3cb.avif 800w", "image/webp": "assets/build/species/rodian-200.6f1ddfb3cb.webp 200w, assets/build/species/rodian-400.6f1ddfb3cb.webp 400w, assets/build/species/rodian-800.6f1ddfb3cb.webp 800w"},
+  "species/selkath.png": {"image/avif": "assets/build/species/selkath-200.a90bec33cc.avif 200w, assets/build/species/selkath-400.a90bec33cc.avif 400w, assets/build/species/selkath-800.a90bec33cc.avif 800w", "image/webp": "assets/build/species/selkath-200.a90bec33cc.webp 200w, assets/build/species/selkath-400.a90bec33cc.webp 400w, assets/build/species/selkath-800.a90bec33cc.webp 800w"},
+  "species/sullustan.jpg": {"image/avif": "assets/build/species/sullustan-200.e367ce5422.avif 200w, assets/build/species/sullustan-252.e367ce5422.avif 252w", "image/webp": "assets/build/species/sullustan-200.e367ce5422.webp 200w, assets/build/species/sullustan-252.e367ce5422.webp 252w"},
+  "species/togruta.jpg": {"image/avif": "assets/build/species/togruta-200.0b3b2ff2db.avif 200w, assets/build/species/togruta-400.0b3b2ff2db.avif 400w, assets/build/species/togruta-800.0b3b2ff2db.avif 800w", "image/webp": "assets/build/species/togruta-200.0b3b2ff2db.webp 200w, assets/build/species/togruta-400.0b3b2ff2db.webp 400w, assets/build/species/togruta-800.0b3b2ff2db.webp 800w"},
+  "species/trandoshan.webp": {"image/avif": "assets/build/species/trandoshan-200.579a6a15be.avif 200w, assets/build/species/trandoshan-400.579a6a15be.avif 400w, assets/build/species/trandoshan-561.579a6a15be.avif 561w", "image/webp": "assets/build/species/trandoshan-200.579a6a15be.webp 200w, assets/build/species/trandoshan-400.579a6a15be.webp 400w, assets/build/species/trandoshan-561.579a6a15be.webp 561w"},
+  "species/twilek.png": {"image/avif": "assets/build/species/twilek-200.d23de77eca.avif 200w, assets/build/species/twilek-400.d23de77eca.avif 400w, assets/build/species/twilek-800.d23de77eca.avif 800w", "image/webp": "assets/build/species/twilek-200.d23de77eca.webp 200w, assets/build/species/twilek-400.d23de77eca.webp 400w, assets/build/species/twilek-800.d23de77eca.webp 800w"},
+  "species/weequay.webp": {"image/avif": "assets/build/species/weequay-200.252469da32.avif 200w, assets/build/species/weequay-400.252469da32.avif 400w, assets/build/species/weequay-800.252469da32.avif 800w", "image/webp": "assets/build/species/weequay-200.252469da32.webp 200w, assets/build/species/weequay-400.252469da32.webp 400w, assets/build/species/weequay-800.252469da32.webp 800w"},
+  "species/wookiee.jpg": {"image/avif": "assets/build/species/wookiee-200.c1576cc24f.avif 200w, assets/build/species/wookiee-400.c1576cc24f.avif 400w, assets/build/species/wookiee-800.c1576cc24f.avif 800w", "image/webp": "assets/build/species/wookiee-200.c1576cc24f.webp 200w, assets/build/species/wookiee-400.c1576cc24f.webp 400w, assets/build/species/wookiee-800.c1576cc24f.webp 800w"},
+  "species/zabrak.png": {"image/avif": "assets/build/species/zabrak-200.fe5ab55c9f.avif 200w, assets/build/species/zabrak-400.fe5ab55c9f.avif 400w, assets/build/species/zabrak-533.fe5ab55c9f.avif 533w", "image/webp": "assets/build/species/zabrak-200.fe5ab55c9f.webp 200w, assets/build/species/zabrak-400.fe5ab55c9f.webp 400w, assets/build/species/zabrak-533.fe5ab55c9f.webp 533w"},
+  "species/zeltron.jpg": {"image/avif": "assets/build/species/zeltron-200.be32e49171.avif 200w, assets/build/species/zeltron-360.be32e49171.avif 360w", "image/webp": "assets/build/species/zeltron-200.be32e49171.webp 200w, assets/build/species/zeltron-360.be32e49171.webp 360w"},
+};
@@ -0,0 +1,2 @@
+// Generated by scripts/build_sprites.py, do not edit
+const SPRITES = {"species": ["humain", "twilek", "zabrak", "miraluka", "chiss", "rattataki", "cathar", "duros", "sullustan", "bothan", "zeltron", "falleen", "wookiee", "trandoshan", "keldor", "togruta", "nautolan", "mirialan", "rodian", "devaronian", "arkanian", "weequay", "gamorrean", "ithorian", "selkath", "pureblood_massassi", "anzat", "cerean", "ewok", "gand", "gungan", "hutt", "iktotchi", "jawa", "kaleesh", "mon_calamari", "nikto", "quarren", "gran", "bith", "rakata"], "factions": ["imperial_intel", "czerka", "bountyguild", "mandal", "organa", "thul", "ulgo", "sith", "revanites", "starcabal", "genoharadan", "dreadmasters"], "cards": ["burned-sis-safehouse", "dead-drop-network", "false-flag-shipment", "extracted-defector", "you-were-turned", "keepers-cleanup", "hutt-debt-blood", "exchange-audit", "blacksun-protection", "hutt-exchange-truce", "live-capture-contract", "refused-hutt-contract", "genoharadan-invitation", "czerka-lab-evac", "whistleblown-safety", "prototype-weapons-offledger", "organa-protected", "thul-payroll", "ulgo-line-held", "alderaan-summit-courier", "fought-beside-mandos", "refused-mando-challenge", "sacking-aftermath", "chiss-escort-duty", "betrayed-chiss-compact", "sheltered-revanites", "starcabal-message", "dread-whispers", "wrong-artifact-smuggled", "killed-unkillable-witness"]};
@@ -200,11 +200,18 @@ function renderSpecies(forceRebuild = false) {
     const pts = s.points || 0;
     const sign = pts >= 0 ? '+' : '';
     const imgHelper = createSpeciesImage(s.id);
+    const imgSrc = findSpeciesImage(s.id) || `${imgHelper.basePath}.png`;
+    const sprite = getSpriteClass('species', s.id);
+    const img = sprite
+      ? `<div class="species-img sprite-frame" data-species-id="${s.id}">
+           <span class="${sprite}" role="img" aria-label="${s.name}"></span>
+         </div>`
+      : responsivePicture(imgSrc, '64px', `<img class="species-img" data-species-id="${s.id}" alt="${s.name}" 
+             src="${imgSrc}" onerror="tryNextSpeciesImage(this)">`);
 
     card.innerHTML = `
       <div class="species-img-wrap" data-species-id="${s.id}">
-        <img class="species-img" data-species-id="${s.id}" alt="${s.name}" 
-             src="${imgHelper.basePath}.png" onerror="tryNextSpeciesImage(this)">
+        ${img}
       </div>
       <div class="species-content">
         <div class="species-name">${s.name}</div>
@@ -881,14 +888,22 @@ function createDraftCardElement(card, isMini = false, onClick = null) {
   let artStyle;
   let extraClass = '';
   const darkImages = ['Burnt.webp', 'hideout.webp', 'psychic.webp'];
-  if (card.image) {
-    const brightnessFilter = darkImages.includes(card.image) ? 'brightness(0.9)' : 'brightness(0.6)';
+  const brightnessFilter = darkImages.includes(card.image) ? 'brightness(0.9)' : 'brightness(0.6)';
+  const sprite = getSpriteClass('cards', card.id);
+  const meta = getImageMeta(card);
+  const placeholderColor = meta && meta.color ? `background-color: ${meta.color};` : '';
+  if (sprite) {
+    // Art from the card atlas; .draft-card-art-shade draws the gradient
+    artStyle = `${placeholderColor} filter: ${brightnessFilter} saturate(0.8);`;
+    extraClass = ` ${sprite}`;
+  } else if (card.image) {
     artStyle = `
       background-image: 
         linear-gradient(180deg, rgba(0,0,0,0.1) 0%, rgba(0,0,0,0.6) 100%),
         url('assets/cards/${card.image}');
       background-size: cover;
       background-position: top center;
+      ${placeholderColor}
       filter: ${brightnessFilter} saturate(0.8);
     `;
   } else {
@@ -903,7 +918,7 @@ function createDraftCardElement(card, isMini = false, onClick = null) {
   
   el.innerHTML = `
     <div class="draft-card-art">
-      <div class="draft-card-art-bg" style="${artStyle}"></div>
+      <div class="draft-card-art-bg${extraClass}" style="${artStyle}">${sprite ? '<div class="draft-card-art-shade"></div>' : ''}</div>
       <div class="draft-card-art-overlay"></div>
       <div class="draft-card-corners">
         <div class="draft-card-corner tl"></div>
@@ -1061,6 +1076,7 @@ function renderFactions() {
       
       // For negative values, flip the SVG to make gauge go left
       const svgClass = value < 0 ? 'faction-hex-svg negative-direction' : 'faction-hex-svg';
+      const sprite = getSpriteClass('factions', faction.id);
       
       hex.innerHTML = `
         <svg class="${svgClass}" viewBox="0 0 100 100">
@@ -1069,9 +1085,12 @@ function renderFactions() {
                   stroke-dasharray="${circumference}" 
                   stroke-dashoffset="${offset}" />
         </svg>
-        <div class="faction-hex-inner">
-          <img class="faction-hex-img" src="assets/factions/${faction.image}" alt="${faction.name}" 
-               onerror="this.style.display='none'">
+        <div class="faction-hex-inner${sprite ? ' sprite-frame' : ''}">
+          ${sprite
+            ? `<span class="faction-hex-img ${sprite}" role="img" aria-label="${faction.name}"></span>`
+            : responsivePicture(`assets/factions/${faction.image}`, '42px',
+                `<img class="faction-hex-img" src="assets/factions/${faction.image}" alt="${faction.name}" 
+                 onerror="this.style.display='none'">`)}
         </div>
         <span class="faction-hex-value ${valueClass}">${sign}${value}</span>
       `;
@@ -1098,9 +1117,13 @@ function showFactionTooltip(faction, anchor) {
     document.body.appendChild(factionTooltipEl);
   }
   
+  // Emblems are shown 80px high, at their own aspect ratio
+  const meta = getImageMeta(faction);
+  const imgWidth = meta ? Math.round(80 * meta.width / meta.height) : 80;
   const imgHtml = faction.image 
     ? `<div class="faction-tooltip-img-wrapper">
-         <img class="faction-tooltip-img faction-img-${faction.id}" src="assets/factions/${faction.image}" alt="${faction.name}" onerror="this.parentElement.style.display='none'">
+         ${responsivePicture(`assets/factions/${faction.image}`, `${imgWidth}px`,
+           `<img class="faction-tooltip-img faction-img-${faction.id}" src="assets/factions/${faction.image}" alt="${faction.name}" onerror="this.closest('.faction-tooltip-img-wrapper').style.display='none'">`)}
        </div>`
     : '';
   
@@ -0,0 +1,129 @@
+// Generated by scripts/build_placeholders.py from the images in assets/, do not edit
+const IMAGE_META = {
+  SPECIES: {
+    "humain": {"image": {"width": 1822, "height": 2326, "color": "#1a1715", "blurhash": "T870;|$*0#^Ps.EMEfR*xG5RR*-U"}},
+    "twilek": {"image": {"width": 890, "height": 1115, "color": "#181614", "blurhash": "T26HluQ,0KGdMvR3A^Mw,.IUjFxu"}},
+    "zabrak": {"image": {"width": 533, "height": 947, "color": "#b4b5b6", "blurhash": "TNJa_;em_ND%aeWC_3t7Io?bt7R*"}},
+    "miraluka": {"image": {"width": 515, "height": 944, "color": "#fefefe", "blurhash": "TSP%Iq4T?bxuniRP%g%MRPx]RPIA"}},
+    "chiss": {"image": {"width": 2234, "height": 4940, "color": "#fefefe", "blurhash": "T*NTzYxu~qxuWBof?bofM{%Mt7f6"}},
+    "rattataki": {"image": {"width": 670, "height": 1175, "color": "#151619", "blurhash": "T13[rE0L4nxuV@IoRjxaa$Ria~s;"}},
+    "cathar": {"image": {"width": 439, "height": 937, "color": "#010101", "blurhash": "T96H4PoL0z-Uj[IpI:ay$iNbofxF"}},
+    "duros": {"image": {"width": 250, "height": 450, "color": "#1a1914", "blurhash": "T14LUU%f00?^%M8_KRtRQ-.8NeMd"}},
+    "sullustan": {"image": {"width": 252, "height": 719, "color": "#d7dbd7", "blurhash": "TrKxC#t7~qodofkC%Mt7M{x]ofof"}},
+    "bothan": {"image": {"width": 344, "height": 497, "color": "#fefefe", "blurhash": "TrM7ibIo_Nt7oefk.8xaad%MWVs:"}},
+    "zeltron": {"image": {"width": 360, "height": 496, "color": "#fefefe", "blurhash": "T@NAVXoL~q%MayWVxvogV@-;ayof"}},
+    "falleen": {"image": {"width": 722, "height": 1109, "color": "#fcfaf7", "blurhash": "TnKd*tM{~q%gM{ax_3%Mof-;t6j["}},
+    "wookiee": {"image": {"width": 1080, "height": 2300, "color": "#fefefe", "blurhash": "T]K_5vt7~qs:ofof-;WBWB%Mj[t8"}},
+    "trandoshan": {"image": {"width": 561, "height": 717, "color": "#fefefd", "blurhash": "ThI=Je%Nxu-;j@WV~qt7afxvayjt"}},
+    "keldor": {"image": {"width": 840, "height": 1280, "color": "#fefefe", "blurhash": "T~NdBtt7~q%NofWCxtj@Rjx]azaz"}},
+    "togruta": {"image": {"width": 1069, "height": 2000, "color": "#fffefe", "blurhash": "T_Oy;Sxu_N%gt7oKxuj[M{xukCWV"}},
+    "nautolan": {"image": {"width": 945, "height": 1280, "color": "#fffefe", "blurhash": "T,PZcKxu_NadRjoz-;j[M{%Mj[ay"}},
+    "mirialan": {"image": {"width": 350, "height": 498, "color": "#1a1419", "blurhash": "T14eHDD$0eK2ITIpW8?Is=R%NZNG"}},
+    "rodian": {"image": {"width": 900, "height": 1280, "color": "#fffefe", "blurhash": "T#Q9o_V@?wx]ogjZo#V@Vs-;ogj?"}},
+    "devaronian": {"image": {"width": 450, "height": 600, "color": "#fdfdf1", "blurhash": "TmOWZxxt_N%LogWB?ut8M{x]j@j?"}},
+    "arkanian": {"image": {"width": 555, "height": 992, "color": "#9da49d", "blurhash": "TQF?61t8%L_NogRjRioKRkWAWUt7"}},
+    "weequay": {"image": {"width": 800, "height": 1280, "color": "#fefefe", "blurhash": "T$OzGJoe_N%Nt7ay%2ofIU%Mt7jZ"}},
+    "gamorrean": {"image": {"width": 1623, "height": 2500, "color": "#fefefe", "blurhash": "T[LEE2xu~qofj[az-;WBj[%Moft7"}},
+    "ithorian": {"image": {"width": 1000, "height": 1280, "color": "#fdfefc", "blurhash": "ThNc{CMy_N_4kCkC%gt6WB?b%Ma#"}},
+    "selkath": {"image": {"width": 800, "height": 1300, "color": "#fdfdfd", "blurhash": "TpMtaO%M~q4nWBM{D%WBM{xuWBM{"}},
+    "pureblood_massassi": {"image": {"width": 537, "height": 768, "color": "#280907", "blurhash": "TBBy24NH~B%4R+oz$,s:IpI]xGEL"}},
+    "anzat": {"image": {"width": 900, "height": 1280, "color": "#fefefd", "blurhash": "TuNwD.IU~qt7xuxu_3x[RjoeRjRj"}},
+    "cerean": {"image": {"width": 1424, "height": 2000, "color": "#fefefe", "blurhash": "T*NdBvjY~q%MM{Rkt7t7Rj%Nt7of"}},
+    "ewok": {"image": {"width": 620, "height": 1060, "color": "#fffefe", "blurhash": "TuNmpD%2~q?btRIV_Nt8M{bIRPRi"}},
+    "gand": {"image": {"width": 500, "height": 621, "color": "#fefefe", "blurhash": "ToM7fO9F_N?baeayx]xuRj-;M{R+"}},
+    "gungan": {"image": {"width": 910, "height": 1280, "color": "#fefefd", "blurhash": "TzOpf5jF_N%LRjbca{x]of%MWUkC"}},
+    "hutt": {"image": {"width": 825, "height": 1330, "color": "#fefefe", "blurhash": "T+LXPbx]~q%Mt7oz-;V@ofWAWANG"}},
+    "iktotchi": {"image": {"width": 500, "height": 688, "color": "#fbfef5", "blurhash": "TyLNb{Rk~q?vaKo#t7ofRjxuWBWB"}},
+    "jawa": {"image": {"width": 885, "height": 1280, "color": "#fdfdf5", "blurhash": "TrN,b#Mw~q-pt7kD_3x]NHt8WrW="}},
+    "kaleesh": {"image": {"width": 935, "height": 1280, "color": "#fefefe", "blurhash": "TvODLLM__N.8ogog%MxuM{xuogRj"}},
+    "mon_calamari": {"image": {"width": 471, "height": 639, "color": "#fefefe", "blurhash": "TTNTXhpb-qNZD%oy~q%Mj]?HtRtR"}},
+    "nikto": {"image": {"width": 2061, "height": 2300, "color": "#fefefe", "blurhash": "TbN,rR9E_N?vWBn$%2xuM{?vWAWB"}},
+    "quarren": {"image": {"width": 1200, "height": 1350, "color": "#dadada", "blurhash": "TKKKc*vgo}^+xtbb~qkWbF?bRPt7"}},
+    "gran": {"image": {"width": 795, "height": 1280, "color": "#fefefe", "blurhash": "T[NJ?[j[_N%2ofWB-;j[Rk%MofWB"}},
+    "bith": {"image": {"width": 1000, "height": 1587, "color": "#fefefe", "blurhash": "T]Mj,Tae~q%Mj[WB-;ofRjt7ayay"}},
+    "rakata": {"image": {"width": 448, "height": 720, "color": "#020203", "blurhash": "T78DeB=|4nBVNd9t=Gw^$*0zNuxu"}},
+  },
+  PLANETES: {
+    "coruscant": {"banner": {"width": 1000, "height": 563, "color": "#181818", "blurhash": "LJC6iPWB0MRk~qR*IVoeA0Wq-mxa"}, "view": {"width": 800, "height": 800, "color": "#050408", "blurhash": "L854~,Dzx_M{x_M^t8jdIntSM^xw"}},
+    "alderaan": {"banner": {"width": 1000, "height": 425, "color": "#373648", "blurhash": "LA7^cCI.$*WA}]JBwuR+^QEjxGR*"}, "view": {"width": 560, "height": 560, "color": "#010102", "blurhash": "LD7xdt8^I9yDtSV@fPkCDhx^WAjb"}},
+    "corellia": {"banner": {"width": 1000, "height": 262, "color": "#b9a596", "blurhash": "LeJ7%TNLR-xt~BjbWUa|M}aeV@bF"}, "view": {"width": 800, "height": 800, "color": "#030404", "blurhash": "LNAAwD.8D%IT_Nx]IUM{RjRPRPoe"}},
+    "balmorra": {"banner": {"width": 1000, "height": 644, "color": "#774727", "blurhash": "LVFEM:%1WVay~BoyWVay}?t6WWoJ"}, "view": {"width": 475, "height": 475, "color": "#030403", "blurhash": "LMCZO+4nITRl~qM{ITWE9a-:IUt7"}},
+    "kashyyyk": {"banner": {"width": 672, "height": 324, "color": "#494438", "blurhash": "LGB:soIVIU%g~qRkWBozaxoft7IV"}, "view": {"width": 700, "height": 700, "color": "#010203", "blurhash": "LJ9Htp8^IA.8x]jZRPWBnNtlIToL"}},
+    "nar_shaddaa": {"banner": {"width": 672, "height": 306, "color": "#995638", "blurhash": "LBFWX#k;0#I;^O$iEMbIW-w{NwxF"}, "view": {"width": 1000, "height": 670, "color": "#674627", "blurhash": "LEATAvm+lV4:-pi^o}M{9_NG$%sl"}},
+    "quesh": {"banner": {"width": 1000, "height": 571, "color": "#8a351d", "blurhash": "LFJra5xsI:58[C-m%K%K}=}?RkNH"}, "view": {"width": 500, "height": 500, "color": "#030301", "blurhash": "LJ9$RC9_9_=v}pI=Eh-9n%oKNcsn"}},
+    "tatooine": {"banner": {"width": 1000, "height": 423, "color": "#6b849c", "blurhash": "LKDu*]57%MxFpy%1f,NHTfxuR+t7"}, "view": {"width": 800, "height": 800, "color": "#161413", "blurhash": "LOD9SF~WE29a%Mt7WBWB9ZE1V@oI"}},
+    "taris": {"banner": {"width": 1000, "height": 498, "color": "#272b35", "blurhash": "LZEx@e-pE1t7~VjFIV%2?GoMRlxu"}, "view": {"width": 1000, "height": 1000, "color": "#040509", "blurhash": "LA5?9z%#HrV[.mozH?aiivR5MxbH"}},
+    "hoth": {"banner": {"width": 1000, "height": 567, "color": "#a9a897", "blurhash": "LAIOqPoy4obbTL02%2a#_2IVxtWB"}, "view": {"width": 700, "height": 700, "color": "#010104", "blurhash": "LcCtRt_NVXMxx]ofRiayDiIAM|WB"}},
+    "mustafar": {"banner": {"width": 941, "height": 340, "color": "#4c1913", "blurhash": "L9C|dm$NWVSN7zn*www{}asoS2S4"}, "view": {"width": 1000, "height": 1000, "color": "#030202", "blurhash": "LCCXZ;^jE}EM~B={I;ELBnSh9]RP"}},
+    "ilum": {"banner": {"width": 1000, "height": 563, "color": "#6a9ac5", "blurhash": "LKBr4lyYkRjY%hSeoyof8^ROoLWC"}, "view": {"width": 735, "height": 755, "color": "#000001", "blurhash": "TlC7gV?waH.9t6MwW8M^IUjEWCWE"}},
+    "belsavis": {"banner": {"width": 1000, "height": 299, "color": "#85aad9", "blurhash": "LXFja2oKkaXB.TROW9of%gkDRNtR"}, "view": {"width": 469, "height": 469, "color": "#030303", "blurhash": "LcE{qe9F9Fxu~qM{D%t7IU%MM{of"}},
+    "voss": {"banner": {"width": 1000, "height": 575, "color": "#784817", "blurhash": "L;J$[%t6oes.~8oeoej[-moeWXaz"}, "view": {"width": 500, "height": 500, "color": "#020303", "blurhash": "LMAdiuDOI9Xn_NM_D%o}Mw%MIVt6"}},
+    "carrick_station": {"banner": {"width": 1080, "height": 459, "color": "#26272a", "blurhash": "L471vIE0$Lxv-;t7Rjxu8wxuN_t6"}, "view": {"width": 636, "height": 729, "color": "#020203", "blurhash": "T68gEO0g0KL4rpVXjHxVIqI8Nyxu"}},
+    "vaiken_spacedock": {"banner": {"width": 700, "height": 350, "color": "#231b19", "blurhash": "L37dqK?a4mM}%NxZWTx[4mNGa#Mx"}, "view": {"width": 601, "height": 833, "color": "#0c1829", "blurhash": "TC8;=6_J.3W%?s?s?at3k88_IUj^"}},
+  },
+  FACTIONS: {
+    "republic": {"image": {"width": 612, "height": 612}},
+    "empire": {"image": {"width": 416, "height": 480}},
+    "sis": {"image": {"width": 612, "height": 612}},
+    "imperial_intel": {"image": {"width": 1168, "height": 640, "color": "#383b47", "blurhash": "LB7-W.t8S6s;%jognia}%4j]R%j?"}},
+    "hutt": {"image": {"width": 700, "height": 700}},
+    "chiss": {"image": {"width": 572, "height": 600}},
+    "czerka": {"image": {"width": 610, "height": 405, "color": "#ffcc33", "blurhash": "LSIW;sWWNIxYxYazj@j@E5t50jRl"}},
+    "exchange": {"image": {"width": 605, "height": 539}},
+    "blacksun": {"image": {"width": 512, "height": 612}},
+    "bountyguild": {"image": {"width": 666, "height": 800, "color": "#46495a", "blurhash": "TF9@VRxvt:t7aeM{ELbbR4bxoztR"}},
+    "mandal": {"image": {"width": 873, "height": 1016, "color": "#fffffe", "blurhash": "TsG[Zo%1-p_NkDkW_3t7t7?bWCbI"}},
+    "organa": {"image": {"width": 1074, "height": 1281, "color": "#d69648", "blurhash": "TDOBre~VTfr?f6R.H[n~sk~Tf+xY"}},
+    "thul": {"image": {"width": 1024, "height": 1024, "color": "#382449", "blurhash": "LEA+2XoM1iW=xIj[Wqju6*WX;{o0"}},
+    "ulgo": {"image": {"width": 204, "height": 532, "color": "#170a06", "blurhash": "T14-X[-B0g}?s.IW1bS2$%EgWVxZ"}},
+    "jedi": {"image": {"width": 591, "height": 600}},
+    "sith": {"image": {"width": 960, "height": 960, "color": "#9e1919", "blurhash": "L7CC~Cw{6Nw{w{jtWpjt6NWp|wsU"}},
+    "revanites": {"image": {"width": 512, "height": 512, "color": "#111213", "blurhash": "LSIvW5sU2Fa|$5jtSMa|WpjtJljt"}},
+    "starcabal": {"image": {"width": 1869, "height": 979, "color": "#372a27", "blurhash": "L46Rot%Ktl-;Q7$ytRoxu5rqt8S~"}},
+    "genoharadan": {"image": {"width": 656, "height": 260, "color": "#030000", "blurhash": "L65y+_juODjuwyfQa|fQ2Ya|Wpa|"}},
+    "dreadmasters": {"image": {"width": 550, "height": 550, "color": "#020201", "blurhash": "L12=lks.4=RlWCoej[WV9baz-noe"}},
+  },
+  DRAFT_CARDS: {
+    "burned-sis-safehouse": {"image": {"width": 1000, "height": 425, "color": "#161927", "blurhash": "L24xDJ-C5,Ej1%E#=y$g=|xDNbR*"}},
+    "dead-drop-network": {"image": {"width": 300, "height": 244, "color": "#040404", "blurhash": "L69%-Y-pE1.8jF9FoftR01t7WARQ"}},
+    "false-flag-shipment": {"image": {"width": 970, "height": 444, "color": "#233a7b", "blurhash": "LM6RfnofDgRjogfkWAayIWay%Koe"}},
+    "extracted-defector": {"image": {"width": 1000, "height": 1199, "color": "#272527", "blurhash": "T14Bzk~q00_3%MD%D*Io%L4:E1-p"}},
+    "you-were-turned": {"image": {"width": 1140, "height": 715, "color": "#fefefe", "blurhash": "LxOzSsof~q%M%Mj[ayWB%MofWBay"}},
+    "keepers-cleanup": {"image": {"width": 325, "height": 301, "color": "#010204", "blurhash": "LD72EfV?IVkD_NkCIUWB%MofM{WB"}},
+    "hutt-debt-blood": {"image": {"width": 601, "height": 302, "color": "#123659", "blurhash": "Lc6mQoadQkaJR4j?kWfOMdf6tRj["}},
+    "exchange-audit": {"image": {"width": 1270, "height": 538, "color": "#171816", "blurhash": "LODJ9ZIU.8IU~qoc%MV@W;-;Rjt7"}},
+    "blacksun-protection": {"image": {"width": 2024, "height": 833, "color": "#14170c", "blurhash": "L44LRKt602M|%MofIURj%MjuIUax"}},
+    "hutt-exchange-truce": {"image": {"width": 600, "height": 445, "color": "#fdfdfd", "blurhash": "LRNTzYof4n~q_3xu9Fxu~qxu%May"}},
+    "live-capture-contract": {"image": {"width": 1600, "height": 1900, "color": "#160a0a", "blurhash": "T14Bd?^+9[?H%2R*9tR*jFRkRkIo"}},
+    "refused-hutt-contract": {"image": {"width": 600, "height": 402, "color": "#393527", "blurhash": "LND]hm02Sg%L?aIBR%tRX8s.M|tR"}},
+    "genoharadan-invitation": {"image": {"width": 2560, "height": 1600, "color": "#332c28", "blurhash": "L383@P$z4:%M=E}?NcS2=t%0ozNG"}},
+    "czerka-lab-evac": {"image": {"width": 1000, "height": 635, "color": "#1d2227", "blurhash": "L34y1s-oQ*XrO[M@a$f:+;xVpMRN"}},
+    "whistleblown-safety": {"image": {"width": 1135, "height": 524, "color": "#948a88", "blurhash": "LQBDA[t70KNG-;WCD*s:t7fQRjfQ"}},
+    "prototype-weapons-offledger": {"image": {"width": 652, "height": 367, "color": "#14181b", "blurhash": "L25FB]xD#,%h?^spVYozMIofn$xu"}},
+    "organa-protected": {"image": {"width": 564, "height": 421, "color": "#faf5d7", "blurhash": "L-L3Y|aeM|xa~on%nikC%fbHoJWV"}},
+    "thul-payroll": {"image": {"width": 1279, "height": 720, "color": "#685957", "blurhash": "L5C$s3~3Di?H%hJU9Yt,TNaPIARl"}},
+    "ulgo-line-held": {"image": {"width": 1080, "height": 1080, "color": "#362838", "blurhash": "LB8;1TWFD|%4xyxxW9RiIStAxxM^"}},
+    "alderaan-summit-courier": {"image": {"width": 1000, "height": 550, "color": "#ebe5d6", "blurhash": "LZLge6xu01M{%Mt7WCV@4.t7xuae"}},
+    "fought-beside-mandos": {"image": {"width": 1000, "height": 643, "color": "#776957", "blurhash": "LlFF7?RkIpxt~URkM}t6-nayRkR*"}},
+    "refused-mando-challenge": {"image": {"width": 616, "height": 616, "color": "#575a58", "blurhash": "L69%q]VYtQyX~XaKs,%NyDx]Rjxv"}},
+    "sacking-aftermath": {"image": {"width": 1000, "height": 563, "color": "#392726", "blurhash": "L99G8ZWA9u%1={jZNaWV0zbHt6I:"}},
+    "chiss-escort-duty": {"image": {"width": 1600, "height": 1600, "color": "#1b1315", "blurhash": "L254,D^j5657~B%0IoEME3Ip$*-o"}},
+    "betrayed-chiss-compact": {"image": {"width": 779, "height": 768, "color": "#161518", "blurhash": "LC7U-hxv8xRQyDkCIUa#H@jI%ft6"}},
+    "sheltered-revanites": {"image": {"width": 2606, "height": 1400, "color": "#383639", "blurhash": "LJDk#}so0yX8=|RjODxu^kjZI:W;"}},
+    "starcabal-message": {"image": {"width": 1869, "height": 979, "color": "#372a27", "blurhash": "L46Rot%Ktl-;Q7$ytRoxu5rqt8S~"}},
+    "dread-whispers": {"image": {"width": 500, "height": 500, "color": "#060809", "blurhash": "LA8;fV53M}nP?KD#o#sDD~-CITf9"}},
+    "wrong-artifact-smuggled": {"image": {"width": 272, "height": 288, "color": "#f6ead5", "blurhash": "TeM%T3sE%NTuRPr=~Rkps,-iIqbI"}},
+    "killed-unkillable-witness": {"image": {"width": 1560, "height": 878, "color": "#1c2228", "blurhash": "L46bGj.94oIo9EWrxtRPY8tS-=s:"}},
+  },
+};
+
+// Attach to the data.js entries (renderFactions reads the FACTION_SECTIONS objects)
+[
+  [SPECIES, IMAGE_META.SPECIES],
+  [PLANETES, IMAGE_META.PLANETES],
+  [FACTIONS, IMAGE_META.FACTIONS],
+  [FACTION_SECTIONS.flatMap(section => section.factions), IMAGE_META.FACTIONS],
+  [DRAFT_CARDS, IMAGE_META.DRAFT_CARDS],
+].forEach(([entries, meta]) => entries.forEach(entry => {
+  if (meta[entry.id]) entry.imageMeta = meta[entry.id];
+}));
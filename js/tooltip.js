@@ -178,6 +178,7 @@ function createAndPositionTooltip(species, description, imgId, anchorEl, hoverDo
     z-index: 1000;
   `;
   
+  const imgSrc = findSpeciesImage(imgId) || `assets/species/${imgId}.png`;
   tooltip.innerHTML = `
     <svg class="tooltip-connector-svg" style="position: absolute; top: 0; left: 0; width: 100%; height: 100%; overflow: visible;">
       <defs>
@@ -206,11 +207,14 @@ function createAndPositionTooltip(species, description, imgId, anchorEl, hoverDo
       </div>
       <div class="tooltip-body">
         <div class="tooltip-img-container">
-          <img class="tooltip-species-img" 
-               src="assets/species/${imgId}.png" 
+          ${responsivePicture(imgSrc, '200px', `<img class="tooltip-species-img" 
+               src="${imgSrc}" 
                alt="${species.name}"
+               ${imageSizeAttrs(getImageMeta(species))}
+               style="${placeholderStyle(getImageMeta(species))}"
+               onload="clearPlaceholder(this)"
                data-species-id="${imgId}"
-               onerror="tryNextSpeciesImage(this)">
+               onerror="tryNextSpeciesImage(this)">`)}
         </div>
         <p class="tooltip-desc">${description}</p>
       </div>
@@ -445,7 +449,9 @@ function showPlanetTooltip(planetId, anchorEl) {
   tooltip.innerHTML = `
     <div class="planet-tooltip-panel">
       <div class="planet-tooltip-banner">
-        <img src="${bannerPath}" alt="${planet.name}" onerror="this.parentElement.style.display='none'">
+        ${responsivePicture(bannerPath, '(max-width: 600px) 300px, 520px', `<img src="${bannerPath}" alt="${planet.name}" ${imageSizeAttrs(getImageMeta(planet, 'banner'))}
+             style="${placeholderStyle(getImageMeta(planet, 'banner'))}" onload="clearPlaceholder(this)"
+             onerror="this.closest('.planet-tooltip-banner').style.display='none'">`)}
         <div class="planet-tooltip-header-overlay">
           <h3 class="planet-tooltip-name">${planet.name}</h3>
           <div class="planet-tooltip-region">${planet.region}</div>
@@ -460,7 +466,9 @@ function showPlanetTooltip(planetId, anchorEl) {
             </div>
           </div>
           <div class="planet-tooltip-planet-view">
-            <img src="${planetViewPath}" alt="${planet.name}" onerror="this.style.display='none'">
+            ${responsivePicture(planetViewPath, '(max-width: 600px) 70px, 110px', `<img src="${planetViewPath}" alt="${planet.name}" ${imageSizeAttrs(getImageMeta(planet, 'view'))}
+                 style="${placeholderStyle(getImageMeta(planet, 'view'))}" onload="clearPlaceholder(this)"
+                 onerror="this.style.display='none'">`)}
           </div>
           <div class="planet-stat-hex planet-stat-population">
             <div class="hex-content">
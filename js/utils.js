@@ -62,6 +62,148 @@ function tryNextSpeciesImage(img) {
   }
 }
 
+// =============================================================================
+// SPRITE ATLASES
+// =============================================================================
+
+/**
+ * Sprite classes for an entity thumbnail ('species', 'factions' or 'cards'),
+ * or null when no atlas holds it (atlases not built, or an SVG image)
+ */
+function getSpriteClass(group, id) {
+  const ids = typeof SPRITES !== 'undefined' ? SPRITES[group] : null;
+  return ids && ids.includes(id) ? `sprite sprite-${group}-${id}` : null;
+}
+
+// =============================================================================
+// RESPONSIVE IMAGES
+// =============================================================================
+
+/**
+ * Srcsets by MIME type of an image under assets/ (assets/build/images.js,
+ * generated by scripts/build_images.py), or null when none were built
+ */
+function getImageSources(src) {
+  if (typeof IMAGE_SOURCES === 'undefined') return null;
+  return IMAGE_SOURCES[src.replace(/^(\.\/)?assets\//, '')] || null;
+}
+
+/**
+ * Path of the species image that has built renditions, or null
+ */
+function findSpeciesImage(speciesId) {
+  const basePath = getSpeciesImageSrc(speciesId);
+  const ext = IMAGE_EXTENSIONS.find(e => getImageSources(`${basePath}.${e}`));
+  return ext ? `${basePath}.${ext}` : null;
+}
+
+/**
+ * Wrap <img> markup for `src` in a <picture> offering its AVIF / WebP
+ * renditions; `sizes` is the displayed width. Unchanged when none were built.
+ */
+function responsivePicture(src, sizes, imgHtml) {
+  const sources = getImageSources(src);
+  if (!sources) return imgHtml;
+  const sourceTags = Object.entries(sources)
+    .map(([type, srcset]) => `<source type="${type}" srcset="${srcset}" sizes="${sizes}">`)
+    .join('');
+  return `<picture>${sourceTags}${imgHtml}</picture>`;
+}
+
+// =============================================================================
+// IMAGE PLACEHOLDERS
+// =============================================================================
+const BLURHASH_CHARS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~';
+const placeholderCache = new Map();
+
+function decodeBase83(str) {
+  return [...str].reduce((value, c) => value * 83 + BLURHASH_CHARS.indexOf(c), 0);
+}
+
+function srgbToLinear(value) {
+  const v = value / 255;
+  return v <= 0.04045 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+}
+
+function linearToSrgb(value) {
+  const v = Math.max(0, Math.min(1, value));
+  return Math.round((v <= 0.0031308 ? v * 12.92 : 1.055 * Math.pow(v, 1 / 2.4) - 0.055) * 255);
+}
+
+/**
+ * Render a blurhash (js/image_meta.js) to a small PNG data URL, cached
+ */
+function blurhashToDataURL(hash, width, height) {
+  const key = `${hash}|${width}x${height}`;
+  if (placeholderCache.has(key)) return placeholderCache.get(key);
+
+  const sizeFlag = decodeBase83(hash[0]);
+  const nx = (sizeFlag % 9) + 1;
+  const ny = Math.floor(sizeFlag / 9) + 1;
+  const maxAC = (decodeBase83(hash[1]) + 1) / 166;
+  const dc = decodeBase83(hash.slice(2, 6));
+  const colors = [[srgbToLinear(dc >> 16), srgbToLinear((dc >> 8) & 255), srgbToLinear(dc & 255)]];
+  for (let i = 1; i < nx * ny; i++) {
+    const value = decodeBase83(hash.slice(4 + i * 2, 6 + i * 2));
+    colors.push([Math.floor(value / 361), Math.floor(value / 19) % 19, value % 19]
+      .map(q => Math.sign(q - 9) * Math.pow((q - 9) / 9, 2) * maxAC));
+  }
+
+  const canvas = document.createElement('canvas');
+  canvas.width = width;
+  canvas.height = height;
+  const ctx = canvas.getContext('2d');
+  const pixels = ctx.createImageData(width, height);
+  for (let y = 0; y < height; y++) {
+    for (let x = 0; x < width; x++) {
+      const rgb = [0, 0, 0];
+      for (let j = 0; j < ny; j++) {
+        for (let i = 0; i < nx; i++) {
+          const basis = Math.cos(Math.PI * x * i / width) * Math.cos(Math.PI * y * j / height);
+          colors[i + j * nx].forEach((c, k) => { rgb[k] += c * basis; });
+        }
+      }
+      const p = 4 * (x + y * width);
+      rgb.forEach((c, k) => { pixels.data[p + k] = linearToSrgb(c); });
+      pixels.data[p + 3] = 255;
+    }
+  }
+  ctx.putImageData(pixels, 0, 0);
+
+  const url = canvas.toDataURL();
+  placeholderCache.set(key, url);
+  return url;
+}
+
+/**
+ * Placeholder data of an entity image ('image', or 'banner' / 'view' for planets)
+ */
+function getImageMeta(entity, role = 'image') {
+  return entity && entity.imageMeta ? entity.imageMeta[role] || null : null;
+}
+
+/**
+ * Inline style painting the placeholder (blurhash over the dominant colour)
+ * behind an image until it loads; pair with onload="clearPlaceholder(this)"
+ */
+function placeholderStyle(meta) {
+  if (!meta) return '';
+  const height = Math.max(1, Math.round(32 * meta.height / meta.width));
+  const blur = meta.blurhash ? ` url('${blurhashToDataURL(meta.blurhash, 32, height)}')` : '';
+  return `background: ${meta.color || 'transparent'}${blur} center / cover no-repeat;`;
+}
+
+/**
+ * Intrinsic size attributes, so the box is reserved before the image arrives
+ */
+function imageSizeAttrs(meta) {
+  return meta ? `width="${meta.width}" height="${meta.height}"` : '';
+}
+
+function clearPlaceholder(img) {
+  img.style.background = '';
+}
+
 // =============================================================================
 // ABILITY MODIFIERS PARSING
 // =============================================================================
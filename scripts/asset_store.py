@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Content-addressed store for the downloaded site assets.
+
+Every image is kept once under BLOB_DIR, named by its SHA-256
+(`.cache/blobs/ab/ab12...ef.png`). The files in assets/species,
+assets/factions and assets/cards are hardlinks to those blobs (copies on
+filesystems that cannot hardlink), and assets/manifest.json records each
+managed asset's source URL, width, size and hash:
+
+    - an image URL (at a given width) is downloaded once per run, however
+      many assets use it (Dathomiri / Dathomiri (Near-Human), full-size
+      faction and card art from the same page)
+    - identical bytes from different URLs share one blob
+    - an asset counts as downloaded when the manifest lists it and the
+      file on disk still has that hash, not because some `<id>.*` exists
+    - with refresh, managed assets are downloaded again and an upstream
+      image that changed is reported (and relinked); unchanged ones are
+      left alone
+
+Files placed by hand (not in the manifest) are treated as before: they
+exist, so they are never overwritten.
+
+Usage:
+    from asset_store import existing_asset, fetch_asset
+
+    if not existing_asset(OUTPUT_DIR / "twilek"):
+        result = fetch_asset(url, OUTPUT_DIR / "twilek", ASSET_WIDTHS["species"])
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import metrics
+from downloader import CHUNK_SIZE, DownloadResult, download_scaled_image, existing_download
+
+ASSETS_DIR = Path(__file__).parent.parent / "assets"
+MANIFEST_FILE = ASSETS_DIR / "manifest.json"
+BLOB_DIR = Path(__file__).parent / ".cache" / "blobs"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def same_file(a: Path, b: Path) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def link_or_copy(blob: Path, dest: Path) -> None:
+    """Atomically point `dest` at `blob`: a hardlink, or a copy across filesystems."""
+    tmp = dest.with_name(dest.name + ".link")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(blob, tmp)
+    except OSError:
+        shutil.copyfile(blob, tmp)
+    os.replace(tmp, dest)
+
+
+class AssetStore:
+    """Blob store plus manifest for the files under `assets_dir`."""
+
+    def __init__(self, assets_dir: Path = ASSETS_DIR, blob_dir: Path = BLOB_DIR,
+                 manifest_file: Path = MANIFEST_FILE):
+        self.assets_dir = assets_dir
+        self.blob_dir = blob_dir
+        self.manifest_file = manifest_file
+        self.manifest: dict[str, dict] = {}
+        if manifest_file.exists():
+            self.manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+        self._fetched: dict[tuple[str, int | None], Path] = {}  # (url, width) -> blob, this run
+
+    def key(self, dest_stem: Path) -> str:
+        """Manifest key of an asset: its path under assets/, without extension."""
+        return dest_stem.resolve().relative_to(self.assets_dir.resolve()).as_posix()
+
+    def blob_path(self, sha256: str, ext: str) -> Path:
+        return self.blob_dir / sha256[:2] / f"{sha256}{ext}"
+
+    def save(self) -> None:
+        tmp = self.manifest_file.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(dict(sorted(self.manifest.items())), indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.manifest_file)
+
+    def existing(self, dest_stem: Path, refresh: bool = False) -> Path | None:
+        """
+        The asset's file if it is complete and unchanged (any file, if unmanaged).
+        With `refresh`, managed assets count as missing so they are checked upstream.
+        """
+        entry = self.manifest.get(self.key(dest_stem))
+        if entry is None:
+            return existing_download(dest_stem)
+        if refresh:
+            return None
+        path = dest_stem.parent / f"{dest_stem.name}{entry['ext']}"
+        if not path.exists():
+            return None
+        blob = self.blob_path(entry["sha256"], entry["ext"])
+        if same_file(path, blob):
+            return path
+        if path.stat().st_size != entry["size"] or file_sha256(path) != entry["sha256"]:
+            print(f"    {path.name} differs from the manifest, downloading again")
+            return None
+        if not blob.exists():  # fresh checkout or cleared cache: adopt the file as the blob
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(path, blob)
+        return path
+
+    def fetch(self, url: str, dest_stem: Path, width: int | None = None,
+              original_sha1: str | None = None) -> DownloadResult:
+        """
+        Download `url` into the store (once per run) and link it as `dest_stem`.
+        `original_sha1` verifies the download when it is the original file.
+        """
+        blob = self._fetched.get((url, width))
+        if blob is None:
+            blob = self._fetched[(url, width)] = self._download(url, width, original_sha1)
+        else:
+            metrics.count("assets.deduplicated")
+            print("    Same image as an earlier asset, linking")
+        return self._materialize(blob, dest_stem, url, width)
+
+    def _download(self, url: str, width: int | None, original_sha1: str | None) -> Path:
+        # Stable staging name, so an interrupted download resumes next run
+        staging = self.blob_dir / "incoming" / hashlib.sha1(f"{url} {width}".encode()).hexdigest()
+        result = download_scaled_image(url, staging, width, original_sha1)
+        blob = self.blob_path(result.sha256, result.path.suffix)
+        if blob.exists():
+            result.path.unlink()
+            metrics.count("assets.deduplicated")
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(result.path, blob)
+        return blob
+
+    def _materialize(self, blob: Path, dest_stem: Path, url: str, width: int | None) -> DownloadResult:
+        sha256, ext = blob.stem, blob.suffix
+        key = self.key(dest_stem)
+        dest = dest_stem.parent / f"{dest_stem.name}{ext}"
+
+        previous = self.manifest.get(key)
+        if previous and previous["sha256"] != sha256:
+            metrics.count("assets.changed")
+            print(f"    Upstream image changed: {key} ({previous['sha256'][:12]} -> {sha256[:12]})")
+            if previous["ext"] != ext:
+                (dest_stem.parent / f"{dest_stem.name}{previous['ext']}").unlink(missing_ok=True)
+
+        if not same_file(dest, blob):
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(blob, dest)
+
+        size = blob.stat().st_size
+        self.manifest[key] = {"url": url, "width": width, "sha256": sha256, "size": size, "ext": ext}
+        self.save()
+        return DownloadResult(dest, size, sha256)
+
+
+_store: AssetStore | None = None
+
+
+def get_store() -> AssetStore:
+    """Return the shared asset store, loading the manifest on first use."""
+    global _store
+    if _store is None:
+        _store = AssetStore()
+    return _store
+
+
+def existing_asset(dest_stem: Path, refresh: bool = False) -> Path | None:
+    return get_store().existing(dest_stem, refresh)
+
+
+def fetch_asset(url: str, dest_stem: Path, width: int | None = None,
+                original_sha1: str | None = None) -> DownloadResult:
+    return get_store().fetch(url, dest_stem, width, original_sha1)
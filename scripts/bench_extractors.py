@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the page extractors on a fixed wiki corpus.
+
+The corpus lives in fixtures/wiki/ (gzipped HTML, listed in manifest.json)
+and covers every page shape the scripts read: SWSE species pages,
+Wookieepedia species and faction pages, the SWSE species tables page and
+a category listing. Descriptions for cleanup_descriptions come from
+js/species_descriptions.json.
+
+The committed pages are synthetic: the wikis were unreachable when the
+corpus was made, so each page was written offline in the Fandom markup
+the extractors target, site chrome included. A manifest entry's `url` is
+the page it stands in for, not where it came from, and its `source` says
+"synthetic". --record fetches those URLs (or replays them from a WARC)
+and marks the entries "recorded".
+
+For each extractor (page parse included, as the scripts do it) the
+benchmark reports throughput, p50/p99 latency per page and peak traced
+memory. --save-baseline stores the numbers in fixtures/wiki/baseline.json,
+which is committed with the corpus, so a change to an extractor is
+compared with the numbers before it. Runs exit non-zero when an extractor
+got slower or hungrier than REGRESSION_THRESHOLD allows. Throughput
+depends on the machine: on very different hardware, compare against a
+baseline of your own (--save-baseline --baseline FILE, then --baseline
+FILE).
+
+Requirements:
+    pip install requests beautifulsoup4 lxml
+
+Usage:
+    python bench_extractors.py --save-baseline   # before changing an extractor
+    python bench_extractors.py                   # after: compare with the baseline
+    python bench_extractors.py --only scrape_species --repeat 50
+    python bench_extractors.py --record          # replace the corpus with the live pages
+    python bench_extractors.py --record --replay-warc corpus.warc.gz  # ... or from a frozen archive
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+import cleanup_descriptions
+import download_faction_images
+import download_species_images
+import scrape_species
+import scrape_species_descriptions
+import scrape_species_page
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+from wiki_parse import parse_page
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "wiki"
+MANIFEST_FILE = FIXTURES_DIR / "manifest.json"
+DESCRIPTIONS_FILE = Path(__file__).parent.parent / "js" / "species_descriptions.json"
+BASELINE_FILE = FIXTURES_DIR / "baseline.json"
+
+# Relative slow-down (throughput) or growth (peak memory) reported as a regression
+REGRESSION_THRESHOLD = 0.20
+
+
+def bench_scrape_species(html: str) -> dict:
+    soup = parse_page(html)
+    return {
+        "abilityMods": scrape_species.extract_ability_mods(soup),
+        "description": scrape_species.extract_species_description(soup),
+        "traits": scrape_species.extract_species_traits(soup),
+        "languages": scrape_species.extract_languages(soup),
+        "image_url": scrape_species.extract_species_image(soup),
+    }
+
+
+def bench_category_links(html: str) -> tuple:
+    soup = parse_page(html, fast=False)
+    return scrape_species.extract_species_links(soup), scrape_species.extract_next_page(soup)
+
+
+# name -> (corpus kind, extractor(input) -> result)
+BENCHMARKS: dict[str, tuple[str, Callable]] = {
+    "scrape_species.scrape_species_page": ("swse_species", bench_scrape_species),
+    "scrape_species.extract_species_links": ("category", bench_category_links),
+    "download_species_images.get_species_data": (
+        "swse_species", lambda html: download_species_images.extract_species_data(parse_page(html))),
+    "download_faction_images.get_page_image": (
+        "faction", lambda html: download_faction_images.extract_page_image(parse_page(html))),
+    "scrape_species_page.extract_species_images": (
+        "species_table", lambda html: scrape_species_page.extract_species_images(parse_page(html))),
+    "scrape_species_descriptions.describe_from_wookieepedia": (
+        "wookieepedia_species", lambda html: scrape_species_descriptions.describe_from_wookieepedia(parse_page(html))),
+    "cleanup_descriptions.process_description": ("description", cleanup_descriptions.process_description),
+}
+
+
+def load_corpus() -> dict[str, list[str]]:
+    """Fixture inputs grouped by kind."""
+    corpus: dict[str, list[str]] = {}
+    for entry in json.loads(MANIFEST_FILE.read_text(encoding="utf-8")):
+        html = gzip.decompress((FIXTURES_DIR / entry["file"]).read_bytes()).decode("utf-8")
+        corpus.setdefault(entry["kind"], []).append(html)
+    with open(DESCRIPTIONS_FILE, encoding="utf-8") as f:
+        corpus["description"] = list(json.load(f).values())
+    return corpus
+
+
+def record_corpus(record_warc: Path | None = None, replay_warc: Path | None = None) -> None:
+    """Capture every manifest page from the live wiki (or a WARC replay) into the fixtures."""
+    import wiki_http
+
+    wiki_http.set_cache_mode("off")
+    wiki_http.set_archive(record=record_warc, replay=replay_warc)
+    manifest = json.loads(MANIFEST_FILE.read_text(encoding="utf-8"))
+    for entry in manifest:
+        print(f"  Recording: {entry['url']}")
+        html, _ = wiki_http.fetch_page_text(entry["url"])
+        (FIXTURES_DIR / entry["file"]).write_bytes(gzip.compress(html.encode("utf-8"), mtime=0))
+        entry["source"] = "recorded"
+    MANIFEST_FILE.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def run_benchmark(func: Callable, inputs: list[str], repeat: int) -> dict:
+    """Time `repeat` passes over `inputs`, then one traced pass for peak memory."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        for item in inputs:  # warm-up (imports, regex caches)
+            func(item)
+
+        latencies = []
+        for _ in range(repeat):
+            for item in inputs:
+                start = time.perf_counter()
+                func(item)
+                latencies.append(time.perf_counter() - start)
+
+        tracing = tracemalloc.is_tracing()  # already on under --profile
+        if not tracing:
+            tracemalloc.start()
+        peak = 0
+        for item in inputs:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            func(item)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+        if not tracing:
+            tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "items": len(inputs),
+        "per_sec": len(latencies) / sum(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_kb": peak / 1024,
+    }
+
+
+def regressions(results: dict, baseline: dict) -> list[str]:
+    """Human-readable list of benchmarks that regressed against `baseline`."""
+    found = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if r["per_sec"] < base["per_sec"] * (1 - REGRESSION_THRESHOLD):
+            found.append(f"{name}: {r['per_sec']:.1f}/s vs {base['per_sec']:.1f}/s baseline")
+        if r["peak_kb"] > base["peak_kb"] * (1 + REGRESSION_THRESHOLD):
+            found.append(f"{name}: peak {r['peak_kb']:.0f} KB vs {base['peak_kb']:.0f} KB baseline")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extractors on the fixed wiki corpus")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes over each corpus")
+    parser.add_argument("--only", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help=f"Baseline JSON file (default: {BASELINE_FILE.relative_to(Path(__file__).parent)})")
+    parser.add_argument("--save-baseline", action="store_true", help="Save these results as the baseline")
+    parser.add_argument("--record", action="store_true",
+                        help="Replace the corpus with the live pages (or --replay-warc) first")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+
+    if args.record:
+        print("Recording corpus...")
+        record_corpus(args.record_warc, args.replay_warc)
+
+    corpus = load_corpus()
+    print(f"Corpus: {', '.join(f'{len(v)} {k}' for k, v in corpus.items())}; {args.repeat} passes\n")
+
+    results = {}
+    print(f"{'extractor':<56} {'per sec':>9} {'p50 ms':>8} {'p99 ms':>8} {'peak KB':>9}")
+    for name, (kind, func) in BENCHMARKS.items():
+        if args.only and args.only not in name:
+            continue
+        r = results[name] = run_benchmark(func, corpus[kind], args.repeat)
+        print(f"{name:<56} {r['per_sec']:>9.1f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['peak_kb']:>9.0f}")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"\nBaseline saved to: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("\nNo baseline yet - run with --save-baseline to create one")
+        return
+
+    found = regressions(results, json.loads(args.baseline.read_text()))
+    if found:
+        print(f"\nRegressions (> {REGRESSION_THRESHOLD:.0%}):")
+        for line in found:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nNo regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    with profiled("bench_extractors"):
+        main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-page parsing against the targeted fast parse (wiki_parse).
+
+Each mode runs in a fresh child process so peak RSS is measured in
+isolation. Every mode also runs the page extractors and the results are
+compared, so a speed-up that changes what gets extracted is reported.
+
+Requirements:
+    pip install requests beautifulsoup4 lxml
+
+Usage:
+    python bench_parse.py                       # synthetic Fandom-sized pages
+    python bench_parse.py --pages .cache/http/bodies --repeat 3
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+from pathlib import Path
+
+from mock_wiki import render_page, sample_pages
+from profiling import add_profile_argument, profiled
+
+# Rough size of the Fandom skin around each article (navigation, ads, scripts)
+CHROME_LINKS = 1500
+
+
+def synthetic_pages() -> list[str]:
+    """Render the mock wiki's sample pages wrapped in Fandom-sized page chrome."""
+    chrome = "<ul>" + "".join(
+        f'<li><a href="/wiki/Link_{i}"><img src="/icon{i}.png" width="16" height="16">Link {i}</a></li>'
+        for i in range(CHROME_LINKS)
+    ) + "</ul><script>" + "var x = 1;" * 10000 + "</script>"
+    return [render_page(title, dict(page, chrome=chrome)) for title, page in sample_pages().items()]
+
+
+def load_pages(folder: Path) -> list[str]:
+    """Load every HTML document under `folder` (e.g. the page cache bodies)."""
+    pages = []
+    for path in sorted(folder.rglob("*")):
+        if path.is_file():
+            text = path.read_text(encoding="utf-8", errors="replace")
+            if "<html" in text[:2000].lower():
+                pages.append(text)
+    return pages
+
+
+def run_extractors(soup) -> tuple:
+    """The soup-based extractors used across the scripts."""
+    from download_species_images import extract_species_data
+    from scrape_species import (extract_ability_mods, extract_languages,
+                                extract_species_description, extract_species_traits)
+    from scrape_species_descriptions import LORE_SECTIONS, get_intro_paragraphs, get_section_content
+
+    return (
+        extract_species_data(soup),
+        extract_ability_mods(soup),
+        extract_species_description(soup),
+        extract_species_traits(soup),
+        sorted(extract_languages(soup)),
+        get_intro_paragraphs(soup),
+        tuple(get_section_content(soup, s) for s in LORE_SECTIONS),
+    )
+
+
+def bench_mode(fast: bool, pages: list[str], repeat: int) -> dict:
+    """Child-process body: parse + extract every page `repeat` times."""
+    from wiki_parse import parse_page
+
+    outputs = []
+    start = time.perf_counter()
+    for i in range(repeat):
+        for html in pages:
+            soup = parse_page(html, fast=fast)
+            result = run_extractors(soup)
+            if i == 0:
+                outputs.append(result)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "pages_per_sec": len(pages) * repeat / elapsed,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "outputs": outputs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full vs fast page parsing")
+    parser.add_argument("--pages", type=Path, help="Folder of saved HTML pages (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the page set")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages) if args.pages else synthetic_pages()
+    if not pages:
+        print("No HTML pages found.")
+        return
+    avg_kb = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"Pages: {len(pages)} (avg {avg_kb:.0f} KB), {args.repeat} passes\n")
+
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+    for name, fast in (("full", False), ("fast", True)):
+        with ctx.Pool(1) as pool:
+            results[name] = pool.apply(bench_mode, (fast, pages, args.repeat))
+
+    print(f"{'mode':<6} {'pages/sec':>10} {'peak RSS':>10}")
+    for name, r in results.items():
+        print(f"{name:<6} {r['pages_per_sec']:>10.1f} {r['peak_rss_mb']:>8.1f} MB")
+
+    speedup = results["fast"]["pages_per_sec"] / results["full"]["pages_per_sec"]
+    print(f"\nSpeed-up: {speedup:.2f}x")
+    same = results["fast"]["outputs"] == results["full"]["outputs"]
+    print(f"Extractor output identical: {'yes' if same else 'NO'}")
+
+
+if __name__ == "__main__":
+    with profiled("bench_parse"):
+        main()
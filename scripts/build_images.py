@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Build responsive WebP / AVIF renditions of the site images.
+
+Every raster image in assets/species, assets/cards, assets/factions and
+assets/locations (plus the page background) is decoded once and encoded
+as AVIF and WebP at a few widths around the size the site shows it at
+(RENDITION_WIDTHS: half, display and 2x for high-DPI screens). Widths
+above the source's own are never produced. Files are transcoded in a
+process pool, one source image per task.
+
+Outputs go to assets/build/, mirroring the source tree, with the source's
+content hash in the name (`species/chiss-400.3f2a9c1b07.avif`) so they
+can be served with a far-future cache lifetime. assets/build/images.json
+lists, per source (keyed by its path under assets/), its hash and size,
+every rendition and a ready-made `srcset` per MIME type:
+
+    "species/chiss.jpg": {
+        "sha256": "...", "width": 900, "height": 1280, "bytes": 364544,
+        "renditions": [{"format": "avif", "width": 200, "height": 284,
+                        "path": "assets/build/species/chiss-200.3f2a9c1b07.avif",
+                        "bytes": 5210}, ...],
+        "srcset": {"image/avif": "assets/build/species/chiss-200.3f2a9c1b07.avif 200w, ...",
+                   "image/webp": "..."}
+    }
+
+The front end gets the srcsets alone, as assets/build/images.js
+(`IMAGE_SOURCES`, keyed the same way), and offers them through
+<picture> sources (js/utils.js responsivePicture). CSS backgrounds
+(BACKGROUND_SELECTORS) get assets/build/images.css instead: an
+image-set() of the formats per rule, with a media query per width, which
+overrides the original in the stylesheets (kept for browsers without
+image-set type() support). The outputs are
+committed with the site, so rerun this after changing an image.
+
+The build is incremental: a source whose SHA-256 and the encoder settings
+match the manifest, and whose renditions are all on disk, is skipped.
+Renditions of removed or changed sources are deleted. SVGs are left
+alone (they are already resolution independent).
+
+Requirements:
+    pip install pillow   # with WebP and AVIF support (Pillow >= 11.3 wheels)
+
+Usage:
+    python build_images.py              # transcode what changed
+    python build_images.py --force      # transcode everything
+    python build_images.py --workers 2
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install pillow")
+    exit(1)
+
+from asset_store import ASSETS_DIR, file_sha256
+from downloader import ASSET_WIDTHS
+from metrics import METRICS, count, run_report, stage
+from profiling import add_profile_argument, profiled
+from site_data import version_include
+
+BUILD_DIR = ASSETS_DIR / "build"
+IMAGES_MANIFEST = BUILD_DIR / "images.json"
+IMAGES_SCRIPT = BUILD_DIR / "images.js"
+IMAGES_CSS = BUILD_DIR / "images.css"
+
+# Page backgrounds and location banners fill the viewport
+BACKDROP_WIDTHS = (640, 1280, 1920)
+
+
+def _display_widths(width: int) -> tuple[int, ...]:
+    return (width // 2, width, width * 2)
+
+
+# Source (directory or file under assets/) -> rendition widths
+RENDITION_WIDTHS = {
+    "species": _display_widths(ASSET_WIDTHS["species"]),
+    "cards": _display_widths(ASSET_WIDTHS["card"]),
+    "factions": _display_widths(ASSET_WIDTHS["faction"]),
+    "locations/planets": _display_widths(ASSET_WIDTHS["planet"]),
+    "locations/ambiance": BACKDROP_WIDTHS,
+    "background_space.png": BACKDROP_WIDTHS,
+}
+
+# Source -> CSS rule showing it as a background (css/effects.css)
+BACKGROUND_SELECTORS = {
+    "background_space.png": ".bg-img",
+}
+
+SOURCE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+
+# Encoder settings per output format, in srcset preference order
+FORMATS = {
+    "avif": {"mime": "image/avif", "save": {"format": "AVIF", "quality": 55, "speed": 6}},
+    "webp": {"mime": "image/webp", "save": {"format": "WEBP", "quality": 80, "method": 6}},
+}
+
+HASH_LENGTH = 10
+
+
+def settings_key(formats: list[str]) -> str:
+    """Hash of everything that shapes the outputs; a change rebuilds every image."""
+    settings = {"widths": RENDITION_WIDTHS, "formats": {f: FORMATS[f]["save"] for f in formats}}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def find_sources(assets_dir: Path = ASSETS_DIR) -> dict[str, tuple[Path, tuple[int, ...]]]:
+    """{key under assets/: (path, widths)} for every image to transcode."""
+    sources = {}
+    for name, widths in RENDITION_WIDTHS.items():
+        root = assets_dir / name
+        paths = [root] if root.is_file() else sorted(root.rglob("*"))
+        for path in paths:
+            if path.is_file() and path.suffix.lower() in SOURCE_EXTENSIONS:
+                sources[path.relative_to(assets_dir).as_posix()] = (path, widths)
+    return sources
+
+
+def target_widths(source_width: int, widths: tuple[int, ...]) -> list[int]:
+    """Rendition widths for a source, capped at its own width (never upscaled)."""
+    return sorted({min(width, source_width) for width in widths})
+
+
+def load_image(path: Path) -> Image.Image:
+    """Decode, apply EXIF rotation, and keep an alpha channel only if it is used."""
+    image = ImageOps.exif_transpose(Image.open(path))
+    has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+    image = image.convert("RGBA" if has_alpha else "RGB")
+    if has_alpha and image.getchannel("A").getextrema() == (255, 255):
+        image = image.convert("RGB")
+    return image
+
+
+def transcode(key: str, path: Path, sha256: str, widths: tuple[int, ...],
+              formats: list[str], build_dir: Path = BUILD_DIR) -> tuple[dict, dict]:
+    """Worker-process body: every rendition of one source (+ its timings)."""
+    METRICS.reset()
+    with stage("image.decode"):
+        image = load_image(path)
+
+    out_dir = build_dir / Path(key).parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(key).stem
+    renditions = []
+    for width in target_widths(image.width, widths):
+        height = max(1, round(image.height * width / image.width))
+        with stage("image.resize"):
+            scaled = image if width == image.width else image.resize(
+                (width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        for fmt in formats:
+            dest = out_dir / f"{stem}-{width}.{sha256[:HASH_LENGTH]}.{fmt}"
+            tmp = dest.with_name(dest.name + ".tmp")
+            with stage(f"image.encode.{fmt}"):
+                scaled.save(tmp, **FORMATS[fmt]["save"])
+            os.replace(tmp, dest)
+            size = dest.stat().st_size
+            count(f"bytes.{fmt}", size)
+            renditions.append({
+                "format": fmt, "width": width, "height": height,
+                "path": dest.relative_to(build_dir.parent.parent).as_posix(), "bytes": size,
+            })
+
+    entry = {
+        "sha256": sha256, "width": image.width, "height": image.height,
+        "bytes": path.stat().st_size, "renditions": renditions,
+        "srcset": {
+            # URL-encoded: a space would end the srcset candidate
+            FORMATS[fmt]["mime"]: ", ".join(f"{quote(r['path'])} {r['width']}w"
+                                            for r in renditions if r["format"] == fmt)
+            for fmt in formats
+        },
+    }
+    return entry, METRICS.snapshot()
+
+
+def display_rendition(entry: dict, fmt: str) -> dict:
+    """The 1x rendition: the middle width (half / display / 2x, after capping)."""
+    widths = sorted({r["width"] for r in entry["renditions"]})
+    width = widths[len(widths) // 2]
+    return next(r for r in entry["renditions"] if r["format"] == fmt and r["width"] == width)
+
+
+def up_to_date(entry: dict | None, sha256: str, root: Path) -> bool:
+    return entry is not None and entry["sha256"] == sha256 and all(
+        (root / r["path"]).exists() for r in entry["renditions"]
+    )
+
+
+def load_manifest(path: Path = IMAGES_MANIFEST) -> dict:
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {"settings": None, "images": {}}
+
+
+def save_manifest(manifest: dict, path: Path = IMAGES_MANIFEST) -> None:
+    manifest["images"] = dict(sorted(manifest["images"].items()))
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def images_js(manifest: dict) -> str:
+    lines = ["// Generated by scripts/build_images.py from assets/build/images.json, do not edit",
+             "const IMAGE_SOURCES = {"]
+    lines += [f"  {json.dumps(key)}: {json.dumps(entry['srcset'], separators=(', ', ': '))},"
+              for key, entry in manifest["images"].items()]
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def save_images_js(manifest: dict, path: Path = IMAGES_SCRIPT) -> None:
+    tmp = path.with_suffix(".js.tmp")
+    tmp.write_text(images_js(manifest), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _image_set(entry: dict, width: int, build_dir: Path) -> str:
+    root = build_dir.parent.parent
+    urls = [f'url("{quote((root / r["path"]).relative_to(build_dir).as_posix())}") '
+            f'type("{FORMATS[r["format"]]["mime"]}")'
+            for fmt in FORMATS for r in entry["renditions"] if r["format"] == fmt and r["width"] == width]
+    return f"image-set({', '.join(urls)})"
+
+
+def images_css(manifest: dict, build_dir: Path = BUILD_DIR) -> str:
+    """
+    background-image rules for BACKGROUND_SELECTORS: the smallest rendition
+    at least as wide as the viewport, in the first format the browser takes.
+    """
+    lines = ["/* Generated by scripts/build_images.py from assets/build/images.json, do not edit */"]
+    for key, selector in BACKGROUND_SELECTORS.items():
+        entry = manifest["images"].get(key)
+        if entry is None:
+            continue
+        widths = sorted({r["width"] for r in entry["renditions"]})
+        lines.append(f"{selector} {{ background-image: {_image_set(entry, widths[0], build_dir)}; }}")
+        for smaller, width in zip(widths, widths[1:]):
+            lines.append(f"@media (min-width: {smaller + 1}px) {{\n"
+                         f"  {selector} {{ background-image: {_image_set(entry, width, build_dir)}; }}\n}}")
+    return "\n".join(lines) + "\n"
+
+
+def save_images_css(manifest: dict, path: Path = IMAGES_CSS) -> None:
+    tmp = path.with_suffix(".css.tmp")
+    tmp.write_text(images_css(manifest), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def prune(manifest: dict, build_dir: Path = BUILD_DIR) -> int:
+    """Delete renditions no manifest entry refers to. Returns how many."""
+    root = build_dir.parent.parent
+    keep = {r["path"] for entry in manifest["images"].values() for r in entry["renditions"]}
+    # Only the trees mirroring RENDITION_WIDTHS: other build steps write next to them (sprites/)
+    owned = {Path(name).parts[0] for name in RENDITION_WIDTHS}
+    removed = 0
+    for fmt in FORMATS:
+        for path in build_dir.rglob(f"*.{fmt}"):
+            parts = path.relative_to(build_dir).parts
+            if len(parts) > 1 and parts[0] not in owned:
+                continue
+            if path.relative_to(root).as_posix() not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def build(workers: int, formats: list[str], force: bool = False) -> dict:
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    root = BUILD_DIR.parent.parent
+    manifest = load_manifest()
+    settings = settings_key(formats)
+    if manifest.get("settings") != settings:
+        if manifest["images"]:
+            print("Encoder settings changed, rebuilding every image")
+        force = True
+    manifest["settings"] = settings
+
+    sources = find_sources()
+    for key in set(manifest["images"]) - set(sources):
+        del manifest["images"][key]
+        count("images.removed")
+
+    todo = []
+    with stage("hash"):
+        for key, (path, widths) in sources.items():
+            sha256 = file_sha256(path)
+            if not force and up_to_date(manifest["images"].get(key), sha256, root):
+                count("images.skipped")
+            else:
+                todo.append((key, path, sha256, widths))
+    print(f"Sources: {len(sources)} ({len(sources) - len(todo)} up to date, {len(todo)} to transcode)")
+
+    if todo:
+        with ProcessPoolExecutor(workers) as pool, stage("transcode"):
+            futures = {pool.submit(transcode, key, path, sha256, widths, formats): key
+                       for key, path, sha256, widths in todo}
+            for done, future in enumerate(as_completed(futures), 1):
+                key = futures[future]
+                try:
+                    entry, timings = future.result()
+                except Exception as e:
+                    print(f"  [{done}/{len(todo)}] {key}: failed: {e}")
+                    count("images.failed")
+                    manifest["images"].pop(key, None)
+                    continue
+                METRICS.merge(timings)
+                count("images.transcoded")
+                manifest["images"][key] = entry
+                save_manifest(manifest)  # an interrupted build keeps what it finished
+                shown = display_rendition(entry, formats[0])
+                print(f"  [{done}/{len(todo)}] {key}: {entry['bytes'] // 1024} KB -> "
+                      f"{shown['bytes'] // 1024} KB {formats[0]} at {shown['width']}px")
+
+    removed = prune(manifest)
+    if removed:
+        print(f"Removed {removed} stale renditions")
+    with stage("write"):
+        save_manifest(manifest)
+        save_images_js(manifest)
+        save_images_css(manifest)
+    return manifest
+
+
+def main():
+    available = [fmt for fmt in FORMATS if features.check(fmt)]
+    parser = argparse.ArgumentParser(description="Build responsive WebP / AVIF renditions of the site images")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help=f"Transcode in N processes (default: {os.cpu_count()}, the number of cores)")
+    parser.add_argument("--formats", nargs="+", choices=list(FORMATS), default=available,
+                        help=f"Output formats (default: those this Pillow supports, {' '.join(available)})")
+    parser.add_argument("--force", action="store_true", help="Transcode every image, even unchanged ones")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    missing = [fmt for fmt in args.formats if not features.check(fmt)]
+    if missing:
+        parser.error(f"this Pillow build cannot write {', '.join(missing)}")
+
+    print("=" * 60)
+    print("Star Wars JDR - Responsive Images")
+    print("=" * 60)
+    manifest = build(args.workers, args.formats, args.force)
+    # Cache-bust the includes, the renditions they name change on a rebuild
+    for path in (IMAGES_SCRIPT, IMAGES_CSS):
+        version_include(path)
+
+    images = manifest["images"].values()
+    source_bytes = sum(entry["bytes"] for entry in images)
+    print("\n" + "=" * 60)
+    print(f"Images: {len(manifest['images'])}, originals {source_bytes / 1e6:.1f} MB")
+    for fmt in args.formats:
+        # What a 1x screen downloads
+        display = sum(display_rendition(entry, fmt)["bytes"] for entry in images)
+        print(f"  {fmt}: {display / 1e6:.1f} MB at display width")
+    print(f"Manifest: {IMAGES_MANIFEST} (srcsets: {IMAGES_SCRIPT.name}, {IMAGES_CSS.name})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    with run_report("build_images"), profiled("build_images"):
+        main()
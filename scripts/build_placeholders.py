@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Bake image dimensions and low-quality placeholders into the site data.
+
+For every image the front end shows for an entry of SPECIES, PLANETES,
+FACTIONS and DRAFT_CARDS (site_data.entity_images), this build step
+records
+
+    width, height   read from the file header only (image_header), no decode
+    color           dominant colour of the opaque pixels, "#rrggbb"
+    blurhash        a 4x3 (3x4 for portrait images) blurhash, ~30 characters
+
+and writes them to js/image_meta.js, keyed by table, entry id and image
+role ("image", or "banner" / "view" for planets). Loaded after data.js,
+that file attaches each entry's values as `entry.imageMeta`, so the UI
+can size an image box and paint its placeholder (utils.js
+placeholderStyle) before the image arrives.
+
+Colour and blurhash need pixels, but only a 32px thumbnail's worth: JPEGs
+are decoded at reduced scale in the DCT (Pillow draft mode), other formats
+are decoded and then shrunk. Transparent pixels are left out of the
+dominant colour and shown over the page background (--bg) in the blurhash.
+SVGs get their size only. Results are cached by content hash in
+.cache/placeholders.json, so a rebuild only samples new or changed images.
+
+Requirements:
+    pip install pillow
+
+Usage:
+    python build_placeholders.py
+"""
+
+import argparse
+import json
+import math
+import os
+import struct
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install pillow")
+    exit(1)
+
+from asset_store import file_sha256
+from image_header import ImageHeaderError, image_size
+from metrics import count, run_report, stage
+from profiling import add_profile_argument, profiled
+from site_data import entity_images, read_table
+
+OUTPUT_FILE = Path(__file__).parent.parent / "js" / "image_meta.js"
+CACHE_FILE = Path(__file__).parent / ".cache" / "placeholders.json"
+
+TABLES = ("SPECIES", "PLANETES", "FACTIONS", "DRAFT_CARDS")
+
+# Thumbnail the colour and blurhash are computed from
+SAMPLE_SIZE = 32
+# Page background (css/variables.css --bg) under transparent pixels
+BACKDROP = (4, 6, 11)
+
+BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+ATTACH_JS = """
+// Attach to the data.js entries (renderFactions reads the FACTION_SECTIONS objects)
+[
+  [SPECIES, IMAGE_META.SPECIES],
+  [PLANETES, IMAGE_META.PLANETES],
+  [FACTIONS, IMAGE_META.FACTIONS],
+  [FACTION_SECTIONS.flatMap(section => section.factions), IMAGE_META.FACTIONS],
+  [DRAFT_CARDS, IMAGE_META.DRAFT_CARDS],
+].forEach(([entries, meta]) => entries.forEach(entry => {
+  if (meta[entry.id]) entry.imageMeta = meta[entry.id];
+}));
+"""
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(BASE83[value // 83 ** (length - i - 1) % 83] for i in range(length))
+
+
+def _to_linear(value: int) -> float:
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    return round((v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055) * 255)
+
+
+def _pixels(image: Image.Image) -> list[tuple[int, ...]]:
+    data, bands = image.tobytes(), len(image.getbands())
+    return [tuple(data[i:i + bands]) for i in range(0, len(data), bands)]
+
+
+def blurhash(image: Image.Image, x_components: int, y_components: int) -> str:
+    """Blurhash (https://blurha.sh) of an RGB image; meant for thumbnails."""
+    width, height = image.size
+    pixels = [tuple(_to_linear(c) for c in pixel) for pixel in _pixels(image)]
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            norm = (1 if i == j == 0 else 2) / (width * height)
+            r = g = b = 0.0
+            for y in range(height):
+                basis_y = math.cos(math.pi * j * y / height)
+                row = pixels[y * width:(y + 1) * width]
+                for x, (pr, pg, pb) in enumerate(row):
+                    basis = basis_y * math.cos(math.pi * i * x / width)
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            factors.append((r * norm, g * norm, b * norm))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        quantised_max = max(0, min(82, math.floor(max(abs(c) for f in ac for c in f) * 166 - 0.5)))
+        maximum = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        maximum = 1
+        result += _base83(0, 1)
+    result += _base83((_to_srgb(dc[0]) << 16) + (_to_srgb(dc[1]) << 8) + _to_srgb(dc[2]), 4)
+    for factor in ac:
+        r, g, b = (max(0, min(18, math.floor(math.copysign(abs(c / maximum) ** 0.5, c) * 9 + 9.5)))
+                   for c in factor)
+        result += _base83(r * 19 * 19 + g * 19 + b, 2)
+    return result
+
+
+def dominant_color(image: Image.Image) -> str:
+    """Average of the most common 4-bit-per-channel colour bucket among opaque pixels."""
+    rgba = _pixels(image)
+    pixels = [p[:3] for p in rgba if p[3] >= 128] or [p[:3] for p in rgba]
+    buckets = Counter((r >> 4, g >> 4, b >> 4) for r, g, b in pixels)
+    top = buckets.most_common(1)[0][0]
+    members = [p for p in pixels if (p[0] >> 4, p[1] >> 4, p[2] >> 4) == top]
+    return "#" + "".join(f"{round(sum(p[c] for p in members) / len(members)):02x}" for c in range(3))
+
+
+def sample(path: Path) -> dict:
+    """Worker-process body: dominant colour and blurhash of one image."""
+    image = Image.open(path)
+    image.draft("RGB", (SAMPLE_SIZE * 2, SAMPLE_SIZE * 2))  # JPEG: decode at 1/2..1/8 scale
+    image = ImageOps.exif_transpose(image).convert("RGBA")
+    image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BILINEAR)
+
+    backdrop = Image.new("RGBA", image.size, BACKDROP + (255,))
+    flat = Image.alpha_composite(backdrop, image).convert("RGB")
+    components = (4, 3) if image.width >= image.height else (3, 4)
+    return {"color": dominant_color(image), "blurhash": blurhash(flat, *components)}
+
+
+def collect_images() -> dict[tuple[str, str, str], Path]:
+    """{(table, entry id, role): image} for every entry of TABLES."""
+    images = {}
+    for table in TABLES:
+        for entity in read_table(table):
+            found = entity_images(table, entity)
+            if not found:
+                print(f"    {table} {entity['id']}: no image")
+                count("placeholders.missing")
+            for role, path in found.items():
+                images[(table, entity["id"], role)] = path
+    return images
+
+
+def build(workers: int) -> dict:
+    cache = json.loads(CACHE_FILE.read_text(encoding="utf-8")) if CACHE_FILE.exists() else {}
+    images = collect_images()
+
+    meta: dict[tuple, dict] = {}
+    hashes: dict[tuple, str] = {}
+    with stage("header"):
+        for key, path in images.items():
+            try:
+                _, width, height = image_size(path)
+            except (ImageHeaderError, OSError, struct.error) as e:
+                print(f"    {path.name}: {e}")
+                count("placeholders.failed")
+                continue
+            meta[key] = {"width": width, "height": height}
+            if path.suffix.lower() != ".svg":
+                hashes[key] = file_sha256(path)
+
+    todo = {hashes[key]: images[key] for key in hashes if hashes[key] not in cache}
+    print(f"Images: {len(images)} ({len(hashes)} raster, {len(todo)} to sample)")
+    if todo:
+        with ProcessPoolExecutor(workers) as pool, stage("sample"):
+            for sha256, result in zip(todo, pool.map(sample, todo.values())):
+                cache[sha256] = result
+        count("placeholders.sampled", len(todo))
+    for key, sha256 in hashes.items():
+        meta[key].update(cache[sha256])
+
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    used = set(hashes.values())
+    CACHE_FILE.write_text(json.dumps({h: v for h, v in cache.items() if h in used}, indent=2) + "\n",
+                          encoding="utf-8")
+
+    tables: dict[str, dict] = {table: {} for table in TABLES}
+    for (table, entity_id, role), values in meta.items():
+        tables[table].setdefault(entity_id, {})[role] = values
+    return tables
+
+
+def image_meta_js(tables: dict) -> str:
+    lines = ["// Generated by scripts/build_placeholders.py from the images in assets/, do not edit",
+             "const IMAGE_META = {"]
+    for table, entries in tables.items():
+        lines.append(f"  {table}: {{")
+        lines += [f"    {json.dumps(entity_id)}: {json.dumps(roles, separators=(', ', ': '))},"
+                  for entity_id, roles in entries.items()]
+        lines.append("  },")
+    lines.append("};")
+    return "\n".join(lines) + "\n" + ATTACH_JS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake image sizes and placeholders into js/image_meta.js")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help=f"Sample images in N processes (default: {os.cpu_count()}, the number of cores)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help="Output JS file")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Star Wars JDR - Image Placeholders")
+    print("=" * 60)
+    tables = build(args.workers)
+
+    with stage("write"):
+        tmp = args.output.with_name(args.output.name + ".tmp")
+        tmp.write_text(image_meta_js(tables), encoding="utf-8")
+        os.replace(tmp, args.output)
+
+    print("\n" + "=" * 60)
+    for table, entries in tables.items():
+        print(f"{table}: {len(entries)} entries")
+    print(f"Saved to: {args.output} ({args.output.stat().st_size / 1024:.1f} KB)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    with run_report("build_placeholders"), profiled("build_placeholders"):
+        main()
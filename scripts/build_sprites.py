@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Pack the species, faction and draft card thumbnails into sprite atlases.
+
+The species list, the faction gauges and the draft cards each showed one
+image per entity, i.e. one request per species / faction / card. This
+build step draws the thumbnail of every entity of a group, at twice its
+on-screen size for high-DPI screens, into a few sheets
+(SPRITE_GROUPS):
+
+    species   64x64 box, image fitted inside it     (renderSpecies)
+    factions  42x42 box, image fitted inside it     (renderFactions)
+    cards     150x70 box, cropped to it, top kept   (createDraftCardElement)
+
+Thumbnails are placed with a bottom-left skyline packer on sheets at most
+SHEET_SIZE wide and high, with a transparent gutter so neighbours do not
+bleed in when the browser scales. Each sheet is written as AVIF and WebP
+(build_images.FORMATS) to assets/build/sprites/, content hash in the
+name. The coordinate map is written three ways, all keyed by the `id` of
+the entity in js/data.js:
+
+    sprites.json  sheets and pixel rectangles, for tooling
+    sprites.css   `.sprite.sprite-<group>-<id>` rules (size, sheet,
+                  percentage background position, so a sprite can also
+                  be drawn at another size with the same aspect ratio)
+    sprites.js    `const SPRITES = {group: [ids]}`, which the front end
+                  checks before using a sprite instead of the image
+
+Entities are read from js/data.js (site_data) and their image located the
+way the front end does. SVG images are not rasterized: those entities
+keep their own image.
+
+A group is only rebuilt when one of its images, its entity list or the
+settings changed.
+
+Requirements:
+    pip install pillow
+
+Usage:
+    python build_sprites.py
+    python build_sprites.py --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install pillow")
+    exit(1)
+
+from asset_store import file_sha256
+from build_images import BUILD_DIR, FORMATS, HASH_LENGTH, load_image
+from metrics import count, run_report, stage
+from profiling import add_profile_argument, profiled
+from site_data import entity_images, read_table, version_include
+
+SPRITE_DIR = BUILD_DIR / "sprites"
+SPRITES_JSON = SPRITE_DIR / "sprites.json"
+SPRITES_CSS = SPRITE_DIR / "sprites.css"
+SPRITES_JS = SPRITE_DIR / "sprites.js"
+
+# Device pixels per CSS pixel in the sheets
+SPRITE_SCALE = 2
+# Maximum sheet width / height (device pixels)
+SHEET_SIZE = 1024
+# Transparent border around each sprite (device pixels)
+GUTTER = 2
+
+
+class SpriteGroup(NamedTuple):
+    table: str                  # data.js constant listing the entities
+    box: tuple[int, int]        # on-screen size (CSS pixels)
+    crop: bool                  # cover the box (crop) instead of fitting inside it
+
+
+SPRITE_GROUPS = {
+    "species": SpriteGroup("SPECIES", (64, 64), crop=False),
+    "factions": SpriteGroup("FACTIONS", (42, 42), crop=False),
+    "cards": SpriteGroup("DRAFT_CARDS", (150, 70), crop=True),
+}
+
+
+def group_sources(group: SpriteGroup) -> dict[str, Path]:
+    """{entity id: raster image} for a group, in data.js order."""
+    sources = {}
+    for entity in read_table(group.table):
+        path = entity_images(group.table, entity).get("image")
+        if path is None:
+            print(f"    {entity['id']}: no image")
+            count("sprites.missing")
+        elif path.suffix.lower() == ".svg":
+            count("sprites.vector")
+        else:
+            sources[entity["id"]] = path
+    return sources
+
+
+def thumbnail(path: Path, box: tuple[int, int], crop: bool) -> Image.Image:
+    """Worker-process body: `path` covering or fitted in `box`, at SPRITE_SCALE."""
+    image = load_image(path)
+    width, height = box
+    if crop:
+        return ImageOps.fit(image, (width * SPRITE_SCALE, height * SPRITE_SCALE),
+                            Image.Resampling.LANCZOS, centering=(0.5, 0.0))
+    scale = min(width / image.width, height / image.height)
+    size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+    return image.resize((size[0] * SPRITE_SCALE, size[1] * SPRITE_SCALE), Image.Resampling.LANCZOS,
+                        reducing_gap=3.0)
+
+
+class Skyline:
+    """Bottom-left skyline packer for one sheet of fixed maximum size."""
+
+    def __init__(self, width: int, height: int):
+        self.width, self.max_height = width, height
+        self.segments = [(0, 0, width)]  # (x, y, width) of the skyline, left to right
+
+    def _rest(self, i: int, width: int) -> int | None:
+        """Height at which a `width`-wide rectangle starting at segment i rests."""
+        x = self.segments[i][0]
+        if x + width > self.width:
+            return None
+        y, j = 0, i
+        while x + width > self.segments[j][0]:
+            y = max(y, self.segments[j][1])
+            j += 1
+            if j == len(self.segments):
+                break
+        return y
+
+    def insert(self, width: int, height: int) -> tuple[int, int] | None:
+        """Place a rectangle as low (then as far left) as it fits; None when the sheet is full."""
+        best = None
+        for i, (x, _, _) in enumerate(self.segments):
+            y = self._rest(i, width)
+            if y is not None and y + height <= self.max_height and (best is None or (y + height, x) < best[0]):
+                best = ((y + height, x), i, x, y)
+        if best is None:
+            return None
+        _, i, x, y = best
+        end = x + width
+        segments = self.segments[:i] + [(x, y + height, width)]
+        for sx, sy, sw in self.segments[i:]:
+            if sx + sw > end:
+                segments.append((max(sx, end), sy, sx + sw - max(sx, end)))
+        merged = [segments[0]]
+        for sx, sy, sw in segments[1:]:
+            if sy == merged[-1][1]:
+                merged[-1] = (merged[-1][0], sy, merged[-1][2] + sw)
+            else:
+                merged.append((sx, sy, sw))
+        self.segments = merged
+        return x, y
+
+
+def pack(sizes: dict[str, tuple[int, int]]) -> list[dict[str, tuple[int, int]]]:
+    """Assign every (gutter-padded) rectangle to a sheet: [{id: (x, y)}, ...]."""
+    sheets: list[tuple[Skyline, dict]] = []
+    for key, (width, height) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0])):
+        cell = (width + 2 * GUTTER, height + 2 * GUTTER)
+        for skyline, placed in sheets:
+            position = skyline.insert(*cell)
+            if position:
+                break
+        else:
+            skyline, placed = Skyline(SHEET_SIZE, SHEET_SIZE), {}
+            sheets.append((skyline, placed))
+            position = skyline.insert(*cell)
+            if position is None:
+                raise ValueError(f"{key}: {width}x{height} does not fit on a {SHEET_SIZE}px sheet")
+        placed[key] = (position[0] + GUTTER, position[1] + GUTTER)
+    return [placed for _, placed in sheets]
+
+
+def group_key(sources: dict[str, str]) -> str:
+    """Hash of the group's images (by content) and the settings that shape the sheets."""
+    settings = {"sources": sources, "scale": SPRITE_SCALE, "sheet": SHEET_SIZE, "gutter": GUTTER,
+                "groups": SPRITE_GROUPS, "formats": {f: spec["save"] for f, spec in FORMATS.items()}}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+
+def build_group(name: str, group: SpriteGroup, pool: ProcessPoolExecutor, previous: dict | None,
+                force: bool) -> dict:
+    sources = group_sources(group)
+    with stage("hash"):
+        key = group_key({entity_id: file_sha256(path) for entity_id, path in sources.items()})
+    if not force and previous and previous["key"] == key and all(
+        (SPRITE_DIR / file).exists() for sheet in previous["sheets"] for file in sheet["files"].values()
+    ):
+        print(f"{name}: {len(previous['sprites'])} sprites, up to date")
+        count("sprites.groups_skipped")
+        return previous
+
+    with stage("sprites.thumbnail"):
+        thumbs = dict(zip(sources, pool.map(thumbnail, sources.values(),
+                                            [group.box] * len(sources), [group.crop] * len(sources))))
+    with stage("sprites.pack"):
+        layout = pack({entity_id: thumb.size for entity_id, thumb in thumbs.items()})
+
+    sheets, sprites = [], {}
+    for index, placed in enumerate(layout):
+        width = max(x + thumbs[i].width for i, (x, _) in placed.items()) + GUTTER
+        height = max(y + thumbs[i].height for i, (_, y) in placed.items()) + GUTTER
+        sheet = Image.new("RGBA", (width, height))
+        for entity_id, (x, y) in placed.items():
+            sheet.paste(thumbs[entity_id], (x, y))
+            sprites[entity_id] = {"sheet": index, "x": x, "y": y,
+                                  "width": thumbs[entity_id].width, "height": thumbs[entity_id].height}
+        files = {}
+        for fmt, spec in FORMATS.items():
+            dest = SPRITE_DIR / f"{name}-{index}.{key[:HASH_LENGTH]}.{fmt}"
+            with stage(f"image.encode.{fmt}"):
+                sheet.save(dest, **spec["save"])
+            count(f"bytes.{fmt}", dest.stat().st_size)
+            files[spec["mime"]] = dest.name
+        sheets.append({"width": width, "height": height, "files": files})
+        count("sprites.sheets")
+
+    count("sprites.packed", len(sprites))
+    dimensions = ", ".join(f"{sheet['width']}x{sheet['height']}" for sheet in sheets)
+    print(f"{name}: {len(sprites)} sprites on {len(sheets)} sheet(s) ({dimensions})")
+    return {"key": key, "box": list(group.box), "scale": SPRITE_SCALE, "sheets": sheets,
+            "sprites": {entity_id: sprites[entity_id] for entity_id in sources}}
+
+
+def _pct(value: float) -> str:
+    return f"{value:.4f}".rstrip("0").rstrip(".") + "%"
+
+
+def _percent(offset: int, size: int, sheet: int) -> str:
+    """background-position percentage that shows the sprite at `offset`."""
+    return "0%" if sheet == size else _pct(offset / (sheet - size) * 100)
+
+
+def sprite_css(groups: dict[str, dict]) -> str:
+    """The `.sprite-<group>-<id>` rules for every packed sprite."""
+    lines = ["/* Generated by scripts/build_sprites.py, do not edit */",
+             ".sprite { display: inline-block; background-repeat: no-repeat; }"]
+    for name, group in groups.items():
+        for index, sheet in enumerate(group["sheets"]):
+            members = [i for i, sprite in group["sprites"].items() if sprite["sheet"] == index]
+            urls = ", ".join(f'url("{file}") type("{mime}")' for mime, file in sheet["files"].items())
+            fallback = sheet["files"]["image/webp"] if "image/webp" in sheet["files"] else next(iter(sheet["files"].values()))
+            lines.append(",\n".join(f".sprite.sprite-{name}-{i}" for i in members) + " {\n"
+                         f'  background-image: url("{fallback}");\n'
+                         f"  background-image: image-set({urls});\n}}")
+            for entity_id in members:
+                sprite = group["sprites"][entity_id]
+                w, h = sprite["width"], sprite["height"]
+                lines.append(
+                    f".sprite.sprite-{name}-{entity_id} {{ "
+                    f"width: {w / group['scale']:g}px; height: {h / group['scale']:g}px; "
+                    f"background-size: {_pct(sheet['width'] / w * 100)} {_pct(sheet['height'] / h * 100)}; "
+                    f"background-position: {_percent(sprite['x'], w, sheet['width'])} "
+                    f"{_percent(sprite['y'], h, sheet['height'])}; }}"
+                )
+    return "\n".join(lines) + "\n"
+
+
+def prune(groups: dict[str, dict]) -> int:
+    keep = {file for group in groups.values() for sheet in group["sheets"] for file in sheet["files"].values()}
+    removed = 0
+    for fmt in FORMATS:
+        for path in SPRITE_DIR.glob(f"*.{fmt}"):
+            if path.name not in keep:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def write_text(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack species, faction and card thumbnails into sprite atlases")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help=f"Make thumbnails in N processes (default: {os.cpu_count()}, the number of cores)")
+    parser.add_argument("--force", action="store_true", help="Rebuild every group, even unchanged ones")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Star Wars JDR - Sprite Atlases")
+    print("=" * 60)
+    SPRITE_DIR.mkdir(parents=True, exist_ok=True)
+    previous = json.loads(SPRITES_JSON.read_text(encoding="utf-8")) if SPRITES_JSON.exists() else {}
+
+    with ProcessPoolExecutor(args.workers) as pool:
+        groups = {name: build_group(name, group, pool, previous.get(name), args.force)
+                  for name, group in SPRITE_GROUPS.items()}
+
+    with stage("write"):
+        write_text(SPRITES_JSON, json.dumps(groups, indent=2) + "\n")
+        write_text(SPRITES_CSS, sprite_css(groups))
+        ids = {name: list(group["sprites"]) for name, group in groups.items()}
+        write_text(SPRITES_JS, "// Generated by scripts/build_sprites.py, do not edit\n"
+                               f"const SPRITES = {json.dumps(ids)};\n")
+        # Cache-bust the includes, the sheets they name change on a rebuild
+        for path in (SPRITES_CSS, SPRITES_JS):
+            version_include(path)
+    removed = prune(groups)
+
+    sheets = [sheet for group in groups.values() for sheet in group["sheets"]]
+    print("\n" + "=" * 60)
+    print(f"Sprites: {sum(len(g['sprites']) for g in groups.values())} on {len(sheets)} sheets"
+          + (f", {removed} stale sheet files removed" if removed else ""))
+    for mime in ("image/avif", "image/webp"):
+        size = sum((SPRITE_DIR / s["files"][mime]).stat().st_size for s in sheets if mime in s["files"])
+        print(f"  {mime}: {size / 1024:.0f} KB")
+    print(f"Map: {SPRITES_CSS}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    with run_report("build_sprites"), profiled("build_sprites"):
+        main()
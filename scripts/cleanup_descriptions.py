@@ -6,14 +6,19 @@ Clean up scraped species descriptions by:
 3. Keeping only the most relevant lore
 """
 
+import argparse
 import json
 import re
 from pathlib import Path
 
+from metrics import run_report, stage, timed
+from profiling import add_profile_argument, profiled
+
 INPUT_FILE = Path(__file__).parent.parent / "js" / "species_descriptions.json"
 OUTPUT_FILE = INPUT_FILE  # Overwrite
 
-# Patterns to remove
+# Patterns to remove (infobox text that leaked into descriptions scraped before
+# the extractors learned to skip the infobox, see infobox.element_text)
 METADATA_PATTERNS = [
     r'Biological classification\s*',
     r'Designation\s+Sentient\s*',
@@ -124,6 +129,7 @@ def extract_key_paragraphs(text: str, max_length: int = 1200) -> str:
     return final_text
 
 
+@timed("extract.process_description")
 def process_description(text: str) -> str:
     """Full processing pipeline for a description."""
     # Step 1: Remove metadata
@@ -145,6 +151,10 @@ def process_description(text: str) -> str:
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Clean up the scraped species descriptions")
+    add_profile_argument(parser)
+    parser.parse_args()
+    
     print("=" * 60)
     print("Species Description Cleanup")
     print("=" * 60)
@@ -165,7 +175,7 @@ def main():
         print(f"  {species_id}: {original_len} -> {len(cleaned_text)} chars")
     
     # Save
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f, stage("write"):
         json.dump(cleaned, f, ensure_ascii=False, indent=2)
     
     print(f"\nSaved cleaned descriptions to {OUTPUT_FILE}")
@@ -173,4 +183,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("cleanup_descriptions"), profiled("cleanup_descriptions"):
+        main()
@@ -10,22 +10,29 @@ Requirements:
 
 Usage:
     python download_faction_images.py
+    python download_faction_images.py --backend api  # batched api.php queries
 """
 
+import argparse
 import os
-import re
-import time
 from pathlib import Path
 from urllib.parse import quote
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from asset_store import existing_asset, fetch_asset
+from downloader import ASSET_WIDTHS, FANDOM_IMAGE_HOST, full_size_url
+from mediawiki_api import MediaWikiAPI, original_image_url
+from metrics import run_report, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+
 # Base paths
 SCRIPT_DIR = Path(__file__).parent
 PROJECT_ROOT = SCRIPT_DIR.parent
@@ -37,9 +44,13 @@ FACTIONS_DIR.mkdir(parents=True, exist_ok=True)
 CARDS_DIR.mkdir(parents=True, exist_ok=True)
 
 # Base URL for Wookieepedia
-BASE_URL = "https://starwars.fandom.com/wiki/"
+BASE_URL = f"{wiki_http.WOOKIEEPEDIA_WIKI}/wiki/"
 REQUEST_DELAY = 0.8
 
+# Display widths: faction emblems are small hexes, cards are full card art
+FACTION_IMAGE_WIDTH = ASSET_WIDTHS["faction"]
+CARD_IMAGE_WIDTH = ASSET_WIDTHS["card"]
+
 # =============================================================================
 # FACTION DATA - Maps faction ID to wiki page name
 # =============================================================================
@@ -109,29 +120,30 @@ CARD_PAGES = {
 def get_soup(url: str) -> BeautifulSoup | None:
     """Fetch a page and return a BeautifulSoup object."""
     print(f"  Fetching: {url}")
-    try:
-        response = requests.get(url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
-        return BeautifulSoup(response.text, "lxml")
-    except Exception as e:
-        print(f"    Error fetching page: {e}")
-        return None
+    return wiki_http.try_get_soup(url, delay=REQUEST_DELAY)
 
 
-def get_page_image(wiki_page: str) -> str | None:
+def get_page_image(wiki_page: str, api_pages: dict | None = None) -> str | None:
     """
     Get the main image URL from a wiki page.
     Returns the image URL or None.
+    If `api_pages` (from a batched api.php query) is given, no page is fetched.
     """
+    if api_pages is not None:
+        return original_image_url(api_pages.get(wiki_page))
+    
     url = BASE_URL + wiki_page
     soup = get_soup(url)
     
     if not soup:
         return None
     
+    return extract_page_image(soup)
+
+
+@timed("extract.page_image")
+def extract_page_image(soup: BeautifulSoup) -> str | None:
+    """Find the main image URL of a parsed wiki page."""
     image_url = None
     
     # --- Strategy 1: Look for infobox image (most reliable for faction pages) ---
@@ -140,10 +152,9 @@ def get_page_image(wiki_page: str) -> str | None:
         img = infobox.find("img")
         if img:
             src = img.get("data-src") or img.get("src")
-            if src and "static.wikia.nocookie.net" in src:
+            if src and FANDOM_IMAGE_HOST in src:
                 # Get full resolution by removing scaling parameters
-                image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-                image_url = re.sub(r"/revision/latest.*$", "", image_url)
+                image_url = full_size_url(src)
                 print(f"    Found infobox image")
                 return image_url
     
@@ -153,9 +164,8 @@ def get_page_image(wiki_page: str) -> str | None:
         img = figure.find("img")
         if img:
             src = img.get("data-src") or img.get("src")
-            if src and "static.wikia.nocookie.net" in src:
-                image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-                image_url = re.sub(r"/revision/latest.*$", "", image_url)
+            if src and FANDOM_IMAGE_HOST in src:
+                image_url = full_size_url(src)
                 print(f"    Found figure image")
                 return image_url
     
@@ -168,9 +178,8 @@ def get_page_image(wiki_page: str) -> str | None:
             img = img_link.find("img")
             if img:
                 src = img.get("data-src") or img.get("src")
-                if src and "static.wikia.nocookie.net" in src:
-                    image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-                    image_url = re.sub(r"/revision/latest.*$", "", image_url)
+                if src and FANDOM_IMAGE_HOST in src:
+                    image_url = full_size_url(src)
                     print(f"    Found content image")
                     return image_url
     
@@ -178,53 +187,33 @@ def get_page_image(wiki_page: str) -> str | None:
     all_imgs = soup.find_all("img")
     for img in all_imgs:
         src = img.get("data-src") or img.get("src")
-        if src and "static.wikia.nocookie.net" in src and "/images/" in src:
+        if src and FANDOM_IMAGE_HOST in src and "/images/" in src:
             # Skip tiny icons and UI elements
             if "scale-to-width-down/20" in src or "scale-to-width-down/16" in src:
                 continue
             if "Icon" in src or "icon" in src:
                 continue
-            image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-            image_url = re.sub(r"/revision/latest.*$", "", image_url)
+            image_url = full_size_url(src)
             print(f"    Found fallback image")
             return image_url
     
     return None
 
 
-def download_image(url: str, output_path: Path) -> bool:
-    """Download an image and save it."""
+def download_image(url: str, output_path: Path, width: int | None = None,
+                   original_sha1: str | None = None) -> bool:
+    """
+    Download an image at `width` px and save it (extension sniffed from the file).
+    `original_sha1` (api backend) verifies it when the original is downloaded.
+    """
     if not url:
         return False
         
     try:
         print(f"  Downloading image...")
-        # Add revision/latest back for download
-        download_url = url + "/revision/latest"
-        
-        response = requests.get(download_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
+        result = fetch_asset(url, output_path, width, original_sha1)
         
-        # Determine extension from URL
-        if ".png" in url.lower():
-            ext = ".png"
-        elif ".gif" in url.lower():
-            ext = ".gif"
-        elif ".webp" in url.lower():
-            ext = ".webp"
-        elif ".svg" in url.lower():
-            ext = ".svg"
-        else:
-            ext = ".jpg"
-        
-        filepath = output_path.with_suffix(ext)
-        
-        with open(filepath, "wb") as f:
-            f.write(response.content)
-        
-        print(f"  ✓ Saved: {filepath.name}")
+        print(f"  ✓ Saved: {result.path.name}")
         return True
         
     except Exception as e:
@@ -232,7 +221,20 @@ def download_image(url: str, output_path: Path) -> bool:
         return False
 
 
-def download_faction_images():
+def query_page_images(wiki_pages: list[str]) -> tuple[dict, dict[str, str]]:
+    """
+    Batch-fetch the lead image of many pages through api.php, and the SHA-1
+    of each image file. Returns (pages, {image url: sha1}).
+    """
+    api = MediaWikiAPI(BASE_URL, delay=REQUEST_DELAY)
+    pages = api.query_pages(wiki_pages, props=("pageimages",))
+    digests = api.image_digests([original_image_url(page) for page in pages.values()])
+    print(f"Fetched {len(pages)} page images and {len(digests)} checksums in {api.request_count} API requests")
+    return pages, digests
+
+
+def download_faction_images(api_pages: dict | None = None, width: int | None = FACTION_IMAGE_WIDTH,
+                            refresh: bool = False, digests: dict[str, str] | None = None):
     """Download all faction logos/emblems."""
     print("\n" + "=" * 60)
     print("DOWNLOADING FACTION IMAGES")
@@ -246,14 +248,14 @@ def download_faction_images():
         output_path = FACTIONS_DIR / faction_id
         
         # Check if already downloaded
-        existing = list(FACTIONS_DIR.glob(f"{faction_id}.*"))
+        existing = existing_asset(output_path, refresh)
         if existing:
-            print(f"  Already exists: {existing[0].name}")
+            print(f"  Already exists: {existing.name}")
             success_count += 1
             continue
         
-        image_url = get_page_image(wiki_page)
-        if image_url and download_image(image_url, output_path):
+        image_url = get_page_image(wiki_page, api_pages)
+        if image_url and download_image(image_url, output_path, width, (digests or {}).get(image_url)):
             success_count += 1
         else:
             fail_count += 1
@@ -264,7 +266,8 @@ def download_faction_images():
     return success_count, fail_count
 
 
-def download_card_images():
+def download_card_images(api_pages: dict | None = None, width: int | None = CARD_IMAGE_WIDTH,
+                         refresh: bool = False, digests: dict[str, str] | None = None):
     """Download card-relevant images."""
     print("\n" + "=" * 60)
     print("DOWNLOADING CARD IMAGES")
@@ -278,14 +281,14 @@ def download_card_images():
         output_path = CARDS_DIR / card_id
         
         # Check if already downloaded
-        existing = list(CARDS_DIR.glob(f"{card_id}.*"))
+        existing = existing_asset(output_path, refresh)
         if existing:
-            print(f"  Already exists: {existing[0].name}")
+            print(f"  Already exists: {existing.name}")
             success_count += 1
             continue
         
-        image_url = get_page_image(wiki_page)
-        if image_url and download_image(image_url, output_path):
+        image_url = get_page_image(wiki_page, api_pages)
+        if image_url and download_image(image_url, output_path, width, (digests or {}).get(image_url)):
             success_count += 1
         else:
             fail_count += 1
@@ -298,13 +301,31 @@ def download_card_images():
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Download faction and card images")
+    parser.add_argument("--backend", choices=["html", "api"], default="html",
+                        help="Scrape rendered pages (html) or query api.php in batches (api)")
+    parser.add_argument("--full-size", action="store_true",
+                        help="Download original images instead of scaled renditions")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Download managed images again and report the ones that changed upstream")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+    
     print("SWTOR Faction & Card Image Downloader")
     print("=" * 60)
     print(f"Factions directory: {FACTIONS_DIR}")
     print(f"Cards directory: {CARDS_DIR}")
     
-    faction_success, faction_fail = download_faction_images()
-    card_success, card_fail = download_card_images()
+    api_pages, digests = None, {}
+    if args.backend == "api":
+        api_pages, digests = query_page_images(list(FACTION_PAGES.values()) + list(CARD_PAGES.values()))
+    
+    faction_width = None if args.full_size else FACTION_IMAGE_WIDTH
+    card_width = None if args.full_size else CARD_IMAGE_WIDTH
+    faction_success, faction_fail = download_faction_images(api_pages, faction_width, args.refresh, digests)
+    card_success, card_fail = download_card_images(api_pages, card_width, args.refresh, digests)
     
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -315,4 +336,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("download_faction_images"), profiled("download_faction_images"):
+        main()
@@ -8,22 +8,29 @@ Requirements:
 
 Usage:
     python download_species_images.py
+    python download_species_images.py --backend api  # batched api.php queries
 """
 
+import argparse
 import json
-import re
-import time
 from pathlib import Path
 from urllib.parse import quote
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from asset_store import existing_asset, fetch_asset
+from downloader import ASSET_WIDTHS, FANDOM_IMAGE_HOST, full_size_url
+from mediawiki_api import MediaWikiAPI, original_image_url
+from metrics import run_report, stage, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+
 # Species to download - maps to wiki page names
 SPECIES_LIST = [
     ("humain", "Human"),
@@ -63,38 +70,42 @@ SPECIES_LIST = [
     ("voss", "Voss")
 ]
 
-BASE_URL = "https://swse.fandom.com/wiki/"
+BASE_URL = f"{wiki_http.SWSE_WIKI}/wiki/"
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "species"
 DESCRIPTIONS_FILE = Path(__file__).parent.parent / "js" / "species_descriptions.json"
 REQUEST_DELAY = 0.8
 
+# Species portraits are shown at card size; fetch that rendition, not the original
+IMAGE_WIDTH = ASSET_WIDTHS["species"]
+
 
 def get_soup(url: str) -> BeautifulSoup | None:
     """Fetch a page and return a BeautifulSoup object."""
     print(f"  Fetching: {url}")
-    try:
-        response = requests.get(url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
-        return BeautifulSoup(response.text, "lxml")
-    except Exception as e:
-        print(f"    Error fetching page: {e}")
-        return None
+    return wiki_http.try_get_soup(url, delay=REQUEST_DELAY)
 
 
-def get_species_data(wiki_page: str) -> tuple[str | None, str | None]:
+def get_species_data(wiki_page: str, api_pages: dict | None = None) -> tuple[str | None, str | None]:
     """
     Get the image URL and description from a species wiki page.
     Returns (image_url, description) tuple.
+    If `api_pages` (from a batched api.php query) is given, no page is fetched.
     """
+    if api_pages is not None:
+        return get_species_data_api(api_pages.get(wiki_page))
+    
     url = BASE_URL + quote(wiki_page, safe="()_")
     soup = get_soup(url)
     
     if not soup:
         return None, None
     
+    return extract_species_data(soup)
+
+
+@timed("extract.species_data")
+def extract_species_data(soup: BeautifulSoup) -> tuple[str | None, str | None]:
+    """Extract (image_url, description) from a parsed species page."""
     image_url = None
     description = None
     
@@ -112,10 +123,9 @@ def get_species_data(wiki_page: str) -> tuple[str | None, str | None]:
         if img:
             # Try data-src first (lazy loaded), then src
             src = img.get("data-src") or img.get("src")
-            if src and "static.wikia.nocookie.net" in src:
+            if src and FANDOM_IMAGE_HOST in src:
                 # Get full resolution by removing scaling parameters
-                image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-                image_url = re.sub(r"/revision/latest.*$", "", image_url)
+                image_url = full_size_url(src)
     
     # Fallback: look for any image in an aside (infobox)
     if not image_url:
@@ -125,8 +135,7 @@ def get_species_data(wiki_page: str) -> tuple[str | None, str | None]:
             if img:
                 src = img.get("data-src") or img.get("src")
                 if src:
-                    image_url = re.sub(r"/scale-to-width-down/\d+", "", src)
-                    image_url = re.sub(r"/revision/latest.*$", "", image_url)
+                    image_url = full_size_url(src)
     
     # --- Get Description ---
     # Get paragraphs before the first heading (h2/h3)
@@ -152,37 +161,34 @@ def get_species_data(wiki_page: str) -> tuple[str | None, str | None]:
     return image_url, description
 
 
-def download_image(url: str, filename: str) -> bool:
-    """Download an image and save it."""
+def get_species_data_api(page: dict | None) -> tuple[str | None, str | None]:
+    """Same as get_species_data, from a pageimages+extracts API result."""
+    if not page:
+        return None, None
+    
+    desc_parts = [line.strip() for line in page.get("extract", "").split("\n")
+                  if len(line.strip()) > 20]
+    description = " ".join(desc_parts) or None
+    if description and len(description) > 800:
+        description = description[:797] + "..."
+    
+    return original_image_url(page), description
+
+
+def download_image(url: str, filename: str, width: int | None = IMAGE_WIDTH,
+                   original_sha1: str | None = None) -> bool:
+    """
+    Download an image at `width` px and save it (extension sniffed from the file).
+    `original_sha1` (api backend) verifies it when the original is downloaded.
+    """
     if not url:
         return False
         
     try:
         print(f"  Downloading image...")
-        # Add revision/latest back for download
-        download_url = url + "/revision/latest"
-        
-        response = requests.get(download_url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
-        
-        # Determine extension from URL
-        if ".png" in url.lower():
-            ext = ".png"
-        elif ".gif" in url.lower():
-            ext = ".gif"
-        elif ".webp" in url.lower():
-            ext = ".webp"
-        else:
-            ext = ".jpg"
-        
-        filepath = OUTPUT_DIR / f"{filename}{ext}"
-        
-        with open(filepath, "wb") as f:
-            f.write(response.content)
+        result = fetch_asset(url, OUTPUT_DIR / filename, width, original_sha1)
             
-        print(f"    Saved: {filepath.name} ({len(response.content) // 1024} KB)")
+        print(f"    Saved: {result.path.name} ({result.size // 1024} KB)")
         return True
     except Exception as e:
         print(f"    Download failed: {e}")
@@ -191,6 +197,19 @@ def download_image(url: str, filename: str) -> bool:
 
 def main():
     """Download all species images and descriptions."""
+    parser = argparse.ArgumentParser(description="Download species images and descriptions")
+    parser.add_argument("--backend", choices=["html", "api"], default="html",
+                        help="Scrape rendered pages (html) or query api.php in batches (api)")
+    parser.add_argument("--full-size", action="store_true",
+                        help="Download original images instead of IMAGE_WIDTH px renditions")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Download managed images again and report the ones that changed upstream")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+    width = None if args.full_size else IMAGE_WIDTH
+    
     print("=" * 60)
     print("Star Wars JDR - Species Data Downloader")
     print("=" * 60)
@@ -199,6 +218,16 @@ def main():
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     print(f"\nOutput folder: {OUTPUT_DIR}")
     
+    api_pages = None
+    digests = {}
+    if args.backend == "api":
+        api = MediaWikiAPI(BASE_URL, delay=REQUEST_DELAY)
+        api_pages = api.query_pages([wiki_page for _, wiki_page in SPECIES_LIST],
+                                    props=("pageimages", "extracts"))
+        digests = api.image_digests([original_image_url(page) for page in api_pages.values()])
+        print(f"Fetched {len(api_pages)} pages and {len(digests)} image checksums "
+              f"in {api.request_count} API requests")
+    
     img_success = 0
     img_failed = 0
     descriptions = {}
@@ -207,24 +236,20 @@ def main():
         print(f"\n[{species_id}] -> {wiki_page}")
         
         # Check if image already exists
-        existing_img = None
-        for ext in [".png", ".jpg", ".gif", ".webp"]:
-            if (OUTPUT_DIR / f"{species_id}{ext}").exists():
-                existing_img = ext
-                break
+        existing_img = existing_asset(OUTPUT_DIR / species_id, args.refresh)
         
         if existing_img:
-            print(f"  Image already exists ({species_id}{existing_img})")
+            print(f"  Image already exists ({existing_img.name})")
             img_success += 1
             # Still get description
-            _, description = get_species_data(wiki_page)
+            _, description = get_species_data(wiki_page, api_pages)
             if description:
                 descriptions[species_id] = description
                 print(f"  Description: {description[:80]}...")
             continue
         
         # Get image URL and description
-        img_url, description = get_species_data(wiki_page)
+        img_url, description = get_species_data(wiki_page, api_pages)
         
         if description:
             descriptions[species_id] = description
@@ -234,7 +259,7 @@ def main():
         
         if img_url:
             print(f"  Image URL: {img_url[:60]}...")
-            if download_image(img_url, species_id):
+            if download_image(img_url, species_id, width, digests.get(img_url)):
                 img_success += 1
             else:
                 img_failed += 1
@@ -244,7 +269,7 @@ def main():
     
     # Save descriptions to JSON
     print(f"\n\nSaving {len(descriptions)} descriptions to {DESCRIPTIONS_FILE}")
-    with open(DESCRIPTIONS_FILE, "w", encoding="utf-8") as f:
+    with open(DESCRIPTIONS_FILE, "w", encoding="utf-8") as f, stage("write"):
         json.dump(descriptions, f, ensure_ascii=False, indent=2)
     
     print("\n" + "=" * 60)
@@ -254,4 +279,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("download_species_images"), profiled("download_species_images"):
+        main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Streaming, atomic, resumable image downloader shared by the scripts.
+
+    - the body is streamed in chunks to `<name>.part`, never held in memory
+    - an interrupted `.part` file is resumed with an HTTP Range request,
+      guarded by If-Range with the ETag / Last-Modified recorded next to it
+      (`<name>.part.json`, with the source URL): a part from another URL, or
+      from a file that changed upstream since, is discarded and restarted
+    - the byte count is checked against Content-Length, and the content
+      against an expected digest when one is known (MediaWiki publishes the
+      SHA-1 of every original file, see MediaWikiAPI.image_digests)
+    - the extension comes from the file's magic bytes, not from the URL
+    - only a complete, verified file is renamed into place (os.replace), so
+      a crash can never leave a truncated image that looks "already done"
+
+Fandom images can be requested pre-scaled from the CDN. download_scaled_image asks
+for the rendition at the target width of the asset class (ASSET_WIDTHS) and
+only falls back to the full-resolution original when no scaled rendition
+exists. The wiki's digest describes the original only, so it is checked when
+the original is downloaded; a scaled rendition is checked by size alone.
+
+Usage:
+    from downloader import ASSET_WIDTHS, download_scaled_image, existing_download
+
+    if not existing_download(OUTPUT_DIR / "twilek"):
+        result = download_scaled_image(url, OUTPUT_DIR / "twilek", ASSET_WIDTHS["species"],
+                                       original_sha1=digests.get(url))
+        print(result.path.name, result.size, result.sha256)
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import requests
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+import metrics
+import wiki_http
+
+CHUNK_SIZE = 64 * 1024
+PART_SUFFIX = ".part"
+# Source URL and validators of a `.part` file, for resuming it
+PART_META_SUFFIX = ".part.json"
+
+# (offset, signature, extension)
+MAGIC_SIGNATURES = [
+    (0, b"\x89PNG\r\n\x1a\n", ".png"),
+    (0, b"\xff\xd8\xff", ".jpg"),
+    (0, b"GIF87a", ".gif"),
+    (0, b"GIF89a", ".gif"),
+    (8, b"WEBP", ".webp"),
+    (4, b"ftypavif", ".avif"),
+]
+KNOWN_EXTENSIONS = [".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg"]
+
+# Image CDN host; WIKI_IMAGE_HOST points it at a local stand-in wiki
+FANDOM_IMAGE_HOST = os.environ.get("WIKI_IMAGE_HOST", "static.wikia.nocookie.net")
+
+# "/scale-to-width-down/N" and everything from "/revision/" on (cache-busters included)
+IMAGE_SUFFIX_RE = re.compile(r"/scale-to-width-down/\d+|/revision/.*$")
+
+# Target display width (px) per asset class; None keeps the original
+ASSET_WIDTHS = {
+    "species": 400,   # species portrait
+    "card": 600,      # draft card art
+    "faction": 256,   # faction emblem
+    "planet": 800,    # planet / location art
+}
+
+# Statuses meaning "this rendition does not exist", as opposed to a real failure
+NO_RENDITION_STATUSES = (400, 404, 415)
+
+
+class DownloadError(Exception):
+    """The downloaded file failed a size or checksum check."""
+
+
+class DownloadResult(NamedTuple):
+    path: Path
+    size: int
+    sha256: str
+
+
+def full_size_url(src: str) -> str:
+    """Strip Fandom sizing/revision suffixes: the bare, full-resolution image URL."""
+    return IMAGE_SUFFIX_RE.sub("", src)
+
+
+def scaled_image_url(src: str, width: int) -> str:
+    """CDN URL of the rendition scaled down to `width` pixels."""
+    return f"{full_size_url(src)}/revision/latest/scale-to-width-down/{width}"
+
+
+def sniff_extension(head: bytes) -> str | None:
+    """Guess an image extension from the first bytes of the file."""
+    for offset, signature, ext in MAGIC_SIGNATURES:
+        if head[offset:offset + len(signature)] == signature:
+            return ext
+    text = head.lstrip()[:256].lower()
+    if text.startswith(b"<svg") or (text.startswith(b"<?xml") and b"<svg" in head[:1024].lower()):
+        return ".svg"
+    return None
+
+
+def existing_download(dest_stem: Path) -> Path | None:
+    """Return a completed download for `dest_stem` (any image extension), if any."""
+    for ext in KNOWN_EXTENSIONS:
+        path = dest_stem.parent / f"{dest_stem.name}{ext}"
+        if path.exists():
+            return path
+    return None
+
+
+def _hash_file(path: Path, *digests) -> None:
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            for digest in digests:
+                digest.update(chunk)
+
+
+def _validator(headers) -> str | None:
+    """If-Range value for a response: its strong ETag, else its Last-Modified date."""
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _read_part_meta(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _resume_offset(part: Path, meta_path: Path, url: str) -> tuple[int, str | None]:
+    """(bytes to resume from, If-Range validator); 0 unless the part is from `url` and has a validator."""
+    if not part.exists():
+        return 0, None
+    meta = _read_part_meta(meta_path)
+    if meta.get("url") == url and meta.get("validator"):
+        return part.stat().st_size, meta["validator"]
+    return 0, None
+
+
+def _open_stream(url: str, offset: int, validator: str | None = None) -> requests.Response:
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    return wiki_http.http_get(url, stream=True, headers=headers)
+
+
+def _resumes_at(response: requests.Response, offset: int, validator: str | None) -> bool:
+    """Whether a response continues the part: a 206 from `offset` of the same file version."""
+    if response.status_code != 206:
+        return False  # Range ignored, or If-Range failed: the server is sending the whole file
+    if not response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+        return False
+    current = _validator(response.headers)
+    return current is None or current == validator
+
+
+def download_file(url: str, dest_stem: Path, expected_digest: str | None = None,
+                  algorithm: str = "sha256", default_ext: str = ".jpg") -> DownloadResult:
+    """
+    Download `url` to `dest_stem` + sniffed extension.
+    Resumes a previous `.part` file of the same URL when the server honours
+    Range and If-Range; otherwise the download starts over.
+    `expected_digest` is the hex digest of the whole file under `algorithm`
+    (any hashlib name); a mismatch discards the part file.
+    Raises requests.RequestException or DownloadError on failure; the
+    `.part` file is kept on network errors so the next run can resume.
+    """
+    dest_stem.parent.mkdir(parents=True, exist_ok=True)
+    part = dest_stem.parent / f"{dest_stem.name}{PART_SUFFIX}"
+    meta_path = dest_stem.parent / f"{dest_stem.name}{PART_META_SUFFIX}"
+    offset, validator = _resume_offset(part, meta_path, url)
+
+    try:
+        response = _open_stream(url, offset, validator)
+    except requests.HTTPError as e:
+        if offset and e.response is not None and e.response.status_code == 416:
+            offset = 0
+            response = _open_stream(url, 0)
+        else:
+            raise
+
+    if offset and not _resumes_at(response, offset, validator):
+        if response.status_code == 206:  # a range of a different version: ask for all of it
+            response.close()
+            response = _open_stream(url, 0)
+        offset = 0
+    if not offset:
+        meta_path.write_text(json.dumps({"url": url, "validator": _validator(response.headers)}),
+                             encoding="utf-8")
+
+    digest = hashlib.sha256()
+    # A second hash only when the expected digest is not a SHA-256
+    digests = [digest] + ([hashlib.new(algorithm)] if expected_digest and algorithm != "sha256" else [])
+    if offset:
+        _hash_file(part, *digests)
+
+    expected_size = None
+    if "Content-Length" in response.headers and "Content-Encoding" not in response.headers:
+        expected_size = offset + int(response.headers["Content-Length"])
+
+    with response, open(part, "ab" if offset else "wb") as f, metrics.stage("image.download"):
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
+            for each in digests:
+                each.update(chunk)
+            metrics.count("bytes.images", len(chunk))
+
+    size = part.stat().st_size
+    if expected_size is not None and size != expected_size:
+        raise DownloadError(f"Incomplete download: {size} of {expected_size} bytes")
+
+    sha256 = digest.hexdigest()
+    actual = digests[-1].hexdigest()
+    if expected_digest and actual != expected_digest.lower():
+        part.unlink()
+        meta_path.unlink(missing_ok=True)
+        metrics.count("images.checksum_failed")
+        raise DownloadError(f"Checksum mismatch: {algorithm} {actual[:12]}, expected {expected_digest[:12]}")
+
+    with open(part, "rb") as f:
+        ext = sniff_extension(f.read(1024)) or default_ext
+
+    final = dest_stem.parent / f"{dest_stem.name}{ext}"
+    os.replace(part, final)
+    meta_path.unlink(missing_ok=True)
+    return DownloadResult(final, size, sha256)
+
+
+def download_scaled_image(url: str, dest_stem: Path, width: int | None = None,
+                          original_sha1: str | None = None) -> DownloadResult:
+    """
+    Download a Fandom image at `width` px (the CDN's scaled rendition),
+    falling back to the original when no scaled rendition exists.
+    `url` may be a bare, scaled or /revision/latest image URL.
+    `original_sha1` (the wiki's imageinfo sha1) verifies an original download.
+    """
+    if width and FANDOM_IMAGE_HOST in url:
+        try:
+            return download_file(scaled_image_url(url, width), dest_stem)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code not in NO_RENDITION_STATUSES:
+                raise
+            print(f"    No {width}px rendition, falling back to the original")
+    if FANDOM_IMAGE_HOST in url:
+        url = f"{full_size_url(url)}/revision/latest"
+    return download_file(url, dest_stem, original_sha1, algorithm="sha1")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for wiki page HTML.
+
+Responses are stored content-addressed: page bodies live under
+`bodies/<sha256 of body>` and a small per-URL metadata file records the
+body hash plus the ETag / Last-Modified validators. Later runs send
+conditional requests (If-None-Match / If-Modified-Since) and reuse the
+stored body on a 304.
+
+Cache modes (WIKI_CACHE environment variable, or --offline on the scripts):
+    on       revalidate cached pages with conditional requests (default)
+    offline  serve only from the cache, never touch the network
+    off      bypass the cache entirely
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "http"
+CACHE_MODES = ("on", "offline", "off")
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a URL has never been cached."""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class HttpCache:
+    """Content-addressed response cache keyed by URL."""
+
+    def __init__(self, root: Path = CACHE_DIR, mode: str = "on"):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r} (expected one of {CACHE_MODES})")
+        self.root = Path(root)
+        self.mode = mode
+
+    def _meta_path(self, url: str) -> Path:
+        key = _sha256(url.encode("utf-8"))
+        return self.root / "meta" / key[:2] / f"{key}.json"
+
+    def _body_path(self, body_hash: str) -> Path:
+        return self.root / "bodies" / body_hash[:2] / body_hash
+
+    def lookup(self, url: str) -> dict | None:
+        """Return the metadata stored for `url`, or None."""
+        path = self._meta_path(url)
+        if not path.exists():
+            return None
+        try:
+            meta = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not self._body_path(meta["sha256"]).exists():
+            return None
+        return meta
+
+    def read_body(self, meta: dict) -> bytes:
+        """Return the raw body bytes for a metadata entry."""
+        return self._body_path(meta["sha256"]).read_bytes()
+
+    def read_text(self, meta: dict) -> str:
+        """Return the decoded body for a metadata entry."""
+        return self.read_body(meta).decode(meta.get("encoding") or "utf-8", errors="replace")
+
+    def conditional_headers(self, meta: dict | None) -> dict:
+        """Validators to send on a revalidation request."""
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(self, url: str, body: bytes, headers, encoding: str | None = None) -> dict:
+        """Store a 200 response body and its validators. Returns the new metadata."""
+        body_hash = _sha256(body)
+        body_path = self._body_path(body_hash)
+        if not body_path.exists():
+            _atomic_write(body_path, body)
+
+        meta = {
+            "url": url,
+            "sha256": body_hash,
+            "encoding": encoding,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "validated_at": time.time(),
+        }
+        _atomic_write(self._meta_path(url), json.dumps(meta, indent=2).encode("utf-8"))
+        return meta
+
+    def touch(self, url: str, meta: dict) -> None:
+        """Record a successful 304 revalidation."""
+        meta["validated_at"] = time.time()
+        _atomic_write(self._meta_path(url), json.dumps(meta, indent=2).encode("utf-8"))
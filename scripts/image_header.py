@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Image dimensions from the file header, without decoding any pixels.
+
+Reads only the bytes that hold the size: the PNG IHDR chunk, the GIF
+logical screen, the WebP VP8 / VP8L / VP8X header, the JPEG SOF segment
+(walking the segments before it, seeking over their payloads) and the
+root element of an SVG. JPEG sizes follow the EXIF orientation, as
+browsers display them.
+
+Usage:
+    from image_header import image_size
+
+    ext, width, height = image_size(Path("assets/species/chiss.jpg"))
+"""
+
+import re
+import struct
+from pathlib import Path
+
+from downloader import sniff_extension
+
+HEAD_SIZE = 1024
+
+# JPEG start-of-frame markers (SOF0-SOF15 minus DHT, JPG and DAC)
+SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# JPEG markers without a length field
+STANDALONE_MARKERS = set(range(0xD0, 0xD9)) | {0x01}
+
+# EXIF orientations that rotate the image a quarter turn
+TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+SVG_ROOT_RE = re.compile(rb"<svg\b[^>]*>", re.S | re.I)
+SVG_ATTR_RE = re.compile(rb"""\b(width|height|viewBox)\s*=\s*["']([^"']*)["']""", re.I)
+SVG_LENGTH_RE = re.compile(rb"^\s*([\d.]+)\s*(px)?\s*$")
+
+
+class ImageHeaderError(ValueError):
+    """The file is not an image, or its header is truncated or malformed."""
+
+
+def _exif_orientation(segment: bytes) -> int:
+    """Orientation tag of an APP1 Exif segment (1 when absent)."""
+    if not segment.startswith(b"Exif\0\0"):
+        return 1
+    tiff = segment[6:]
+    endian = {b"II": "<", b"MM": ">"}.get(tiff[:2])
+    if endian is None or len(tiff) < 8:
+        return 1
+    ifd = struct.unpack(f"{endian}I", tiff[4:8])[0]
+    if ifd + 2 > len(tiff):
+        return 1
+    for i in range(struct.unpack(f"{endian}H", tiff[ifd:ifd + 2])[0]):
+        entry = tiff[ifd + 2 + i * 12:ifd + 14 + i * 12]
+        if len(entry) == 12 and struct.unpack(f"{endian}H", entry[:2])[0] == 0x0112:
+            return struct.unpack(f"{endian}H", entry[8:10])[0]
+    return 1
+
+
+def _jpeg_size(f) -> tuple[int, int]:
+    f.seek(2)
+    orientation = 1
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ImageHeaderError("JPEG ends before its frame header")
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":  # fill bytes
+            marker = f.read(1)
+        if not marker:
+            raise ImageHeaderError("JPEG ends before its frame header")
+        code = marker[0]
+        if code in STANDALONE_MARKERS:
+            continue
+        length = struct.unpack(">H", f.read(2))[0]
+        if code in SOF_MARKERS:
+            height, width = struct.unpack(">xHH", f.read(5))
+            if orientation in TRANSPOSED_ORIENTATIONS:
+                width, height = height, width
+            return width, height
+        if code == 0xE1:
+            orientation = _exif_orientation(f.read(length - 2)) if orientation == 1 else orientation
+        else:
+            f.seek(length - 2, 1)
+
+
+def _webp_size(head: bytes) -> tuple[int, int]:
+    chunk = head[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        bits = struct.unpack("<I", head[21:25])[0]
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return (int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1)
+    raise ImageHeaderError(f"Unknown WebP chunk {chunk!r}")
+
+
+def _svg_size(path: Path) -> tuple[int, int]:
+    root = SVG_ROOT_RE.search(path.read_bytes()[:64 * 1024])
+    if root is None:
+        raise ImageHeaderError("No <svg> element")
+    attrs = {name.lower(): value for name, value in SVG_ATTR_RE.findall(root.group())}
+    width, height = (SVG_LENGTH_RE.match(attrs.get(k, b"")) for k in (b"width", b"height"))
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+    box = attrs.get(b"viewbox", b"").replace(b",", b" ").split()
+    if len(box) == 4:
+        return round(float(box[2])), round(float(box[3]))
+    raise ImageHeaderError("SVG without a usable width/height or viewBox")
+
+
+def image_size(path: Path) -> tuple[str, int, int]:
+    """(extension, width, height) of the image at `path`, read from its header."""
+    with open(path, "rb") as f:
+        head = f.read(HEAD_SIZE)
+        ext = sniff_extension(head)
+        if ext == ".png":
+            width, height = struct.unpack(">II", head[16:24])
+        elif ext == ".gif":
+            width, height = struct.unpack("<HH", head[6:10])
+        elif ext == ".webp":
+            width, height = _webp_size(head)
+        elif ext == ".jpg":
+            width, height = _jpeg_size(f)
+        elif ext == ".svg":
+            width, height = _svg_size(path)
+        else:
+            raise ImageHeaderError(f"Unsupported image format: {path.name}")
+    return ext, width, height
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Structured parser for Fandom `portable-infobox` asides and SWSE stat blocks.
+
+Instead of calling soup.get_text() on the whole page and running one regex
+per ability name over it (which picks up stray numbers from sidebars), the
+page is walked once:
+
+    - portable-infobox: each `div.pi-data` row gives (data-source, value)
+    - SWSE stat blocks: paragraphs / list items opening with a bold
+      "Label:" give (label, rest of the line)
+
+and the rows are mapped onto a typed SpeciesFacts dict. Because the facts
+come out of the infobox as data, the description extractors can drop the
+infobox subtree (see element_text) instead of stripping its text with regex
+after the fact.
+
+Usage:
+    from infobox import species_facts, format_ability_mods
+
+    facts = species_facts(soup)
+    facts["ability_mods"]                      # {"DEX": 2, "CON": -2}
+    format_ability_mods(facts["ability_mods"])  # "+2 DEX, -2 CON"
+"""
+
+import re
+from typing import TypedDict
+
+try:
+    from bs4 import BeautifulSoup, Tag
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+ABILITY_ABBREVIATIONS = {
+    "strength": "FOR",
+    "dexterity": "DEX",
+    "constitution": "CON",
+    "intelligence": "INT",
+    "wisdom": "SAG",
+    "charisma": "CHA",
+}
+
+# Normalised row label -> SpeciesFacts field
+FIELD_LABELS = {
+    "ability modifiers": "ability_mods",
+    "ability scores": "ability_mods",
+    "languages": "languages",
+    "language": "languages",
+    "automatic languages": "languages",
+    "height": "height",
+    "average height": "height",
+    "lifespan": "lifespan",
+    "average lifespan": "lifespan",
+    "life span": "lifespan",
+    "homeworld": "homeworld",
+    "planet": "homeworld",
+    "point of origin": "homeworld",
+}
+
+ABILITY_RE = re.compile(r"([-+−–]?\s*\d+)\s+(" + "|".join(ABILITY_ABBREVIATIONS) + r")", re.I)
+CITATION_RE = re.compile(r"\[\d+\]|\[Source\]")
+# SWSE "Automatic Languages" prose: "All Chiss can speak, read, and write both Basic and Cheunh."
+# Everything up to the last verb (and a following both/either) is dropped.
+LANGUAGE_PROSE_RE = re.compile(
+    r"^.*\b(?:speak|read|write|understand)s?\b(?:\s+(?:both|either|only))?\s*", re.I
+)
+LIST_SEPARATOR_RE = re.compile(r"\s*(?:[,;/]|\band\b|\bor\b)\s*", re.I)
+
+
+class SpeciesFacts(TypedDict):
+    ability_mods: dict[str, int]
+    languages: list[str]
+    height: str | None
+    lifespan: str | None
+    homeworld: str | None
+
+
+def _clean(text: str) -> str:
+    text = CITATION_RE.sub("", text)
+    return re.sub(r"\s+", " ", text).strip(" :;.")
+
+
+def _label_key(label: str) -> str:
+    return _clean(label).lower()
+
+
+def infobox_rows(soup: BeautifulSoup) -> list[tuple[str, str, list[str]]]:
+    """
+    Rows of every portable-infobox on the page as (label, text, items).
+    `items` splits list values (<li> or <br>-separated) into separate entries;
+    comma-separated values are split further by language_names.
+    """
+    rows = []
+    for box in soup.find_all("aside", class_="portable-infobox"):
+        for data in box.find_all("div", class_="pi-data"):
+            label_tag = data.find(class_="pi-data-label")
+            value_tag = data.find(class_="pi-data-value")
+            if not value_tag:
+                continue
+            label = label_tag.get_text(" ", strip=True) if label_tag else data.get("data-source", "")
+            items = [_clean(li.get_text(" ")) for li in value_tag.find_all("li")]
+            if not items:
+                items = [_clean(part) for part in value_tag.get_text("\n").split("\n")]
+            rows.append((label, _clean(value_tag.get_text(" ")), [i for i in items if i]))
+    return rows
+
+
+def stat_block_rows(soup: BeautifulSoup) -> list[tuple[str, str, list[str]]]:
+    """
+    SWSE stat-block lines of the form "<b>Label:</b> value" as (label, text, items).
+    The value is a sentence, so `items` holds it whole.
+    """
+    rows = []
+    content = soup.find("div", class_="mw-parser-output") or soup
+    for block in content.find_all(["p", "li", "dd"]):
+        bold = block.find(["b", "strong"])
+        if not bold or bold.find_previous_sibling(string=lambda s: s and s.strip()):
+            continue
+        label = bold.get_text(" ", strip=True)
+        if not label.endswith(":"):
+            following = bold.next_sibling
+            if not (isinstance(following, str) and following.lstrip().startswith(":")):
+                continue
+        value = _clean(block.get_text(" ", strip=True)[len(label):])
+        rows.append((label.rstrip(":"), value, [value] if value else []))
+    return rows
+
+
+def language_names(text: str) -> list[str]:
+    """
+    Language names in one infobox item or stat-block value:
+    "Cheunh, Sy Bisti" -> ["Cheunh", "Sy Bisti"],
+    "All Chiss can speak, read, and write both Basic and Cheunh." -> ["Basic", "Cheunh"].
+    """
+    text = LANGUAGE_PROSE_RE.sub("", _clean(text))
+    return [name for name in (_clean(part) for part in LIST_SEPARATOR_RE.split(text)) if name]
+
+
+def parse_ability_mods(text: str) -> dict[str, int]:
+    """"+2 Dexterity, -2 Constitution" -> {"DEX": 2, "CON": -2}."""
+    mods = {}
+    for value, name in ABILITY_RE.findall(text):
+        value = value.replace("−", "-").replace("–", "-").replace(" ", "")
+        mods[ABILITY_ABBREVIATIONS[name.lower()]] = int(value)
+    return mods
+
+
+def format_ability_mods(mods: dict[str, int]) -> str:
+    """{"DEX": 2, "CON": -2} -> "+2 DEX, -2 CON" ("Aucun" if empty)."""
+    if not mods:
+        return "Aucun"
+    return ", ".join(f"{value:+d} {abbr}" for abbr, value in mods.items())
+
+
+def species_facts(soup: BeautifulSoup) -> SpeciesFacts:
+    """One pass over infobox and stat-block rows into a typed dict."""
+    facts: SpeciesFacts = {
+        "ability_mods": {},
+        "languages": [],
+        "height": None,
+        "lifespan": None,
+        "homeworld": None,
+    }
+    for label, text, items in infobox_rows(soup) + stat_block_rows(soup):
+        field = FIELD_LABELS.get(_label_key(label))
+        if field == "ability_mods":
+            facts["ability_mods"].update(parse_ability_mods(text))
+        elif field == "languages":
+            known = {lang.casefold() for lang in facts["languages"]}
+            for lang in (name for item in items for name in language_names(item)):
+                if lang.casefold() not in known:
+                    known.add(lang.casefold())
+                    facts["languages"].append(lang)
+        elif field and not facts[field]:
+            facts[field] = text or None
+    return facts
+
+
+def element_text(elem: Tag) -> str:
+    """get_text() of an element, ignoring any infobox nested inside it."""
+    if not elem.find("aside", class_="portable-infobox"):
+        return elem.get_text()
+    parts = []
+    for string in elem.find_all(string=True):
+        if not string.find_parent("aside", class_="portable-infobox"):
+            parts.append(string)
+    return "".join(parts)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Checkpointed crawl job queue backed by SQLite.
+
+Every URL of a crawl is a row with a state:
+
+    pending  -> fetched  -> parsed
+                         \\-> failed
+
+Each state change (and each parsed result) is committed as it happens, so
+an exception or Ctrl-C half-way through a category crawl loses at most the
+page that was in flight. A later run can pick up the remaining
+pending/fetched jobs (resume) or put the failed ones back in the queue
+(retry_failed) without touching what was already parsed.
+
+The queue also remembers the listing page a crawl frontier was on
+(`cursor`), so a resumed run can finish walking a paginated category, and
+the wiki revision each parsed result was extracted from (`revisions`), so
+an update run can requeue only the pages edited since (`requeue`). A
+requeued job keeps its previous result until a new parse replaces it, so
+a page that fails to re-scrape is still served from the last good run.
+
+Usage:
+    from job_queue import JobQueue
+
+    with JobQueue(QUEUE_DB) as queue:
+        queue.reset()
+        queue.enqueue([(url, name), ...])
+        for job in queue.pending():
+            queue.mark_fetched(job.url)
+            queue.mark_parsed(job.url, {"id": ...})
+        records = queue.results()
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+QUEUE_DB = Path(__file__).parent / ".cache" / "jobs.sqlite"
+
+JOB_STATES = ("pending", "fetched", "parsed", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    queue TEXT NOT NULL,
+    url TEXT NOT NULL,
+    name TEXT,
+    position INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    failures INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT,
+    revid INTEGER,
+    updated_at REAL,
+    PRIMARY KEY (queue, url)
+);
+CREATE TABLE IF NOT EXISTS cursors (
+    queue TEXT PRIMARY KEY,
+    url TEXT NOT NULL
+)
+"""
+
+
+class Job(NamedTuple):
+    url: str
+    name: str
+    state: str
+    failures: int
+
+
+class JobQueue:
+    """Persistent per-URL job states for one named crawl (`queue`)."""
+
+    def __init__(self, path: Path = QUEUE_DB, queue: str = "default"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.queue = queue
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")}
+        if "revid" not in columns:  # queue created before revisions were recorded
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN revid INTEGER")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _set(self, url: str, state: str, **fields):
+        columns = "".join(f", {name} = ?" for name in fields)
+        with self.conn:
+            self.conn.execute(
+                f"UPDATE jobs SET state = ?, updated_at = ?{columns} WHERE queue = ? AND url = ?",
+                (state, time.time(), *fields.values(), self.queue, url),
+            )
+
+    def reset(self):
+        """Forget every job of this queue (start a fresh crawl)."""
+        with self.conn:
+            self.conn.execute("DELETE FROM jobs WHERE queue = ?", (self.queue,))
+            self.conn.execute("DELETE FROM cursors WHERE queue = ?", (self.queue,))
+
+    @property
+    def cursor(self) -> str | None:
+        """Listing page the crawl frontier stopped at (None once the listing is done)."""
+        row = self.conn.execute("SELECT url FROM cursors WHERE queue = ?", (self.queue,)).fetchone()
+        return row[0] if row else None
+
+    @cursor.setter
+    def cursor(self, url: str | None):
+        with self.conn:
+            if url is None:
+                self.conn.execute("DELETE FROM cursors WHERE queue = ?", (self.queue,))
+            else:
+                self.conn.execute("INSERT OR REPLACE INTO cursors (queue, url) VALUES (?, ?)", (self.queue, url))
+
+    def enqueue(self, jobs: list[tuple[str, str]]) -> int:
+        """Add (url, name) jobs as pending, keeping crawl order; known URLs are skipped."""
+        start = self.conn.execute(
+            "SELECT COALESCE(MAX(position), -1) + 1 FROM jobs WHERE queue = ?", (self.queue,)
+        ).fetchone()[0]
+        with self.conn:
+            cursor = self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (queue, url, name, position, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(self.queue, url, name, start + i, time.time()) for i, (url, name) in enumerate(jobs)],
+            )
+        return cursor.rowcount
+
+    def pending(self) -> list[Job]:
+        """Jobs still to do: never started, or fetched but not parsed when the run stopped."""
+        rows = self.conn.execute(
+            "SELECT url, name, state, failures FROM jobs "
+            "WHERE queue = ? AND state IN ('pending', 'fetched') ORDER BY position",
+            (self.queue,),
+        ).fetchall()
+        return [Job(*row) for row in rows]
+
+    def retry_failed(self) -> int:
+        """Put failed jobs back in the queue. Returns how many were requeued."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = 'pending', error = NULL WHERE queue = ? AND state = 'failed'",
+                (self.queue,),
+            )
+        return cursor.rowcount
+
+    def mark_fetched(self, url: str):
+        self._set(url, "fetched")
+
+    def mark_parsed(self, url: str, result: dict, revid: int | None = None):
+        self._set(url, "parsed", result=json.dumps(result, ensure_ascii=False), error=None, revid=revid)
+
+    def mark_failed(self, url: str, error: str):
+        with self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET state = 'failed', failures = failures + 1, error = ?, updated_at = ? "
+                "WHERE queue = ? AND url = ?",
+                (error, time.time(), self.queue, url),
+            )
+
+    def revisions(self) -> dict[str, int | None]:
+        """{url: revision its result was parsed from} for every job with a result."""
+        return dict(self.conn.execute(
+            "SELECT url, revid FROM jobs WHERE queue = ? AND result IS NOT NULL ORDER BY position",
+            (self.queue,),
+        ))
+
+    def requeue(self, urls: list[str]) -> int:
+        """
+        Put parsed jobs back in the queue (their page changed). Returns how many.
+        Their results stay in results() until mark_parsed replaces them.
+        """
+        with self.conn:
+            cursor = self.conn.executemany(
+                "UPDATE jobs SET state = 'pending' WHERE queue = ? AND url = ?",
+                [(self.queue, url) for url in urls],
+            )
+        return cursor.rowcount
+
+    def remove(self, urls: list[str]) -> int:
+        """Drop jobs (and their results) for pages that no longer exist."""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM jobs WHERE queue = ? AND url = ?", [(self.queue, url) for url in urls]
+            )
+        return cursor.rowcount
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs in each state."""
+        counts = dict.fromkeys(JOB_STATES, 0)
+        for state, count in self.conn.execute(
+            "SELECT state, COUNT(*) FROM jobs WHERE queue = ? GROUP BY state", (self.queue,)
+        ):
+            counts[state] = count
+        return counts
+
+    def failed(self) -> list[tuple[str, str]]:
+        """(name, error) of every failed job."""
+        return self.conn.execute(
+            "SELECT name, error FROM jobs WHERE queue = ? AND state = 'failed' ORDER BY position",
+            (self.queue,),
+        ).fetchall()
+
+    def results(self) -> list[dict]:
+        """
+        Latest result of every job in crawl order: parsed jobs, plus requeued
+        ones still pending or failed since, which keep their previous result.
+        """
+        rows = self.conn.execute(
+            "SELECT result FROM jobs WHERE queue = ? AND result IS NOT NULL ORDER BY position",
+            (self.queue,),
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+MediaWiki api.php backend for the scraping scripts.
+
+Instead of downloading the fully rendered Fandom page (hundreds of KB of
+skin and ads) and walking it with BeautifulSoup, this asks the wiki's
+api.php for exactly what the extractors need:
+
+    action=query  prop=pageimages|extracts|revisions   up to 50 titles per call
+    action=query  prop=imageinfo (File: pages)         SHA-1 of the image files
+    action=parse  prop=sections / prop=text&section=N  only the lore sections
+
+API responses go through wiki_http, so they are pooled, cached on disk and
+available offline like any other page.
+
+Usage:
+    from mediawiki_api import MediaWikiAPI
+
+    api = MediaWikiAPI("https://starwars.fandom.com/wiki/")
+    pages = api.query_pages(["Human/Legends", "Chiss/Legends"])
+    sections = api.section_texts("Human/Legends", ["Biology and appearance"])
+    digests = api.image_digests([original_image_url(page) for page in pages.values()])
+"""
+
+import json
+import re
+from urllib.parse import unquote, urlencode
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+import wiki_http
+from downloader import full_size_url
+
+# MediaWiki accepts at most 50 titles per query for normal clients
+BATCH_SIZE = 50
+
+DEFAULT_PROPS = ("pageimages", "extracts", "revisions")
+
+# File name in a wiki image URL: .../images/<a>/<ab>/<File_name.png>[/revision/...]
+FILE_NAME_RE = re.compile(r"/images/(?:thumb/)?[0-9a-f]/[0-9a-f]{2}/([^/?#]+)")
+
+
+class MediaWikiError(Exception):
+    """The API answered with an error object."""
+
+
+def api_endpoint(wiki_base_url: str) -> str:
+    """Map a ".../wiki/" base URL to the wiki's api.php endpoint."""
+    root = wiki_base_url.rstrip("/")
+    if root.endswith("/wiki"):
+        root = root[:-len("/wiki")]
+    return f"{root}/api.php"
+
+
+def page_title(wiki_page: str) -> str:
+    """Turn a URL path component like 'Twi%27lek/Legends' into an API title."""
+    return unquote(wiki_page).replace("_", " ")
+
+
+def file_title(image_url: str) -> str | None:
+    """The File: page of a wiki image URL (any rendition), or None."""
+    match = FILE_NAME_RE.search(image_url)
+    return f"File:{page_title(match.group(1))}" if match else None
+
+
+def chunked(items: list, size: int):
+    """Yield successive `size`-long slices of `items`."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class MediaWikiAPI:
+    """Thin client for one wiki's api.php."""
+
+    def __init__(self, wiki_base_url: str, delay: float | None = None):
+        self.endpoint = api_endpoint(wiki_base_url)
+        self.delay = delay
+        self.request_count = 0
+
+    def request(self, **params) -> dict:
+        """Perform one GET against api.php and return the decoded JSON."""
+        params = {"format": "json", "formatversion": "2", **params}
+        url = f"{self.endpoint}?{urlencode(sorted(params.items()))}"
+        text, _ = wiki_http.fetch_page_text(url, delay=self.delay)
+        self.request_count += 1
+
+        data = json.loads(text)
+        if "error" in data:
+            error = data["error"]
+            raise MediaWikiError(f"{error.get('code')}: {error.get('info')}")
+        return data
+
+    def query_pages(self, wiki_pages: list[str], props=DEFAULT_PROPS) -> dict[str, dict | None]:
+        """
+        Batch-query page info for many pages at once.
+        Returns {wiki_page: page dict or None if missing}, following
+        normalisation and redirects back to the requested names.
+        """
+        titles = {wiki_page: page_title(wiki_page) for wiki_page in wiki_pages}
+        unique_titles = list(dict.fromkeys(titles.values()))
+        found: dict[str, dict] = {}
+        aliases: dict[str, str] = {}
+
+        for batch in chunked(unique_titles, BATCH_SIZE):
+            params = {
+                "action": "query",
+                "titles": "|".join(batch),
+                "prop": "|".join(props),
+                "redirects": "1",
+            }
+            if "pageimages" in props:
+                params["piprop"] = "original"
+            if "extracts" in props:
+                params.update(exintro="1", explaintext="1", exlimit="max")
+            if "revisions" in props:
+                params["rvprop"] = "ids|timestamp"
+            if "imageinfo" in props:
+                params["iiprop"] = "sha1|size"
+
+            continuation = {}
+            while True:
+                data = self.request(**params, **continuation)
+                query = data.get("query", {})
+                for item in query.get("normalized", []) + query.get("redirects", []):
+                    aliases[item["from"]] = item["to"]
+                for page in query.get("pages", []):
+                    found.setdefault(page["title"], {}).update(page)
+                if "continue" not in data:
+                    break
+                continuation = data["continue"]
+
+        results = {}
+        for wiki_page, title in titles.items():
+            seen = set()
+            while title in aliases and title not in seen:
+                seen.add(title)
+                title = aliases[title]
+            page = found.get(title)
+            results[wiki_page] = None if not page or page.get("missing") or page.get("invalid") else page
+        return results
+
+    def image_digests(self, image_urls: list[str | None]) -> dict[str, str]:
+        """
+        SHA-1 of the original file behind each image URL, from the File:
+        pages' imageinfo. Returns {url: hex digest}; URLs that are not files
+        of this wiki are left out.
+        """
+        titles = {url: file_title(url) for url in image_urls if url}
+        titles = {url: title for url, title in titles.items() if title}
+        pages = self.query_pages(list(dict.fromkeys(titles.values())), props=("imageinfo",))
+        digests = {}
+        for url, title in titles.items():
+            info = (pages.get(title) or {}).get("imageinfo")
+            if info and info[0].get("sha1"):
+                digests[url] = info[0]["sha1"]
+        return digests
+
+    def sections(self, wiki_page: str) -> list[dict]:
+        """Return the section table of contents of a page."""
+        data = self.request(action="parse", page=page_title(wiki_page),
+                            prop="sections", redirects="1")
+        return data["parse"]["sections"]
+
+    def section_html(self, wiki_page: str, index: str | int) -> str:
+        """Return the rendered HTML of a single section."""
+        data = self.request(action="parse", page=page_title(wiki_page), prop="text",
+                            section=str(index), redirects="1",
+                            disablelimitreport="1", disableeditsection="1")
+        return data["parse"]["text"]
+
+    def section_texts(self, wiki_page: str, wanted: list[str]) -> list[tuple[str, str]]:
+        """
+        Fetch only the sections whose heading contains one of `wanted`
+        (case-insensitive, in `wanted` order). Returns [(heading, html)].
+        Each matching section is fetched once even if several names match it.
+        """
+        toc = [s for s in self.sections(wiki_page) if str(s.get("level")) in ("2", "3")]
+        picked = []
+        seen_indexes = set()
+        for name in wanted:
+            for section in toc:
+                heading = re.sub(r"<[^>]+>", "", section["line"])
+                if name.lower() in heading.lower() and section["index"] not in seen_indexes:
+                    seen_indexes.add(section["index"])
+                    picked.append((heading, section["index"]))
+                    break
+        return [(heading, self.section_html(wiki_page, index)) for heading, index in picked]
+
+
+def original_image_url(page: dict | None) -> str | None:
+    """Full-resolution image URL of a page, without the /revision suffix."""
+    if not page or "original" not in page:
+        return None
+    return full_size_url(page["original"]["source"])
+
+
+def html_fragment(html: str) -> BeautifulSoup:
+    """Parse an API HTML fragment so the page extractors can walk it."""
+    return BeautifulSoup(html, "lxml")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Per-stage timings and counters for the scraping scripts, with a run report.
+
+Stages are timed with `stage(name)` (a context manager) or `@timed(name)`.
+Each stage keeps its call count, total and max seconds. Nested stages are
+inclusive: "http.ttfb" includes "http.connect" whenever a new connection
+had to be opened. Counters (`count(name, n)`) hold bytes transferred and
+cache hits/misses.
+
+Stages recorded by the shared modules:
+
+    http.connect    DNS + TCP (+ TLS) for each new pooled connection
+    http.ttfb       request sent -> response headers (retries included)
+    http.download   page body read
+    image.download  image body streamed to disk
+    parse           HTML -> BeautifulSoup
+    extract.<name>  each extractor
+    write           output files
+
+`run_report(script)` wraps a script's main(). At the end of the run, even
+an interrupted one, it writes a JSON report (timestamped, so runs can be
+compared) and a Prometheus textfile (`<script>.prom`, replaced atomically,
+for the node_exporter textfile collector) to REPORT_DIR.
+
+Usage:
+    from metrics import run_report, stage, timed
+
+    @timed("extract.languages")
+    def extract_languages(soup): ...
+
+    with stage("write"):
+        json.dump(data, f)
+
+    if __name__ == "__main__":
+        with run_report("scrape_species"):
+            main()
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+REPORT_DIR = Path(os.environ.get("WIKI_REPORT_DIR", Path(__file__).parent / ".cache" / "reports"))
+
+PROMETHEUS_PREFIX = "swjdr_scraper"
+
+
+class Metrics:
+    """Thread-safe stage timers and counters for one run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stages: dict[str, list[float]] = {}  # name -> [calls, total, max]
+            self.counters: dict[str, float] = {}
+            self.started = time.time()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.stages.setdefault(name, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        """Decorator: time every call of the function as stage `name`."""
+        def decorate(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def snapshot(self) -> dict:
+        """Picklable copy of the stages and counters (e.g. to return from a worker process)."""
+        with self._lock:
+            return {"stages": {k: list(v) for k, v in self.stages.items()}, "counters": dict(self.counters)}
+
+    def merge(self, snapshot: dict) -> None:
+        """Add another process's snapshot into this run."""
+        with self._lock:
+            for name, (calls, total, peak) in snapshot["stages"].items():
+                entry = self.stages.setdefault(name, [0, 0.0, 0.0])
+                entry[0] += calls
+                entry[1] += total
+                entry[2] = max(entry[2], peak)
+            for name, amount in snapshot["counters"].items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self, script: str) -> dict:
+        """The run as a JSON-serialisable dict, stages sorted by total time."""
+        snapshot = self.snapshot()
+        return {
+            "script": script,
+            "started": self.started,
+            "duration_s": time.time() - self.started,
+            "stages": {
+                name: {"calls": int(calls), "total_s": round(total, 6), "max_s": round(peak, 6),
+                       "mean_ms": round(total / calls * 1000, 3) if calls else 0.0}
+                for name, (calls, total, peak) in sorted(snapshot["stages"].items(), key=lambda kv: -kv[1][1])
+            },
+            "counters": snapshot["counters"],
+        }
+
+    def write(self, script: str, directory: Path = REPORT_DIR) -> tuple[Path, Path]:
+        """Write the JSON report and the Prometheus textfile. Returns both paths."""
+        directory.mkdir(parents=True, exist_ok=True)
+        report = self.report(script)
+
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(report["started"]))
+        json_path = directory / f"{script}-{stamp}.json"
+        json_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+        prom_path = directory / f"{script}.prom"
+        tmp = prom_path.with_suffix(".prom.tmp")
+        tmp.write_text(prometheus_text(report), encoding="utf-8")
+        os.replace(tmp, prom_path)
+        return json_path, prom_path
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def prometheus_text(report: dict) -> str:
+    """Render a report in the Prometheus text exposition format."""
+    script = report["script"]
+    p = PROMETHEUS_PREFIX
+    lines = [
+        f"# HELP {p}_run_duration_seconds Wall time of the last run.",
+        f"# TYPE {p}_run_duration_seconds gauge",
+        f'{p}_run_duration_seconds{{script="{script}"}} {report["duration_s"]:.6f}',
+        f"# HELP {p}_run_timestamp_seconds Start time of the last run.",
+        f"# TYPE {p}_run_timestamp_seconds gauge",
+        f'{p}_run_timestamp_seconds{{script="{script}"}} {report["started"]:.0f}',
+        f"# HELP {p}_stage_seconds Time spent per stage in the last run.",
+        f"# TYPE {p}_stage_seconds gauge",
+    ]
+    for name, s in report["stages"].items():
+        lines.append(f'{p}_stage_seconds{{script="{script}",stage="{name}"}} {s["total_s"]:.6f}')
+    lines += [f"# HELP {p}_stage_calls Calls per stage in the last run.", f"# TYPE {p}_stage_calls gauge"]
+    for name, s in report["stages"].items():
+        lines.append(f'{p}_stage_calls{{script="{script}",stage="{name}"}} {s["calls"]}')
+    for name, value in sorted(report["counters"].items()):
+        metric = f"{p}_{_metric_name(name)}"
+        lines += [f"# TYPE {metric} gauge", f'{metric}{{script="{script}"}} {value}']
+    return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+stage = METRICS.stage
+timed = METRICS.timed
+count = METRICS.count
+
+
+@contextmanager
+def run_report(script: str, directory: Path = REPORT_DIR):
+    """Time a whole run and write its report when it ends (also on errors / Ctrl-C)."""
+    METRICS.reset()
+    try:
+        yield METRICS
+    finally:
+        json_path, prom_path = METRICS.write(script, directory)
+        print(f"\nRun report: {json_path} (Prometheus: {prom_path.name})")
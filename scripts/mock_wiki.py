@@ -0,0 +1,694 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Fandom wikis, for exercising the scrapers offline
+and for end-to-end crawl load tests.
+
+Every wiki it hosts gets rendered pages under /wiki/<title> and the subset
+of api.php the scripts use (action=query with pageimages/extracts/revisions
+and, for File: pages, imageinfo; action=parse with sections/text). Batch
+limits and extract continuation behave like the real API so the batching
+code is exercised. Two corpora:
+
+    sample_pages()     a handful of fixed Wookieepedia-style articles,
+                       served at /wiki/<title> and /api.php (the default)
+    --species N        N generated species, rendered on the fly and
+                       deterministically from the title, as two wikis:
+
+    /swse/wiki/Category:Species?from=N   paginated category listing
+    /swse/wiki/Species                   species tables (SPECIES / IMAGE columns)
+    /swse/wiki/<title>                   SWSE species page (stat block, traits)
+    /starwars/wiki/<title>               Wookieepedia article (infobox, lore sections)
+    /swse/api.php, /starwars/api.php     api.php over the same pages
+    /images/.../<name>.png[/revision/latest[/scale-to-width-down/N]]
+    /__stats                             request counters as JSON
+
+Fault injection works with either corpus: --latency adds jittered delay to
+every response, --rate-limit / --error-rate answer a share of requests
+with 429 / 503 (with Retry-After), and --truncate-rate sends a full
+Content-Length but only half of the body. Every page carries a revision
+ID (wgRevisionId, and prop=revisions); --edit-rate serves a share of the
+generated pages at a newer revision, with a changed body, to exercise
+scrape_species --update.
+
+The scripts find it through the base-URL overrides read by wiki_http
+(SWSE_WIKI_URL, WOOKIEEPEDIA_WIKI_URL, WIKI_IMAGE_HOST); --run sets them,
+turns the politeness delays and page cache off, runs a command and
+reports end-to-end throughput. The command writes the scripts' usual
+outputs (species_data.json, assets/...), so run it on a scratch checkout.
+
+Usage:
+    python mock_wiki.py                # serve the sample pages on :8080
+    python mock_wiki.py --species 20000 --port 8080
+    python mock_wiki.py --species 20000 --latency 50 --error-rate 0.02 \\
+        --truncate-rate 0.01 --run "python scrape_species.py --limit 2000"
+
+    from mock_wiki import MockWiki, sample_pages
+
+    with MockWiki(sample_pages()) as wiki:
+        api = MediaWikiAPI(wiki.base_url)
+"""
+
+import argparse
+import functools
+import hashlib
+import html as html_lib
+import json
+import os
+import random
+import re
+import struct
+import subprocess
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable
+from urllib.parse import parse_qs, quote, unquote, urlparse
+
+from profiling import add_profile_argument, profiled
+
+# Real MediaWiki limits for non-bot clients
+MAX_TITLES = 50
+MAX_EXTRACTS = 20
+
+# Category members per listing page (Fandom shows 200)
+CATEGORY_PAGE_SIZE = 200
+
+# Rows on the generated /wiki/Species tables page
+TABLE_ROWS = 300
+
+# Width of the "original" image when no scaled rendition is asked for
+ORIGINAL_IMAGE_WIDTH = 1200
+
+# Navigation links around each generated page (Fandom skin)
+CHROME_LINKS = 300
+
+SYLLABLES = ["ka", "ro", "tii", "zen", "mar", "lo", "qua", "dre", "sul", "vek", "an", "tho", "rii", "gal", "ne", "os"]
+
+# Real names listed first on the tables page, so scrape_species_page finds its species
+TABLE_SPECIES = ["Human", "Twi'lek", "Zabrak", "Chiss", "Cathar", "Togruta", "Mirialan", "Rodian",
+                 "Wookiee", "Trandoshan", "Duros", "Bothan", "Kel Dor", "Zeltron", "Sullustan", "Nikto"]
+
+ABILITIES = ["Strength", "Dexterity", "Constitution", "Intelligence", "Wisdom", "Charisma"]
+
+TRAITS = ["Darkvision", "Low-Light Vision", "Great Fortitude", "Rage", "Deceptive", "Intimidating",
+          "Heightened Awareness", "Superior Defenses", "Bonus Feat", "Conditional Bonus Feat"]
+
+# Site path prefix -> wiki_http environment override pointing at it
+SITE_ENV = {"": "WOOKIEEPEDIA_WIKI_URL", "swse": "SWSE_WIKI_URL", "starwars": "WOOKIEEPEDIA_WIKI_URL"}
+
+# Section headings only (infobox labels are <h3 class="pi-data-label"> too)
+HEADING_RE = re.compile(r"<h([23])[^>]*>\s*(<span class=\"mw-headline\".*?)</h\1>", re.S)
+PARAGRAPH_RE = re.compile(r"<p[^>]*>(.*?)</p>", re.S)
+TAG_RE = re.compile(r"<[^>]+>")
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="UTF-8"><title>{title} | Fandom</title>
+<script>RLCONF={{"wgArticleId":{article_id},"wgRevisionId":{revid}}};</script></head>
+<body class="mediawiki skin-fandomdesktop">
+<nav class="global-navigation">{chrome}</nav>
+<main class="page__main">
+<h1 class="page-header__title">{title}</h1>
+<div id="mw-content-text"><div class="mw-parser-output">
+{body}
+</div></div>
+</main>
+<footer class="global-footer">{chrome}</footer>
+</body></html>
+"""
+
+INFOBOX_TEMPLATE = """<aside class="portable-infobox">
+<figure class="pi-item pi-image"><a class="image image-thumbnail" href="{src}">
+<img class="pi-image-thumbnail" src="{src}/revision/latest/scale-to-width-down/268" width="268" height="268"></a></figure>
+{rows}</aside>"""
+
+INFOBOX_ROW_TEMPLATE = """<div class="pi-item pi-data" data-source="{source}"><h3 class="pi-data-label">{label}</h3><div class="pi-data-value">{value}</div></div>
+"""
+
+
+def normalize_title(title: str) -> str:
+    """Apply MediaWiki title normalisation: underscores to spaces, first letter upper."""
+    title = unquote(title).replace("_", " ").strip()
+    return title[:1].upper() + title[1:]
+
+
+def page_id(title: str) -> int:
+    return zlib.crc32(title.encode("utf-8")) % 10 ** 6
+
+
+def strip_tags(fragment: str) -> str:
+    return html_lib.unescape(TAG_RE.sub("", fragment)).strip()
+
+
+def split_sections(body: str) -> list[dict]:
+    """
+    Split page body HTML into MediaWiki-style sections.
+    Section 0 is the intro; each section runs until the next heading of
+    the same or a higher level (so it includes its subsections).
+    """
+    headings = list(HEADING_RE.finditer(body))
+    sections = [{"index": "0", "level": "1", "line": "", "html": body[:headings[0].start()] if headings else body}]
+    for i, match in enumerate(headings):
+        level = int(match.group(1))
+        end = len(body)
+        for later in headings[i + 1:]:
+            if int(later.group(1)) <= level:
+                end = later.start()
+                break
+        sections.append({
+            "index": str(i + 1),
+            "level": str(level),
+            "line": strip_tags(match.group(2)),
+            "html": body[match.start():end],
+        })
+    return sections
+
+
+def plain_extract(fragment: str) -> str:
+    """Plain-text intro extract, one paragraph per line (like explaintext)."""
+    return "\n".join(strip_tags(p) for p in PARAGRAPH_RE.findall(fragment))
+
+
+def render_page(title: str, page: dict) -> str:
+    """Render a page dict as a full Fandom-style HTML document."""
+    return PAGE_TEMPLATE.format(title=html_lib.escape(title), body=page["html"], chrome=page.get("chrome", ""),
+                                article_id=page_id(title), revid=page.get("revid", 1))
+
+
+@functools.lru_cache(maxsize=64)
+def png_image(width: int, height: int, color: tuple[int, int, int]) -> bytes:
+    """A solid-colour RGB PNG."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    row = b"\x00" + bytes(color) * width
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(row * height, 6))
+            + chunk(b"IEND", b""))
+
+
+def species_name(index: int) -> str:
+    """Unique, pronounceable name for synthetic species `index`."""
+    digits = []
+    while index or len(digits) < 3:
+        index, digit = divmod(index, len(SYLLABLES))
+        digits.append(SYLLABLES[digit])
+    return "".join(digits).capitalize()
+
+
+def title_rng(title: str) -> random.Random:
+    """Per-title RNG, so a page renders identically on every request."""
+    return random.Random(zlib.crc32(title.encode("utf-8")))
+
+
+def base_revision(title: str) -> int:
+    """Revision ID a synthetic page starts at."""
+    return zlib.crc32(title.encode("utf-8")) % 1_000_000 * 10 + 1
+
+
+class PageSet:
+    """
+    A fixed set of pages: `pages` maps a title to {"html": body, "image":
+    url or None, "revid": int, "timestamp": iso8601}.
+    """
+
+    def __init__(self, pages: dict[str, dict]):
+        self.pages = {normalize_title(t): p for t, p in pages.items()}
+
+    def page(self, title: str, params: dict[str, str]) -> dict | None:
+        return self.pages.get(title)
+
+
+class SyntheticWiki:
+    """
+    Generated species pages of one wiki, "swse" (category listing, species
+    tables, stat-block pages) or "starwars" (Wookieepedia articles). Every
+    title exists; `image_url` maps a name to its URL on the serving host.
+    """
+
+    def __init__(self, site: str, species: int, image_url: Callable[[str], str], edit_rate: float = 0.0):
+        self.site = site
+        self.species = species
+        self.image_url = image_url
+        self.edit_rate = edit_rate
+        self.chrome = "<ul>" + "".join(
+            f'<li><a href="/wiki/Special:Link_{i}">Link {i}</a></li>' for i in range(CHROME_LINKS)
+        ) + "</ul>"
+
+    def edited(self, title: str) -> bool:
+        """Whether `title` was edited since its base revision (deterministic per title)."""
+        return title_rng(f"{title}#edit").random() < self.edit_rate
+
+    def page(self, title: str, params: dict[str, str]) -> dict:
+        image = None
+        if self.site == "starwars":
+            body, image = self.wookieepedia_page(title)
+        elif title == "Category:Species":
+            start = params.get("from", "0")
+            body = self.category_page(int(start) if start.isdigit() else 0)
+        elif title == "Species":
+            body = self.species_tables_page()
+        else:
+            body, image = self.swse_species_page(title)
+        if self.edited(title):
+            body += f"<p>{title} page revised.</p>"
+        return {"html": body, "image": image, "chrome": self.chrome,
+                "revid": base_revision(title) + self.edited(title), "timestamp": "2024-01-01T00:00:00Z"}
+
+    def category_page(self, start: int) -> str:
+        end = min(start + CATEGORY_PAGE_SIZE, self.species)
+        members = "".join(
+            f'<li class="category-page__member"><a href="/swse/wiki/{quote(species_name(i))}" '
+            f'class="category-page__member-link">{species_name(i)}</a></li>'
+            for i in range(start, end)
+        )
+        content = f'<ul class="category-page__members-for-char">{members}</ul>'
+        if end < self.species:
+            content += (f'<a href="/swse/wiki/Category:Species?from={end}" '
+                        f'class="category-page__pagination-next">Next</a>')
+        return content
+
+    def species_tables_page(self) -> str:
+        names = TABLE_SPECIES + [species_name(i) for i in range(min(TABLE_ROWS, self.species))]
+        rows = "".join(
+            f'<tr><td><a href="/swse/wiki/{quote(name)}">{name}</a></td>'
+            f'<td>+2 Dexterity, -2 Wisdom</td><td><a class="image" href="#">'
+            f'<img data-src="{self.image_url(name)}/revision/latest/scale-to-width-down/80" '
+            f'width="80" height="80"></a></td></tr>'
+            for name in names
+        )
+        return f'<table class="wikitable"><tr><th>Species</th><th>Ability Modifiers</th><th>Image</th></tr>{rows}</table>'
+
+    def swse_species_page(self, title: str) -> tuple[str, str]:
+        rng = title_rng(title)
+        up, down = rng.sample(ABILITIES, 2)
+        traits = rng.sample(TRAITS, 3)
+        language = title.split("/")[0].replace(" ", "") + "ese"
+        image = self.image_url(title)
+        content = f"""<div class="floatright"><a href="#" class="image image-thumbnail"><img src="{image}/revision/latest/scale-to-width-down/250" width="250" height="300"></a></div>
+<p>The <b>{title}</b> are a species native to a world of the Outer Rim, found across the galaxy as traders, pilots and adventurers.</p>
+<p>{title} heroes can be found among the Jedi, scoundrels and soldiers of every era of the galaxy's long history.</p>
+<h2><span class="mw-headline">{title} Characteristics</span></h2>
+<p><b>Personality:</b> {title}s are often cautious and pragmatic.</p>
+<p><b>Languages:</b> Basic, {language}.</p>
+<h3><span class="mw-headline">{title} Species Traits</span></h3>
+<ul><li><b>Ability Modifiers:</b> +2 {up}, -2 {down}.</li>
+{''.join(f'<li><b>{t}:</b> {title}s have the {t} trait.</li>' for t in traits)}
+</ul>"""
+        return content, image
+
+    def wookieepedia_page(self, title: str) -> tuple[str, str]:
+        name = title.split("/")[0]
+        rng = title_rng(title)
+        homeworld = species_name(rng.randrange(10_000)) + " Prime"
+        image = self.image_url(name)
+        sections = "".join(
+            f'<h2><span class="mw-headline">{heading}</span></h2>'
+            + "".join(f"<p>{name} {heading.lower()} paragraph {i}: the {name} of {homeworld} "
+                      f"were studied by Republic scholars for centuries.<sup>[{i + 1}]</sup></p>"
+                      for i in range(3))
+            for heading in ("Biology and appearance", "Society and culture", "History")
+        )
+        rows = (INFOBOX_ROW_TEMPLATE.format(source="height", label="Average height", value=f"1.{rng.randrange(4, 9)} meters")
+                + INFOBOX_ROW_TEMPLATE.format(source="homeworld", label="Homeworld", value=homeworld))
+        content = f"""{INFOBOX_TEMPLATE.format(src=image, rows=rows)}
+<p>The <b>{name}</b> were a sentient species native to {homeworld}.</p>
+<p>{name}s were a common sight throughout the galaxy during the Old Republic era.</p>
+{sections}"""
+        return content, image
+
+
+class MockWiki:
+    """
+    Wikis served over HTTP on localhost. `pages` serves one fixed PageSet at
+    the root; `sites` maps path prefixes ("swse", "starwars") to page
+    sources instead (see synthetic()).
+    """
+
+    def __init__(self, pages: dict[str, dict] | None = None, host: str = "127.0.0.1", port: int = 0,
+                 sites: dict[str, PageSet | SyntheticWiki] | None = None, latency_ms: float = 0.0,
+                 rate_limit: float = 0.0, error_rate: float = 0.0, retry_after: int = 1,
+                 truncate_rate: float = 0.0, seed: int = 0):
+        self.sites = sites if sites is not None else {"": PageSet(pages or {})}
+        self.latency_ms = latency_ms
+        self.rate_limit = rate_limit
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.truncate_rate = truncate_rate
+        self.request_log: list[str] = []
+        self.stats = {"requests": 0, "bytes": 0, "status": {}, "truncated": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @classmethod
+    def synthetic(cls, species: int, edit_rate: float = 0.0, **kwargs) -> "MockWiki":
+        """`species` generated species as a SWSE wiki (/swse) and a Wookieepedia (/starwars)."""
+        wiki = cls(sites={}, **kwargs)
+        wiki.sites = {site: SyntheticWiki(site, species, wiki.image_url, edit_rate) for site in ("swse", "starwars")}
+        return wiki
+
+    @property
+    def pages(self) -> dict[str, dict]:
+        """The fixed pages served at the root (empty for synthetic wikis)."""
+        root = self.sites.get("")
+        return root.pages if isinstance(root, PageSet) else {}
+
+    # --- URLs --------------------------------------------------------------
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def site_url(self, prefix: str) -> str:
+        """Root of one hosted wiki (what SWSE_WIKI_URL / WOOKIEEPEDIA_WIKI_URL expect)."""
+        return f"{self.root_url}/{prefix}" if prefix else self.root_url
+
+    @property
+    def base_url(self) -> str:
+        """Drop-in replacement for e.g. "https://starwars.fandom.com/wiki/" (the first site)."""
+        return f"{self.site_url(next(iter(self.sites)))}/wiki/"
+
+    @property
+    def env(self) -> dict[str, str]:
+        """Environment variables pointing the scripts at this server."""
+        env = {SITE_ENV[prefix]: self.site_url(prefix) for prefix in self.sites}
+        env["WIKI_IMAGE_HOST"] = urlparse(self.root_url).netloc
+        return env
+
+    def image_url(self, name: str) -> str:
+        digest = f"{zlib.crc32(name.encode('utf-8')):08x}"
+        return f"{self.root_url}/images/{digest[0]}/{digest[:2]}/{quote(name.replace(' ', '_'))}.png"
+
+    # --- Serving -----------------------------------------------------------
+
+    def start(self) -> "MockWiki":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve in the foreground until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        if self._thread:
+            self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockWiki":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # --- Rendering ---------------------------------------------------------
+
+    def image(self, path: str) -> bytes:
+        width = ORIGINAL_IMAGE_WIDTH
+        if "/scale-to-width-down/" in path:
+            width = int(path.rsplit("/", 1)[1])
+        rng = title_rng(path.split("/revision")[0])
+        return png_image(width, width * 6 // 5, (rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+
+    def route(self, path: str, params: dict[str, str]) -> tuple[int, str, bytes]:
+        """(status, content type, body) for a request path."""
+        if path.startswith("/images/"):
+            return 200, "image/png", self.image(path)
+        for prefix in sorted(self.sites, key=len, reverse=True):
+            site, root = self.sites[prefix], f"/{prefix}" if prefix else ""
+            if path == f"{root}/api.php":
+                return 200, "application/json; charset=utf-8", json.dumps(self.api(site, params)).encode("utf-8")
+            if path.startswith(f"{root}/wiki/"):
+                title = normalize_title(path[len(f"{root}/wiki/"):])
+                page = site.page(title, params)
+                if page is None:
+                    break
+                return 200, "text/html; charset=utf-8", render_page(title, page).encode("utf-8")
+        return 404, "text/plain", b"Not Found"
+
+    def api(self, site: PageSet | SyntheticWiki, params: dict[str, str]) -> dict:
+        action = params.get("action")
+        if action == "query":
+            return self.api_query(site, params)
+        if action == "parse":
+            return self.api_parse(site, params)
+        return {"error": {"code": "badvalue", "info": f"Unrecognized action: {action}"}}
+
+    def api_query(self, site: PageSet | SyntheticWiki, params: dict[str, str]) -> dict:
+        titles = params.get("titles", "").split("|")
+        if len(titles) > MAX_TITLES:
+            return {"error": {"code": "toomanyvalues",
+                              "info": f"Too many values supplied for parameter \"titles\". The limit is {MAX_TITLES}."}}
+        props = params.get("prop", "").split("|")
+        ex_offset = int(params.get("excontinue", 0))
+        first_round = "excontinue" not in params
+
+        normalized, pages = [], []
+        existing = []
+        for raw in titles:
+            title = normalize_title(raw)
+            if title != raw:
+                normalized.append({"from": raw, "to": title})
+            if title.startswith("File:") and "imageinfo" in props:
+                pages.append(self.file_info(title))
+                continue
+            page = site.page(title, {})
+            if page is None:
+                pages.append({"title": title, "missing": True})
+                continue
+            existing.append((title, page))
+
+        for i, (title, page) in enumerate(existing):
+            entry = {"pageid": page_id(title), "ns": 0, "title": title}
+            if first_round and "pageimages" in props and page.get("image"):
+                entry["original"] = {"source": f"{page['image']}/revision/latest?cb=20200101"}
+            if first_round and "revisions" in props:
+                entry["revisions"] = [{"revid": page.get("revid", 1), "parentid": 0,
+                                       "timestamp": page.get("timestamp", "2020-01-01T00:00:00Z")}]
+            if "extracts" in props and ex_offset <= i < ex_offset + MAX_EXTRACTS:
+                entry["extract"] = plain_extract(split_sections(page["html"])[0]["html"])
+            pages.append(entry)
+
+        data = {"batchcomplete": True, "query": {"pages": pages}}
+        if normalized:
+            data["query"]["normalized"] = normalized
+        if "extracts" in props and ex_offset + MAX_EXTRACTS < len(existing):
+            data["continue"] = {"excontinue": ex_offset + MAX_EXTRACTS, "continue": "||"}
+            del data["batchcomplete"]
+        return data
+
+    def file_info(self, title: str) -> dict:
+        """A File: page with the imageinfo of the original /images/ serves for it."""
+        body = self.image(urlparse(self.image_url(title[len("File:"):].rsplit(".", 1)[0])).path)
+        return {"pageid": page_id(title), "ns": 6, "title": title,
+                "imageinfo": [{"sha1": hashlib.sha1(body).hexdigest(), "size": len(body)}]}
+
+    def api_parse(self, site: PageSet | SyntheticWiki, params: dict[str, str]) -> dict:
+        title = normalize_title(params.get("page", ""))
+        page = site.page(title, {})
+        if page is None:
+            return {"error": {"code": "missingtitle", "info": "The page you specified doesn't exist."}}
+        sections = split_sections(page["html"])
+        result = {"title": title, "pageid": page_id(title)}
+        prop = params.get("prop", "text")
+        if "sections" in prop:
+            result["sections"] = [
+                {"toclevel": int(s["level"]) - 1, "level": s["level"], "line": s["line"],
+                 "number": s["index"], "index": s["index"]}
+                for s in sections[1:]
+            ]
+        if "text" in prop:
+            index = int(params.get("section", -1))
+            if index >= len(sections):
+                return {"error": {"code": "nosuchsection", "info": f"There is no section {index}."}}
+            body = sections[index]["html"] if index >= 0 else page["html"]
+            result["text"] = f'<div class="mw-parser-output">{body}</div>'
+        return {"parse": result}
+
+    # --- Faults / HTTP plumbing --------------------------------------------
+
+    def draw(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def record(self, status: int, size: int, truncated: bool = False) -> None:
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += size
+            self.stats["status"][str(status)] = self.stats["status"].get(str(status), 0) + 1
+            self.stats["truncated"] += truncated
+
+    def _handler_class(self):
+        wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; without this the body
+            # waits on the client's delayed ACK (~40 ms per response)
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def send_body(self, status: int, content_type: str, body: bytes, headers: dict | None = None):
+                truncated = status == 200 and wiki.draw() < wiki.truncate_rate
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if truncated:
+                    self.send_header("Connection", "close")
+                    self.close_connection = True
+                self.end_headers()
+                sent = body[:len(body) // 2] if truncated else body
+                self.wfile.write(sent)
+                wiki.record(status, len(sent), truncated)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/__stats":
+                    body = json.dumps(wiki.stats).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+
+                wiki.request_log.append(self.path)
+                if wiki.latency_ms:
+                    time.sleep(wiki.latency_ms / 1000 * (0.5 + wiki.draw()))
+
+                fault = wiki.draw()
+                if fault < wiki.rate_limit:
+                    self.send_body(429, "text/plain", b"Too Many Requests", {"Retry-After": str(wiki.retry_after)})
+                elif fault < wiki.rate_limit + wiki.error_rate:
+                    self.send_body(503, "text/plain", b"Service Unavailable", {"Retry-After": str(wiki.retry_after)})
+                else:
+                    params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                    self.send_body(*wiki.route(url.path, params))
+
+        return Handler
+
+
+def sample_pages() -> dict[str, dict]:
+    """A handful of species pages shaped like Wookieepedia/SWSE articles."""
+    def article(name: str, homeworld: str) -> str:
+        return f"""
+<p>The <b>{name}</b> were a sentient species native to the planet {homeworld}, known throughout the galaxy for their culture.</p>
+<p>{name} individuals were often found far from {homeworld}, working as traders, pilots and mercenaries.</p>
+<h2><span class="mw-headline" id="Biology_and_appearance">Biology and appearance</span></h2>
+<p>{name} were humanoids with distinctive features that made them recognizable across the galaxy.</p>
+<h3><span class="mw-headline" id="Physiology">Physiology</span></h3>
+<p>Their physiology was adapted to the climate of {homeworld} over millennia of evolution.</p>
+<h2><span class="mw-headline" id="Society_and_culture">Society and culture</span></h2>
+<p>{name} society valued loyalty to the clan above all else, and honor was earned through deeds.</p>
+<h2><span class="mw-headline" id="History">History</span></h2>
+<p>The {name} first made contact with the Galactic Republic thousands of years before the Great Sith War.</p>
+<h2><span class="mw-headline" id="Appearances">Appearances</span></h2>
+<ul><li>Star Wars: The Old Republic</li></ul>
+"""
+
+    species = {
+        "Human/Legends": "Coruscant",
+        "Twi'lek/Legends": "Ryloth",
+        "Chiss/Legends": "Csilla",
+        "Zabrak/Legends": "Iridonia",
+        "Kel Dor/Legends": "Dorin",
+    }
+    pages = {}
+    for i, (title, homeworld) in enumerate(species.items()):
+        name = title.split("/")[0]
+        image = f"https://static.wikia.nocookie.net/starwars/images/0/00/{name.replace(' ', '_')}.png"
+        pages[title] = {
+            "html": INFOBOX_TEMPLATE.format(src=image, rows="") + article(name, homeworld),
+            "image": image,
+            "revid": 1000 + i,
+            "timestamp": "2024-01-01T00:00:00Z",
+        }
+    return pages
+
+
+def run_command(wiki: MockWiki, command: str, keep_delays: bool = False) -> int:
+    """Run `command` against the server and print end-to-end numbers."""
+    env = dict(os.environ, **wiki.env, WIKI_CACHE="off")
+    if not keep_delays:
+        env["WIKI_DELAY_SCALE"] = "0"
+
+    print(f"Running: {command}\n")
+    start = time.perf_counter()
+    returncode = subprocess.run(command, shell=True, env=env, cwd=Path(__file__).parent).returncode
+    elapsed = time.perf_counter() - start
+
+    stats = wiki.stats
+    print("\n" + "=" * 60)
+    print(f"Exit code: {returncode}")
+    print(f"Wall time: {elapsed:.1f}s")
+    print(f"Requests: {stats['requests']} ({stats['requests'] / elapsed:.1f}/s), "
+          f"{stats['bytes'] / 1024 / 1024:.1f} MB served")
+    print(f"Status: {', '.join(f'{k}: {v}' for k, v in sorted(stats['status'].items()))}; "
+          f"truncated: {stats['truncated']}")
+    print("=" * 60)
+    return returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in Fandom wiki")
+    parser.add_argument("--species", type=int, default=0,
+                        help="Serve this many generated species as /swse and /starwars wikis "
+                             "(default: the fixed sample pages)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int,
+                        help="Port to serve on (default 8080; a free one with --run). Give the same "
+                             "port to consecutive --run invocations so the queued URLs stay valid")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mean added latency per response (ms)")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Share of requests answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered 503")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After on 429/503 (seconds)")
+    parser.add_argument("--truncate-rate", type=float, default=0.0, help="Share of bodies cut in half")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the fault draws")
+    parser.add_argument("--edit-rate", type=float, default=0.0,
+                        help="With --species: share of pages served at a newer revision (for update runs)")
+    parser.add_argument("--run", help="Command to run against the server, then exit")
+    parser.add_argument("--keep-delays", action="store_true", help="Keep the scripts' politeness delays with --run")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if args.edit_rate and not args.species:
+        parser.error("--edit-rate needs --species")
+
+    options = dict(host=args.host, port=args.port if args.port is not None else (0 if args.run else 8080),
+                   latency_ms=args.latency, rate_limit=args.rate_limit, error_rate=args.error_rate,
+                   retry_after=args.retry_after, truncate_rate=args.truncate_rate, seed=args.seed)
+    if args.species:
+        wiki = MockWiki.synthetic(args.species, args.edit_rate, **options)
+    else:
+        wiki = MockWiki(sample_pages(), **options)
+
+    if args.run:
+        with wiki:
+            raise SystemExit(run_command(wiki, args.run, args.keep_delays))
+
+    corpus = f"{args.species} generated species" if args.species else f"{len(sample_pages())} sample pages"
+    print(f"Serving {corpus} at {wiki.root_url}")
+    for prefix in wiki.sites:
+        print(f"  {wiki.site_url(prefix)}/wiki/  (api: {wiki.site_url(prefix)}/api.php)")
+    for name, value in wiki.env.items():
+        print(f"  export {name}={value}")
+    wiki.serve_forever()
+
+
+if __name__ == "__main__":
+    with profiled("mock_wiki"):
+        main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-host pacing, retry backoff and circuit breaking.
+
+Every request to a host first books a slot from that host's HostPacer.
+The interval between slots adapts to how the host is coping:
+
+    fast response (< FAST_RESPONSE)   interval * SPEEDUP  (down to MIN_INTERVAL)
+    slow response                     interval * SLOWDOWN
+    429 / 5xx / connection error      interval * BACKOFF  (up to MAX_INTERVAL)
+
+A Retry-After header holds the whole host (not just the request that got
+it) for that long. The failed request itself is retried up to
+RETRY_ATTEMPTS times with full-jitter exponential backoff.
+
+After BREAKER_THRESHOLD transient failures in a row the host's circuit
+opens: nothing is sent to it for BREAKER_COOLDOWN seconds, then a single
+probe request goes out. A successful probe closes the circuit; a failed
+one reopens it for twice as long. After BREAKER_MAX_TRIPS failed probes
+the host is given up for the run and requests to it raise
+CircuitOpenError straight away, so scripts record the pages as failed
+(scrape_species --retry-failed picks them up later).
+
+Intervals are scaled by WIKI_DELAY_SCALE; Retry-After, backoff and the
+breaker cooldowns are not, so a local load test still exercises them.
+
+Usage:
+    pacer = pacer_for(url, start_interval=0.5)
+    pacer.wait()                        # blocks until the host's next slot
+    start = time.perf_counter()
+    response = session.get(url)
+    pacer.record(response.status_code, time.perf_counter() - start,
+                 parse_retry_after(response.headers.get("Retry-After")))
+"""
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+import metrics
+
+# Multiplier applied to every pacing interval
+DELAY_SCALE = float(os.environ.get("WIKI_DELAY_SCALE", "1"))
+
+# Seconds between two requests to the same host
+DEFAULT_INTERVAL = 0.5
+MIN_INTERVAL = 0.2
+MAX_INTERVAL = 30.0
+
+# Response time (to headers) under which a host is considered healthy
+FAST_RESPONSE = 1.0
+SPEEDUP = 0.9
+SLOWDOWN = 1.5
+BACKOFF = 2.0
+
+# Transient failures: retried with full-jitter exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_ATTEMPTS = 5
+RETRY_BASE = 1.0
+RETRY_CAP = 60.0
+
+# Circuit breaker
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 30.0
+BREAKER_MAX_COOLDOWN = 600.0
+BREAKER_MAX_TRIPS = 4
+
+# While a probe is in flight, other requests check back this often
+PROBE_POLL = 1.0
+
+# A probe with no result after this long (cancelled before it went out) is written off
+PROBE_TIMEOUT = 60.0
+
+
+class CircuitOpenError(requests.RequestException):
+    """The host kept failing and has been given up for this run."""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), BREAKER_MAX_COOLDOWN)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry number `attempt` + 1."""
+    return random.uniform(0, min(RETRY_CAP, RETRY_BASE * 2 ** attempt))
+
+
+class HostPacer:
+    """Pacing and circuit-breaker state for one host, shared by all threads."""
+
+    def __init__(self, host: str, interval: float = DEFAULT_INTERVAL):
+        self.host = host
+        self.interval = min(max(interval, MIN_INTERVAL), MAX_INTERVAL)
+        self.next_slot = 0.0    # monotonic time of the next free slot
+        self.hold_until = 0.0   # Retry-After / open circuit: nothing before this
+        self.failures = 0       # transient failures in a row
+        self.trips = 0          # failed probes in a row
+        self.state = "closed"   # closed -> open -> half-open -> closed
+        self.probe_started = 0.0  # monotonic start of the probe in flight, 0 if none
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Book the host's next slot; returns the seconds to wait before admit()."""
+        with self._lock:
+            if self.trips >= BREAKER_MAX_TRIPS:
+                raise CircuitOpenError(f"{self.host}: circuit open, host given up after "
+                                       f"{self.trips} failed probes")
+            now = time.monotonic()
+            slot = max(now, self.next_slot, self.hold_until)
+            self.next_slot = slot + self.interval * DELAY_SCALE
+            return slot - now
+
+    def admit(self) -> bool:
+        """At the booked slot: may the request go out, or must it book again?"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.hold_until:
+                return False
+            if self.state == "open":
+                self.state = "half-open"
+            if self.state == "half-open":
+                if self.probe_started and now - self.probe_started < PROBE_TIMEOUT:
+                    self.hold_until = max(self.hold_until, now + PROBE_POLL)
+                    return False
+                self.probe_started = now
+            return True
+
+    def wait(self) -> None:
+        """Block until a request to the host may go out."""
+        with metrics.stage("http.wait"):
+            while True:
+                delay = self.reserve()
+                if delay > 0:
+                    time.sleep(delay)
+                if self.admit():
+                    return
+
+    def record(self, status: int | None, latency: float, retry_after: float | None = None) -> None:
+        """Feed back one attempt (`status` None for a connection error or cut-off body)."""
+        with self._lock:
+            self.probe_started = 0.0
+            if status is not None and status not in RETRY_STATUSES:
+                if self.state != "closed":  # the probe got through: lift the breaker hold
+                    self.hold_until = 0.0
+                self.failures = self.trips = 0
+                self.state = "closed"
+                factor = SPEEDUP if latency < FAST_RESPONSE else SLOWDOWN
+                self.interval = min(max(self.interval * factor, MIN_INTERVAL), MAX_INTERVAL)
+                return
+
+            now = time.monotonic()
+            self.failures += 1
+            self.interval = min(self.interval * BACKOFF, MAX_INTERVAL)
+            if retry_after:
+                self.hold_until = max(self.hold_until, now + retry_after)
+
+            if self.state == "half-open":
+                self.trips += 1
+            elif self.state == "open" or self.failures < BREAKER_THRESHOLD:
+                return
+            cooldown = min(BREAKER_COOLDOWN * 2 ** self.trips, BREAKER_MAX_COOLDOWN)
+            self.state = "open"
+            self.hold_until = max(self.hold_until, now + cooldown)
+            metrics.count("http.breaker_open")
+            print(f"    [{self.host}] {self.failures} errors in a row, pausing for {cooldown:.0f}s")
+
+
+_pacers: dict[str, HostPacer] = {}
+_pacers_lock = threading.Lock()
+
+
+def pacer_for(url: str, start_interval: float | None = None) -> HostPacer:
+    """The shared pacer for `url`'s host; `start_interval` only applies on first use."""
+    host = urlparse(url).netloc
+    with _pacers_lock:
+        if host not in _pacers:
+            _pacers[host] = HostPacer(host, DEFAULT_INTERVAL if start_interval is None else start_interval)
+        return _pacers[host]
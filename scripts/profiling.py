@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Opt-in profiling for the scraping and cleanup scripts (`--profile`).
+
+`profiled(script)` wraps a script's main() next to run_report, and
+add_profile_argument() gives the script's argument parser a --profile
+flag. When the parser sees the flag, the rest of the run executes under
+cProfile and tracemalloc while a sampler thread records the Python stack
+of every thread SAMPLE_INTERVAL apart. At the end of the profiled() block
+(errors and Ctrl-C included) it writes, next to the run report in
+REPORT_DIR:
+
+    <script>-<stamp>.collapsed     sampled stacks in collapsed format, for
+                                   flamegraph.pl or https://www.speedscope.app
+    <script>-<stamp>.pstats        cProfile data (python -m pstats, snakeviz)
+    <script>-<stamp>-profile.txt   top functions by cumulative and own time,
+                                   then the top allocation sites
+
+Without --profile it does nothing; `profiled(script, enabled=True)`
+profiles the whole block regardless. Only the main process is profiled
+(not the --workers pools).
+
+Usage:
+    from profiling import add_profile_argument, profiled
+
+    parser = argparse.ArgumentParser(...)
+    add_profile_argument(parser)
+
+    if __name__ == "__main__":
+        with run_report("scrape_species"), profiled("scrape_species"):
+            main()
+"""
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+from metrics import REPORT_DIR
+
+# Seconds between two stack samples
+SAMPLE_INTERVAL = 0.005
+
+# Frames kept per allocation traceback, and lines in each report section
+TRACEMALLOC_FRAMES = 8
+TOP_FUNCTIONS = 30
+TOP_ALLOCATIONS = 25
+
+
+# Session of the innermost profiled() block, started by --profile
+_session: "ProfileSession | None" = None
+
+
+class _ProfileAction(argparse.Action):
+    """store_true that also starts the enclosing profiled() block's session."""
+
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, default=False, **kwargs)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, True)
+        if _session is not None:
+            _session.start()
+
+
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--profile", action=_ProfileAction,
+                        help="Profile the run (cProfile + tracemalloc) and write a flamegraph "
+                             "and an allocation report next to the run report")
+
+
+def _frame_name(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class StackSampler(threading.Thread):
+    """Samples the Python stack of every other thread into collapsed-stack counts."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+
+def allocation_report(snapshot: tracemalloc.Snapshot, peak: int) -> str:
+    """Top allocation sites still alive at the end of the run, plus the peak."""
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ])
+    stats = snapshot.statistics("traceback")
+    lines = [f"Peak traced memory: {peak / 1024 / 1024:.1f} MB",
+             f"Top {TOP_ALLOCATIONS} allocation sites still alive at exit:", ""]
+    for stat in stats[:TOP_ALLOCATIONS]:
+        lines.append(f"{stat.size / 1024:10.1f} KB in {stat.count:7} blocks")
+        lines.extend(f"    {line.strip()}" for line in stat.traceback.format(most_recent_first=True))
+    return "\n".join(lines) + "\n"
+
+
+def function_report(profiler: cProfile.Profile) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out).strip_dirs()
+    out.write(f"Top {TOP_FUNCTIONS} functions by cumulative time:\n")
+    stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+    out.write(f"\nTop {TOP_FUNCTIONS} functions by own time:\n")
+    stats.sort_stats("tottime").print_stats(TOP_FUNCTIONS)
+    return out.getvalue()
+
+
+class ProfileSession:
+    """cProfile, tracemalloc and the stack sampler for one profiled() block."""
+
+    def __init__(self, script: str, directory: Path = REPORT_DIR):
+        self.script = script
+        self.directory = directory
+        self.started = False
+
+    def start(self) -> None:
+        if self.started:
+            return
+        self.started = True
+        self.stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.sampler = StackSampler()
+        self.profiler = cProfile.Profile()
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.sampler.start()
+        self.profiler.enable()
+
+    def finish(self) -> None:
+        """Stop profiling and write the reports (no-op if never started)."""
+        if not self.started:
+            return
+        self.profiler.disable()
+        self.sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        base = self.directory / f"{self.script}-{self.stamp}"
+        collapsed_path = base.with_name(base.name + ".collapsed")
+        collapsed_path.write_text(self.sampler.collapsed(), encoding="utf-8")
+        self.profiler.dump_stats(base.with_name(base.name + ".pstats"))
+        report_path = base.with_name(base.name + "-profile.txt")
+        report_path.write_text(function_report(self.profiler) + "\n" + allocation_report(snapshot, peak),
+                               encoding="utf-8")
+        print(f"\nProfile: {collapsed_path} (flamegraph), {report_path.name} (hot spots + allocations)")
+
+
+@contextmanager
+def profiled(script: str, enabled: bool = False, directory: Path = REPORT_DIR):
+    """Profile the block from when its parser sees --profile (or throughout if `enabled`)."""
+    global _session
+    session, outer = ProfileSession(script, directory), _session
+    _session = session
+    if enabled:
+        session.start()
+    try:
+        yield session
+    finally:
+        _session = outer
+        session.finish()
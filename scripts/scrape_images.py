@@ -16,19 +16,24 @@ Examples:
 
 import os
 import re
-import time
 import argparse
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from downloader import FANDOM_IMAGE_HOST, download_scaled_image, existing_download, full_size_url
+from mediawiki_api import MediaWikiAPI
+from metrics import run_report, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+
 
 REQUEST_DELAY = 0.3
 
@@ -36,14 +41,11 @@ REQUEST_DELAY = 0.3
 def get_soup(url: str) -> BeautifulSoup:
     """Fetch a page and return a BeautifulSoup object."""
     print(f"Fetching: {url}")
-    response = requests.get(url, headers={
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) StarWarsJDR-Scraper/1.0"
-    })
-    response.raise_for_status()
-    time.sleep(REQUEST_DELAY)
-    return BeautifulSoup(response.text, "lxml")
+    # Every image on the page is wanted, not just the article body
+    return wiki_http.get_soup(url, delay=REQUEST_DELAY, fast=False)
 
 
+@timed("extract.images")
 def extract_images(soup: BeautifulSoup, base_url: str) -> list[dict]:
     """Extract all significant images from a page."""
     images = []
@@ -71,8 +73,7 @@ def extract_images(soup: BeautifulSoup, base_url: str) -> list[dict]:
         full_url = urljoin(base_url, src)
         
         # Remove Fandom image sizing to get full resolution
-        full_url = re.sub(r"/revision/.*$", "", full_url)
-        full_url = re.sub(r"/scale-to-width-down/\d+", "", full_url)
+        full_url = full_size_url(full_url)
         
         # Get filename
         parsed = urlparse(full_url)
@@ -99,27 +100,22 @@ def extract_images(soup: BeautifulSoup, base_url: str) -> list[dict]:
     return unique
 
 
-def download_image(url: str, output_dir: Path, filename: str) -> bool:
-    """Download an image."""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    filepath = output_dir / filename
+def download_image(url: str, output_dir: Path, filename: str, width: int | None = None,
+                   original_sha1: str | None = None) -> bool:
+    """
+    Download an image, scaled to `width` px if given (extension sniffed from the file).
+    `original_sha1` verifies it when the original is downloaded.
+    """
+    dest_stem = output_dir / Path(filename).stem
     
-    if filepath.exists():
+    if existing_download(dest_stem):
         print(f"  Skipped (exists): {filename}")
         return True
     
     try:
         print(f"  Downloading: {filename}")
-        response = requests.get(url, stream=True, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) StarWarsJDR-Scraper/1.0"
-        })
-        response.raise_for_status()
+        download_scaled_image(url, dest_stem, width, original_sha1)
         
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        time.sleep(REQUEST_DELAY)
         return True
     except Exception as e:
         print(f"  Failed: {e}")
@@ -133,7 +129,12 @@ def main():
                         help="Output directory (default: downloaded_images)")
     parser.add_argument("--min-size", type=int, default=100,
                         help="Minimum image dimension in pixels (default: 100)")
+    parser.add_argument("--width", type=int, default=None,
+                        help="Fetch Fandom images scaled to this width (default: original)")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
     args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
     
     print("=" * 60)
     print("SWSE Image Scraper")
@@ -156,6 +157,13 @@ def main():
     for i, img in enumerate(images, 1):
         print(f"  {i}. {img['filename']} - {img['alt'][:50]}")
     
+    # SHA-1 of the wiki's image files, from its api.php, to verify the originals
+    digests = {}
+    if "/wiki/" in args.url and any(FANDOM_IMAGE_HOST in img["url"] for img in images):
+        api = MediaWikiAPI(args.url.split("/wiki/")[0] + "/wiki/", delay=REQUEST_DELAY)
+        digests = api.image_digests([img["url"] for img in images])
+        print(f"\nChecksums: {len(digests)} of {len(images)} images")
+    
     # Confirm download
     print(f"\nDownloading to: {args.output}/")
     output_dir = Path(args.output)
@@ -163,11 +171,12 @@ def main():
     # Download
     success = 0
     for img in images:
-        if download_image(img["url"], output_dir, img["filename"]):
+        if download_image(img["url"], output_dir, img["filename"], args.width, digests.get(img["url"])):
             success += 1
     
     print(f"\n✓ Downloaded {success}/{len(images)} images to {output_dir}/")
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("scrape_images"), profiled("scrape_images"):
+        main()
@@ -9,113 +9,135 @@ Requirements:
 Usage:
     python scrape_species.py
     python scrape_species.py --images  # Also download species images
+    python scrape_species.py --resume        # Continue an interrupted crawl
+    python scrape_species.py --retry-failed  # Requeue only the species that failed
+    python scrape_species.py --update        # Re-scrape only pages edited since the last crawl
+    python scrape_species.py --workers 4     # Parse pages in 4 processes while the next ones download
 """
 
 import os
 import re
 import json
-import time
 import argparse
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from typing import Iterator
+from urllib.parse import urljoin
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from asset_store import existing_asset, fetch_asset
+from downloader import ASSET_WIDTHS, full_size_url
+from infobox import format_ability_mods, species_facts
+from job_queue import JobQueue
+from mediawiki_api import MediaWikiAPI
+from metrics import METRICS, count, run_report, stage, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+from wiki_parse import page_revision, parse_page
 
-BASE_URL = "https://swse.fandom.com"
+
+BASE_URL = wiki_http.SWSE_WIKI
 SPECIES_LIST_URL = f"{BASE_URL}/wiki/Species"
 SPECIES_CATEGORY_URL = f"{BASE_URL}/wiki/Category:Species"
 
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "species"
 DATA_OUTPUT = Path(__file__).parent / "species_data.json"
 
-# Rate limiting
-REQUEST_DELAY = 0.5  # seconds between requests
+# Species portraits are shown at card size; fetch that rendition, not the original
+IMAGE_WIDTH = ASSET_WIDTHS["species"]
+
+# Checkpointed crawl state (see job_queue.py)
+QUEUE_NAME = "scrape_species"
+
+# Starting interval between requests to a host (adapted at run time, see pacing)
+REQUEST_DELAY = 0.5
 
+# --workers backpressure: pages fetched but not yet parsed, per parse worker
+PENDING_PER_WORKER = 2
 
-def get_soup(url: str) -> BeautifulSoup:
-    """Fetch a page and return a BeautifulSoup object."""
+
+def get_soup(url: str, fast: bool = True) -> BeautifulSoup:
+    """Fetch a page and return a BeautifulSoup object (article subtrees only if `fast`)."""
     print(f"  Fetching: {url}")
-    response = requests.get(url, headers={
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) StarWarsJDR-Scraper/1.0"
-    })
-    response.raise_for_status()
-    time.sleep(REQUEST_DELAY)
-    return BeautifulSoup(response.text, "lxml")
+    return wiki_http.get_soup(url, delay=REQUEST_DELAY, fast=fast)
 
 
+@timed("extract.species_links")
 def extract_species_links(soup: BeautifulSoup) -> list[dict]:
-    """Extract species links from the category or list page."""
-    species = []
+    """Extract species links from one category (or list) page."""
+    # Category listing members; only fall back to article links on plain list pages
+    links = soup.select(".category-page__member-link, .mw-category a")
+    if not links:
+        links = [
+            link for link in soup.select("#mw-content-text a")
+            if "/wiki/" in link.get("href", "")
+            and not any(x in link["href"] for x in [":", "Category", "File", "Template"])
+        ]
     
-    # Try to find species in category listing
-    for link in soup.select(".category-page__member-link, .mw-category a"):
+    species = []
+    for link in links:
         name = link.get_text(strip=True)
         href = link.get("href")
-        if href and not href.startswith("#"):
+        if href and not href.startswith("#") and len(name) > 2 and name[0].isupper():
             species.append({
                 "name": name,
                 "url": urljoin(BASE_URL, href)
             })
-    
-    # Also try wiki content tables
-    for link in soup.select("#mw-content-text a"):
-        href = link.get("href", "")
-        name = link.get_text(strip=True)
-        if "/wiki/" in href and name and not any(x in href for x in [":", "Category", "File", "Template"]):
-            if len(name) > 2 and name[0].isupper():
-                species.append({
-                    "name": name,
-                    "url": urljoin(BASE_URL, href)
-                })
-    
-    # Remove duplicates
+    return species
+
+
+def extract_next_page(soup: BeautifulSoup) -> str | None:
+    """URL of the next category listing page (Fandom `from=` / MediaWiki `pagefrom=`)."""
+    link = soup.select_one("a.category-page__pagination-next")
+    if not link:
+        link = next((a for a in soup.select("#mw-pages a")
+                     if "pagefrom=" in a.get("href", "") and "next" in a.get_text().lower()), None)
+    return urljoin(BASE_URL, link["href"]) if link and link.get("href") else None
+
+
+def iter_category_members(category_url: str, queue: JobQueue | None = None) -> Iterator[dict]:
+    """
+    Lazily yield the species links of a category, following its pagination.
+    Only one listing page is held in memory at a time, links are deduplicated
+    with a set as they come, and the page being walked is checkpointed in
+    `queue` so a resumed crawl continues from it.
+    """
     seen = set()
-    unique = []
-    for s in species:
-        if s["name"] not in seen:
-            seen.add(s["name"])
-            unique.append(s)
-    
-    return unique
+    url = (queue.cursor if queue else None) or category_url
+    while url:
+        if queue:
+            queue.cursor = url
+        # Category members live outside the article body, so parse the whole page
+        soup = get_soup(url, fast=False)
+        links = extract_species_links(soup)
+        url = extract_next_page(soup)
+        soup.decompose()
+        del soup
+        
+        for link in links:
+            if link["url"] not in seen:
+                seen.add(link["url"])
+                yield link
+    if queue:
+        queue.cursor = None
 
 
+@timed("extract.ability_mods")
 def extract_ability_mods(soup: BeautifulSoup) -> str:
-    """Extract ability score modifiers from a species page."""
-    mods = []
-    
-    # Look for ability modifiers in various formats
-    text = soup.get_text()
-    
-    # Pattern: "+2 Dexterity, -2 Constitution" etc.
-    ability_names = {
-        "Strength": "FOR",
-        "Dexterity": "DEX", 
-        "Constitution": "CON",
-        "Intelligence": "INT",
-        "Wisdom": "SAG",
-        "Charisma": "CHA"
-    }
-    
-    for full_name, abbr in ability_names.items():
-        # Look for patterns like "+2 Strength" or "-2 Dexterity"
-        pattern = rf"([+-]?\d+)\s*{full_name}"
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            value = match.group(1)
-            if not value.startswith(("+", "-")):
-                value = f"+{value}"
-            mods.append(f"{value} {abbr}")
-    
-    return ", ".join(mods) if mods else "Aucun"
+    """Extract ability score modifiers from the species stat block / infobox."""
+    return format_ability_mods(species_facts(soup)["ability_mods"])
 
 
+@timed("extract.species_image")
 def extract_species_image(soup: BeautifulSoup) -> str | None:
     """Extract the main species image URL."""
     # Try infobox image first
@@ -124,15 +146,15 @@ def extract_species_image(soup: BeautifulSoup) -> str | None:
         src = img.get("src") or img.get("data-src")
         if src:
             # Remove Fandom image sizing parameters
-            src = re.sub(r"/revision/.*$", "", src)
-            return src
+            return full_size_url(src)
     return None
 
 
+@timed("extract.species_description")
 def extract_species_description(soup: BeautifulSoup) -> str:
     """Extract a brief description of the species."""
     # Get first paragraph after the infobox
-    content = soup.select_one("#mw-content-text .mw-parser-output")
+    content = soup.select_one(".mw-parser-output")
     if content:
         for p in content.find_all("p", recursive=False):
             text = p.get_text(strip=True)
@@ -147,6 +169,7 @@ def extract_species_description(soup: BeautifulSoup) -> str:
     return ""
 
 
+@timed("extract.species_traits")
 def extract_species_traits(soup: BeautifulSoup) -> list[str]:
     """Extract special traits/abilities."""
     traits = []
@@ -164,26 +187,20 @@ def extract_species_traits(soup: BeautifulSoup) -> list[str]:
     return traits[:5]  # Limit to 5 traits
 
 
+@timed("extract.languages")
 def extract_languages(soup: BeautifulSoup) -> list[str]:
-    """Extract languages spoken."""
+    """Extract languages spoken from the species stat block / infobox."""
     languages = ["Basic"]  # Most species speak Basic
     
-    text = soup.get_text()
-    
-    # Look for language mentions
-    lang_pattern = r"speak\s+(\w+)|language[s]?.*?(\w+)"
-    for match in re.finditer(lang_pattern, text, re.IGNORECASE):
-        lang = match.group(1) or match.group(2)
-        if lang and lang.lower() not in ["the", "a", "and", "or", "basic"]:
-            languages.append(lang.capitalize())
+    for lang in species_facts(soup)["languages"]:
+        if lang.lower() != "basic" and lang not in languages:
+            languages.append(lang)
     
-    return list(set(languages))[:3]
+    return languages[:3]
 
 
-def scrape_species_page(url: str) -> dict:
-    """Scrape detailed information from a species page."""
-    soup = get_soup(url)
-    
+def species_details(soup: BeautifulSoup) -> dict:
+    """Run the species extractors over a parsed species page."""
     return {
         "abilityMods": extract_ability_mods(soup),
         "description": extract_species_description(soup),
@@ -193,99 +210,268 @@ def scrape_species_page(url: str) -> dict:
     }
 
 
-def download_image(url: str, filename: str) -> bool:
-    """Download an image to the species folder."""
+def page_details(html: str) -> dict:
+    """Species details and revision of one species page's HTML."""
+    details = species_details(parse_page(html))
+    details["revid"] = page_revision(html)
+    return details
+
+
+def scrape_species_page(url: str) -> dict:
+    """Scrape detailed information from a species page."""
+    print(f"  Fetching: {url}")
+    html, _ = wiki_http.fetch_page_text(url, delay=REQUEST_DELAY)
+    return page_details(html)
+
+
+def extract_page_details(html: str) -> tuple[dict, dict]:
+    """Worker-process body: page_details (+ the extractors' timings)."""
+    METRICS.reset()
+    details = page_details(html)
+    return details, METRICS.snapshot()
+
+
+def species_id_for(name: str) -> str:
+    """Filename-safe species ID."""
+    species_id = re.sub(r"[^a-z0-9_]", "_", name.lower())
+    return re.sub(r"_+", "_", species_id).strip("_")
+
+
+def species_entry(name: str, url: str, details: dict) -> dict:
+    """The species_data.json record for a scraped species page."""
+    species_id = species_id_for(name)
+    return {
+        "id": species_id,
+        "name": name,
+        "url": url,
+        "blurb": details["description"],
+        "image": f"{species_id}.png",
+        "hidden": {
+            "abilityMods": details["abilityMods"],
+            "languages": details["languages"],
+            "traits": details["traits"]
+        }
+    }
+
+
+def download_image(url: str, species_id: str, width: int | None = IMAGE_WIDTH) -> Path | None:
+    """Download an image to the species folder. Returns the saved path."""
     if not url:
-        return False
-    
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = OUTPUT_DIR / filename
+        return None
     
-    if filepath.exists():
-        print(f"    Image already exists: {filename}")
-        return True
+    existing = existing_asset(OUTPUT_DIR / species_id)
+    if existing:
+        print(f"    Image already exists: {existing.name}")
+        return existing
     
     try:
-        print(f"    Downloading: {filename}")
-        response = requests.get(url, stream=True, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) StarWarsJDR-Scraper/1.0"
-        })
-        response.raise_for_status()
-        
-        with open(filepath, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        
-        time.sleep(REQUEST_DELAY)
-        return True
+        print(f"    Downloading: {species_id}")
+        result = fetch_asset(url, OUTPUT_DIR / species_id, width)
+        return result.path
     except Exception as e:
         print(f"    Failed to download image: {e}")
-        return False
+        return None
+
+
+def finish_job(queue: JobQueue, url: str, name: str, details: dict, args) -> None:
+    """Build the species entry from a scraped page (image included) and checkpoint it."""
+    entry = species_entry(name, url, details)
+    
+    # Download image if requested
+    if args.images and details["image_url"]:
+        width = None if args.full_size else IMAGE_WIDTH
+        saved = download_image(details["image_url"], entry["id"], width)
+        if saved:
+            entry["image"] = saved.name
+    
+    queue.mark_parsed(url, entry, details["revid"])
+
+
+def scrape_job(queue: JobQueue, url: str, name: str, args) -> None:
+    """Scrape one species page and checkpoint the outcome in `queue`."""
+    try:
+        details = scrape_species_page(url)
+        queue.mark_fetched(url)
+        finish_job(queue, url, name, details, args)
+    except Exception as e:
+        print(f"    Error: {e}")
+        queue.mark_failed(url, str(e))
+
+
+class ParallelScraper:
+    """
+    scrape_job with --workers: pages are fetched in this process (paced as
+    usual) and parsed + extracted in a process pool while the next ones
+    download. At most PENDING_PER_WORKER pages per worker wait to be parsed;
+    jobs are finished (image, checkpoint) in crawl order. A page whose parse
+    fails is marked failed on its own.
+    """
+
+    def __init__(self, queue: JobQueue, args):
+        self.queue = queue
+        self.args = args
+        self.pool = ProcessPoolExecutor(args.workers)
+        self.limit = args.workers * PENDING_PER_WORKER
+        self.pending: deque[tuple[str, str, Future]] = deque()
+
+    def __call__(self, queue: JobQueue, url: str, name: str, args) -> None:
+        try:
+            print(f"  Fetching: {url}")
+            html, _ = wiki_http.fetch_page_text(url, delay=REQUEST_DELAY)
+        except Exception as e:
+            print(f"    Error: {e}")
+            queue.mark_failed(url, str(e))
+            return
+        queue.mark_fetched(url)
+        self.pending.append((url, name, self.pool.submit(extract_page_details, html)))
+        while len(self.pending) >= self.limit:
+            self.finish_next()
+
+    def finish_next(self) -> None:
+        url, name, future = self.pending.popleft()
+        try:
+            details, timings = future.result()
+            METRICS.merge(timings)
+            finish_job(self.queue, url, name, details, self.args)
+        except Exception as e:
+            print(f"    {name}: {e}")
+            self.queue.mark_failed(url, str(e))
+
+    def close(self, finish: bool = True) -> None:
+        """Finish the pages still being parsed (or drop them: they stay `fetched`)."""
+        while finish and self.pending:
+            self.finish_next()
+        self.pool.shutdown(cancel_futures=True)
+
+
+def refresh_changed(queue: JobQueue) -> None:
+    """
+    Requeue the scraped species whose wiki page has a newer revision than the
+    one they were scraped from, and drop those whose page is gone. One
+    prop=revisions query covers BATCH_SIZE pages, so checking the whole
+    crawl costs a handful of requests instead of a page fetch per species.
+    """
+    revisions = queue.revisions()
+    api = MediaWikiAPI(f"{BASE_URL}/wiki/", delay=REQUEST_DELAY)
+    wiki_pages = {url: url.split("/wiki/", 1)[1] for url in revisions}
+    with stage("revisions"):
+        pages = api.query_pages(list(wiki_pages.values()), props=("revisions",))
+    
+    changed, removed = [], []
+    for url, revid in revisions.items():
+        page = pages[wiki_pages[url]]
+        if page is None:
+            removed.append(url)
+        elif revid is None or page.get("revisions", [{}])[0].get("revid") != revid:
+            changed.append(url)
+    count("revisions.checked", len(revisions))
+    count("revisions.changed", len(changed))
+    
+    print(f"  {len(revisions)} species checked: {len(changed)} changed, "
+          f"{len(removed)} gone, {len(revisions) - len(changed) - len(removed)} unchanged")
+    queue.requeue(changed)
+    queue.remove(removed)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Scrape SWSE species data")
     parser.add_argument("--images", action="store_true", help="Also download species images")
     parser.add_argument("--limit", type=int, default=0, help="Limit number of species to scrape (0 = all)")
+    parser.add_argument("--full-size", action="store_true",
+                        help="Download original images instead of IMAGE_WIDTH px renditions")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue the last crawl from its checkpoint instead of starting over")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Requeue the species that failed in the last crawl (implies --resume)")
+    parser.add_argument("--update", action="store_true",
+                        help="Re-scrape only species whose wiki page changed since the last crawl, "
+                             "and pick up new ones")
+    parser.add_argument("--offline", action="store_true",
+                        help="Serve pages from the on-disk cache only (no network)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"Parse pages in N worker processes while the next ones download "
+                             f"(0 = in this process; this machine has {os.cpu_count()} cores)")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
     args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+    
+    if args.offline:
+        wiki_http.set_cache_mode("offline")
     
     print("=" * 60)
     print("SWSE Species Scraper")
     print("=" * 60)
     
-    # Get species list
-    print("\n[1/3] Fetching species list...")
-    soup = get_soup(SPECIES_CATEGORY_URL)
-    species_list = extract_species_links(soup)
-    
-    if args.limit > 0:
-        species_list = species_list[:args.limit]
+    queue = JobQueue(queue=QUEUE_NAME)
+    resume = args.resume or args.retry_failed
     
-    print(f"  Found {len(species_list)} species")
+    # Jobs left over from an interrupted run come first
+    print("\n[1/2] Scraping species...")
+    if args.update and queue.revisions():
+        refresh_changed(queue)
+        if args.retry_failed:
+            print(f"  Requeued {queue.retry_failed()} failed species")
+        # Walk the whole category again: members not in the queue yet are new
+        queue.cursor = None
+        crawl = True
+    elif resume and any(queue.counts().values()):
+        if args.retry_failed:
+            print(f"  Requeued {queue.retry_failed()} failed species")
+        counts = queue.counts()
+        print(f"  Resuming: {counts['parsed']} parsed, {counts['pending'] + counts['fetched']} to do, "
+              f"{counts['failed']} failed")
+        crawl = queue.cursor is not None
+    else:
+        queue.reset()
+        crawl = True
     
-    # Scrape each species
-    print("\n[2/3] Scraping species details...")
-    species_data = []
-    
-    for i, species in enumerate(species_list, 1):
-        print(f"\n  [{i}/{len(species_list)}] {species['name']}")
+    scrape = ParallelScraper(queue, args) if args.workers > 0 else scrape_job
+    interrupted = False
+    try:
+        jobs = queue.pending()
+        for i, job in enumerate(jobs, 1):
+            print(f"\n  [{i}/{len(jobs)}] {job.name}")
+            scrape(queue, job.url, job.name, args)
         
-        try:
-            details = scrape_species_page(species["url"])
-            
-            # Create filename-safe ID
-            species_id = re.sub(r"[^a-z0-9_]", "_", species["name"].lower())
-            species_id = re.sub(r"_+", "_", species_id).strip("_")
-            
-            entry = {
-                "id": species_id,
-                "name": species["name"],
-                "url": species["url"],
-                "blurb": details["description"],
-                "image": f"{species_id}.png",
-                "hidden": {
-                    "abilityMods": details["abilityMods"],
-                    "languages": details["languages"],
-                    "traits": details["traits"]
-                }
-            }
-            
-            species_data.append(entry)
-            
-            # Download image if requested
-            if args.images and details["image_url"]:
-                download_image(details["image_url"], f"{species_id}.png")
-                
-        except Exception as e:
-            print(f"    Error: {e}")
+        # Walk the category; each species is scraped as soon as its listing page is read
+        if crawl:
+            links = iter_category_members(SPECIES_CATEGORY_URL, queue)
+            if args.limit > 0:
+                links = islice(links, max(args.limit - sum(queue.counts().values()), 0))
+            done = sum(queue.counts().values())
+            for link in links:
+                if not queue.enqueue([(link["url"], link["name"])]):
+                    continue  # already handled before the interrupt
+                done += 1
+                print(f"\n  [{done}] {link['name']}")
+                scrape(queue, link["url"], link["name"], args)
+            if args.limit > 0:
+                queue.cursor = None
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\n  Interrupted - run again with --resume to continue")
+    except Exception as e:
+        # Species errors are recorded per job; this is a category listing page
+        print(f"\n  Listing page failed: {e} - run again with --resume to continue")
+    if isinstance(scrape, ParallelScraper):
+        scrape.close(finish=not interrupted)
     
     # Save data
-    print("\n[3/3] Saving data...")
-    with open(DATA_OUTPUT, "w", encoding="utf-8") as f:
+    print("\n[2/2] Saving data...")
+    species_data = queue.results()
+    counts = queue.counts()
+    queue_cursor = queue.cursor
+    queue.close()
+    with open(DATA_OUTPUT, "w", encoding="utf-8") as f, stage("write"):
         json.dump(species_data, f, ensure_ascii=False, indent=2)
     
     print(f"  Saved to: {DATA_OUTPUT}")
     print(f"\n✓ Done! Scraped {len(species_data)} species.")
+    if counts["failed"]:
+        print(f"  {counts['failed']} failed - rerun with --retry-failed to try them again")
+    if counts["pending"] + counts["fetched"] or queue_cursor:
+        print(f"  Crawl not finished ({counts['pending'] + counts['fetched']} queued) - rerun with --resume")
     
     # Print sample for verification
     if species_data:
@@ -294,4 +480,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("scrape_species"), profiled("scrape_species"):
+        main()
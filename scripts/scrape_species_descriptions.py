@@ -8,22 +8,31 @@ Requirements:
 
 Usage:
     python scrape_species_descriptions.py
+    python scrape_species_descriptions.py --hedge 2   # start the SWSE fallback after 2 s
 """
 
+import argparse
+import asyncio
 import json
 import re
-import time
 from pathlib import Path
 from urllib.parse import quote
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from async_fetch import AsyncFetcher
+from infobox import element_text
+from mediawiki_api import MediaWikiAPI, html_fragment
+from metrics import count, run_report, stage, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+
 # Species to scrape - maps species ID to (swse_page, wookieepedia_page)
 SPECIES_PAGES = {
     "humain": ("Human", "Human/Legends"),
@@ -74,10 +83,10 @@ SPECIES_PAGES = {
     "droide": (None, "Droid/Legends"),
 }
 
-SWSE_BASE_URL = "https://swse.fandom.com/wiki/"
-WOOKIEEPEDIA_BASE_URL = "https://starwars.fandom.com/wiki/"
+SWSE_BASE_URL = f"{wiki_http.SWSE_WIKI}/wiki/"
+WOOKIEEPEDIA_BASE_URL = f"{wiki_http.WOOKIEEPEDIA_WIKI}/wiki/"
 OUTPUT_FILE = Path(__file__).parent.parent / "js" / "species_descriptions.json"
-REQUEST_DELAY = 1.0
+REQUEST_DELAY = 1.0  # starting per-host interval, adapted at run time (see pacing)
 
 # Sections to include for extended lore
 LORE_SECTIONS = [
@@ -98,12 +107,7 @@ MAX_DESCRIPTION_LENGTH = 2000
 def get_soup(url: str) -> BeautifulSoup | None:
     """Fetch a page and return a BeautifulSoup object."""
     try:
-        response = requests.get(url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
-        time.sleep(REQUEST_DELAY)
-        return BeautifulSoup(response.text, "lxml")
+        return wiki_http.get_soup(url, delay=REQUEST_DELAY)
     except Exception as e:
         print(f"    Error: {e}")
         return None
@@ -139,7 +143,7 @@ def get_section_content(soup: BeautifulSoup, section_name: str) -> str:
                 break
         
         if in_section and elem.name == "p":
-            text = clean_text(elem.get_text())
+            text = clean_text(element_text(elem))
             if text and len(text) > 20:
                 paragraphs.append(text)
     
@@ -161,7 +165,7 @@ def get_intro_paragraphs(soup: BeautifulSoup, max_chars: int = 800) -> str:
         if elem.name != "p":
             continue
         
-        text = clean_text(elem.get_text())
+        text = clean_text(element_text(elem))
         if not text or len(text) < 30:
             continue
         # Skip metadata
@@ -177,28 +181,47 @@ def get_intro_paragraphs(soup: BeautifulSoup, max_chars: int = 800) -> str:
     return " ".join(paragraphs)
 
 
+def wookieepedia_url(wiki_page: str) -> str:
+    """Build the Wookieepedia URL for a page name."""
+    return WOOKIEEPEDIA_BASE_URL + wiki_page
+
+
+def swse_url(wiki_page: str) -> str:
+    """Build the SWSE wiki URL for a page name."""
+    return SWSE_BASE_URL + quote(wiki_page, safe="()_")
+
+
 def get_species_description_wookieepedia(wiki_page: str) -> str | None:
     """
     Get detailed lore from Wookieepedia.
     Includes intro + biology + society sections.
     """
-    url = WOOKIEEPEDIA_BASE_URL + wiki_page
+    url = wookieepedia_url(wiki_page)
     print(f"  Fetching Wookieepedia: {url}")
     
     soup = get_soup(url)
     if not soup:
         return None
     
+    return describe_from_wookieepedia(soup)
+
+
+@timed("extract.describe_wookieepedia")
+def describe_from_wookieepedia(soup: BeautifulSoup) -> str | None:
+    """Build the extended lore description from a parsed Wookieepedia page."""
+    intro = get_intro_paragraphs(soup, max_chars=800)
+    sections = [get_section_content(soup, section) for section in LORE_SECTIONS]
+    return compose_lore_description(intro, sections)
+
+
+def compose_lore_description(intro: str, section_texts: list[str]) -> str | None:
+    """Join the intro and lore sections, trimming each section and the total."""
     parts = []
     
-    # Get intro
-    intro = get_intro_paragraphs(soup, max_chars=800)
     if intro:
         parts.append(intro)
     
-    # Get additional sections
-    for section in LORE_SECTIONS:
-        section_text = get_section_content(soup, section)
+    for section_text in section_texts:
         if section_text:
             # Take first 400 chars from each section
             if len(section_text) > 400:
@@ -230,22 +253,174 @@ def get_species_description_swse(wiki_page: str) -> str | None:
     """
     Get description from SWSE wiki (usually shorter but game-relevant).
     """
-    url = SWSE_BASE_URL + quote(wiki_page, safe="()_")
+    url = swse_url(wiki_page)
     print(f"  Fetching SWSE: {url}")
     
     soup = get_soup(url)
     if not soup:
         return None
     
+    return describe_from_swse(soup)
+
+
+@timed("extract.describe_swse")
+def describe_from_swse(soup: BeautifulSoup) -> str | None:
+    """Build the short description from a parsed SWSE page."""
     intro = get_intro_paragraphs(soup, max_chars=600)
     return intro if intro else None
 
 
+def intro_from_extract(extract: str, max_chars: int) -> str:
+    """Apply the get_intro_paragraphs filters to a plain-text API extract."""
+    paragraphs = []
+    total_chars = 0
+    
+    for line in extract.split("\n"):
+        text = clean_text(line)
+        if not text or len(text) < 30:
+            continue
+        if text.startswith("Reference Book:") or text.startswith("See also:"):
+            continue
+        
+        paragraphs.append(text)
+        total_chars += len(text)
+        
+        if total_chars >= max_chars:
+            break
+    
+    return " ".join(paragraphs)
+
+
+def api_intro(api: MediaWikiAPI, wiki_page: str, page: dict, max_chars: int) -> str:
+    """Intro from the batched extract, or from `section=0` if extracts are unavailable."""
+    if page.get("extract"):
+        return intro_from_extract(page["extract"], max_chars)
+    return get_intro_paragraphs(html_fragment(api.section_html(wiki_page, 0)), max_chars)
+
+
+def scrape_all_api() -> dict[str, str | None]:
+    """
+    Scrape every species through api.php: one batched query per wiki for
+    intros, then only the lore sections of each Wookieepedia page.
+    """
+    wookieepedia = MediaWikiAPI(WOOKIEEPEDIA_BASE_URL, delay=REQUEST_DELAY)
+    swse = MediaWikiAPI(SWSE_BASE_URL, delay=REQUEST_DELAY)
+    
+    wookieepedia_pages = wookieepedia.query_pages(
+        [w for _, w in SPECIES_PAGES.values() if w], props=("extracts",))
+    
+    results = {}
+    fallbacks = []
+    for species_id, (swse_page, wookieepedia_page) in SPECIES_PAGES.items():
+        page = wookieepedia_pages.get(wookieepedia_page) if wookieepedia_page else None
+        desc = None
+        if page:
+            try:
+                intro = api_intro(wookieepedia, wookieepedia_page, page, max_chars=800)
+                sections = [
+                    get_section_content(html_fragment(html), heading)
+                    for heading, html in wookieepedia.section_texts(wookieepedia_page, LORE_SECTIONS)
+                ]
+                desc = compose_lore_description(intro, sections)
+            except Exception as e:
+                print(f"  [{species_id}] Error: {e}")
+        results[species_id] = desc
+        if not desc and swse_page:
+            fallbacks.append((species_id, swse_page))
+    
+    if fallbacks:
+        swse_pages = swse.query_pages([page for _, page in fallbacks], props=("extracts",))
+        for species_id, swse_page in fallbacks:
+            page = swse_pages.get(swse_page)
+            if page:
+                results[species_id] = api_intro(swse, swse_page, page, max_chars=600) or None
+    
+    print(f"  API requests: {wookieepedia.request_count} Wookieepedia, {swse.request_count} SWSE")
+    return results
+
+
+async def lookup_wookieepedia(fetcher: AsyncFetcher, wiki_page: str) -> str | None:
+    soup = await fetcher.fetch_soup(wookieepedia_url(wiki_page))
+    return describe_from_wookieepedia(soup) if soup else None
+
+
+async def lookup_swse(fetcher: AsyncFetcher, wiki_page: str) -> str | None:
+    soup = await fetcher.fetch_soup(swse_url(wiki_page))
+    return describe_from_swse(soup) if soup else None
+
+
+async def scrape_species(fetcher: AsyncFetcher, swse_page: str | None,
+                         wookieepedia_page: str | None, hedge: float | None = None) -> str | None:
+    """
+    Wookieepedia first for detailed lore, SWSE as fallback.
+    With `hedge` (seconds) the SWSE lookup is started speculatively once the
+    Wookieepedia one has been pending that long (0: both at once). A
+    Wookieepedia description still wins; the SWSE lookup is then cancelled,
+    which drops its request unless it has already been sent (see async_fetch).
+    """
+    if not (wookieepedia_page and swse_page) or hedge is None:
+        desc = await lookup_wookieepedia(fetcher, wookieepedia_page) if wookieepedia_page else None
+        if not desc and swse_page:
+            desc = await lookup_swse(fetcher, swse_page)
+        return desc
+    
+    primary = asyncio.create_task(lookup_wookieepedia(fetcher, wookieepedia_page))
+    done, _ = await asyncio.wait({primary}, timeout=hedge)
+    if primary in done and primary.result():
+        return primary.result()
+    
+    count("hedge.started")
+    fallback = asyncio.create_task(lookup_swse(fetcher, swse_page))
+    try:
+        desc = await primary
+    except BaseException:
+        fallback.cancel()
+        raise
+    if desc:
+        fallback.cancel()
+        count("hedge.cancelled")
+        return desc
+    count("hedge.used")
+    return await fallback
+
+
+async def scrape_all(rate: float, hedge: float | None = None) -> dict[str, str | None]:
+    """
+    Scrape every species concurrently; each wiki host is paced on its own.
+    Species sharing their pages (massassi / pureblood_massassi) share one lookup.
+    """
+    fetcher = AsyncFetcher(rate=rate)
+    pages = list(dict.fromkeys(SPECIES_PAGES.values()))
+    results = await asyncio.gather(*(scrape_species(fetcher, *page, hedge=hedge) for page in pages))
+    by_page = dict(zip(pages, results))
+    return {species_id: by_page[page] for species_id, page in SPECIES_PAGES.items()}
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Scrape extended species lore")
+    parser.add_argument("--rate", type=float, default=1 / REQUEST_DELAY,
+                        help=f"Starting requests per second per wiki host, adapted at run time "
+                             f"(default: {1 / REQUEST_DELAY:g})")
+    parser.add_argument("--backend", choices=["html", "api"], default="html",
+                        help="Scrape rendered pages (html) or query api.php in batches (api)")
+    parser.add_argument("--offline", action="store_true",
+                        help="Serve pages from the on-disk cache only (no network)")
+    parser.add_argument("--hedge", type=float, default=None, metavar="SECONDS",
+                        help="html backend: also start the SWSE lookup when Wookieepedia has not "
+                             "answered within SECONDS (0 = fetch both at once); default: only on a miss")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+    
+    if args.offline:
+        wiki_http.set_cache_mode("offline")
+    
     print("=" * 60)
     print("Star Wars JDR - Extended Species Lore Scraper")
     print("=" * 60)
     print(f"Max description length: {MAX_DESCRIPTION_LENGTH} chars")
+    print(f"Rate limit: {args.rate:g} req/s per host")
     print(f"Output: {OUTPUT_FILE}")
     print("=" * 60)
     
@@ -264,18 +439,16 @@ def main():
     success = 0
     failed = 0
     
-    for species_id, (swse_page, wookieepedia_page) in SPECIES_PAGES.items():
+    print(f"\nFetching {len(SPECIES_PAGES)} species...")
+    if args.backend == "api":
+        scraped = scrape_all_api()
+    else:
+        scraped = asyncio.run(scrape_all(args.rate, args.hedge))
+    
+    for species_id in SPECIES_PAGES:
         print(f"\n[{species_id}]")
         
-        desc = None
-        
-        # Try Wookieepedia first for detailed lore
-        if wookieepedia_page:
-            desc = get_species_description_wookieepedia(wookieepedia_page)
-        
-        # Fallback to SWSE if Wookieepedia failed
-        if not desc and swse_page:
-            desc = get_species_description_swse(swse_page)
+        desc = scraped[species_id]
         
         # Use existing if scraping failed
         if not desc and species_id in existing:
@@ -292,7 +465,7 @@ def main():
     
     # Save descriptions
     print(f"\n\nSaving {len(descriptions)} descriptions to {OUTPUT_FILE}")
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f, stage("write"):
         json.dump(descriptions, f, ensure_ascii=False, indent=2)
     
     print("\n" + "=" * 60)
@@ -302,4 +475,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("scrape_species_descriptions"), profiled("scrape_species_descriptions"):
+        main()
@@ -8,22 +8,28 @@ Requirements:
 
 Usage:
     python scrape_species_page.py
+    python scrape_species_page.py --record-warc species_page.warc.gz
 """
 
+import argparse
 import json
-import re
-import time
 from pathlib import Path
 from urllib.parse import unquote
 
 try:
-    import requests
     from bs4 import BeautifulSoup
 except ImportError:
     print("Please install required packages:")
     print("  pip install requests beautifulsoup4 lxml")
     exit(1)
 
+import wiki_http
+from asset_store import existing_asset, fetch_asset
+from downloader import ASSET_WIDTHS, full_size_url
+from metrics import run_report, timed
+from profiling import add_profile_argument, profiled
+from web_archive import add_archive_arguments
+
 # Map our species IDs to the wiki species names (as they appear in the table)
 SPECIES_MAPPING = {
     "Human": "humain",
@@ -73,19 +79,18 @@ SPECIES_MAPPING = {
     "Hutt": "hutt",
 }
 
-SPECIES_URL = "https://swse.fandom.com/wiki/Species"
+SPECIES_URL = f"{wiki_http.SWSE_WIKI}/wiki/Species"
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "species"
 REQUEST_DELAY = 0.5
 
+# Species portraits are shown at card size; fetch that rendition, not the original
+IMAGE_WIDTH = ASSET_WIDTHS["species"]
+
 
 def get_soup(url: str) -> BeautifulSoup:
     """Fetch a page and return a BeautifulSoup object."""
     print(f"Fetching: {url}")
-    response = requests.get(url, headers={
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-    }, timeout=30)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "lxml")
+    return wiki_http.get_soup(url, delay=REQUEST_DELAY)
 
 
 def extract_species_name_from_link(cell) -> str | None:
@@ -111,59 +116,26 @@ def extract_image_url(cell) -> str | None:
     if "Homebrew" in src or "Warning" in src or "1x1" in src:
         return None
     
-    # Get full resolution by removing scaling
-    src = re.sub(r"/scale-to-width-down/\d+", "", src)
-    # Keep revision for download but clean it up
-    src = re.sub(r"/revision/latest/.*$", "/revision/latest", src)
-    
-    return src
+    # Get full resolution by removing scaling (the downloader picks the rendition)
+    return full_size_url(src)
 
 
-def download_image(url: str, species_id: str) -> bool:
-    """Download an image and save it."""
+def download_image(url: str, species_id: str, width: int | None = IMAGE_WIDTH) -> bool:
+    """Download an image at `width` px and save it (extension sniffed from the file)."""
     try:
         print(f"  Downloading {species_id}...")
-        response = requests.get(url, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/120.0.0.0 Safari/537.36"
-        }, timeout=30)
-        response.raise_for_status()
-        
-        # Determine extension from URL or content-type
-        content_type = response.headers.get("Content-Type", "")
-        if "png" in url.lower() or "png" in content_type:
-            ext = ".png"
-        elif "gif" in url.lower() or "gif" in content_type:
-            ext = ".gif"
-        elif "webp" in url.lower() or "webp" in content_type:
-            ext = ".webp"
-        else:
-            ext = ".jpg"
+        result = fetch_asset(url, OUTPUT_DIR / species_id, width)
         
-        filepath = OUTPUT_DIR / f"{species_id}{ext}"
-        
-        with open(filepath, "wb") as f:
-            f.write(response.content)
-        
-        print(f"    Saved: {filepath.name} ({len(response.content) // 1024} KB)")
-        time.sleep(REQUEST_DELAY)
+        print(f"    Saved: {result.path.name} ({result.size // 1024} KB)")
         return True
     except Exception as e:
         print(f"    Failed: {e}")
         return False
 
 
-def main():
-    print("=" * 60)
-    print("Star Wars JDR - Species Image Scraper (from /Species page)")
-    print("=" * 60)
-    
-    # Create output directory
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    print(f"Output folder: {OUTPUT_DIR}\n")
-    
-    # Fetch the Species page
-    soup = get_soup(SPECIES_URL)
-    
+@timed("extract.species_images")
+def extract_species_images(soup: BeautifulSoup) -> dict[str, dict]:
+    """Map our species IDs to {"name", "url"} from the species tables of the page."""
     # Find all tables on the page
     tables = soup.find_all("table")
     print(f"Found {len(tables)} tables\n")
@@ -216,6 +188,29 @@ def main():
                 }
                 print(f"  Found: {species_name} -> {species_id}")
     
+    return found_species
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download species images from the SWSE Species page tables")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+    
+    print("=" * 60)
+    print("Star Wars JDR - Species Image Scraper (from /Species page)")
+    print("=" * 60)
+    
+    # Create output directory
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Output folder: {OUTPUT_DIR}\n")
+    
+    # Fetch the Species page
+    soup = get_soup(SPECIES_URL)
+    
+    found_species = extract_species_images(soup)
+    
     print(f"\nFound {len(found_species)} species images to download\n")
     
     # Download images
@@ -225,8 +220,7 @@ def main():
     
     for species_id, data in found_species.items():
         # Check if already exists
-        existing = list(OUTPUT_DIR.glob(f"{species_id}.*"))
-        if existing:
+        if existing_asset(OUTPUT_DIR / species_id):
             print(f"  {species_id}: Already exists, skipping")
             skipped += 1
             continue
@@ -243,4 +237,5 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("scrape_species_page"), profiled("scrape_species_page"):
+        main()
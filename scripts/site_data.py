@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Read the game data tables of js/data.js from Python.
+
+data.js holds plain JavaScript literals (`const SPECIES = [ {...}, ... ];`)
+with unquoted keys, single-quoted strings, comments and trailing commas,
+so it is not JSON. read_table tokenizes the literal assigned to one
+constant and returns it as Python lists / dicts / strings / numbers.
+Constants computed in JavaScript are rebuilt here (FACTIONS, from
+FACTION_SECTIONS).
+
+entity_images locates the asset files the front end shows for an entry
+(species portraits by id, factions and cards by their `image`, planet
+banners and views by name), so the image build steps can key their
+output by the same ids.
+
+version_include points the <link> / <script> of a generated file in
+index.html at its current content (`?v=<content hash>`), the way the
+hand-written includes carry `?v=<date>`, so a rebuild is never served a
+cached map that names deleted hashed files.
+
+Usage:
+    from site_data import entity_images, read_table
+
+    for species in read_table("SPECIES"):
+        print(species["id"], entity_images("SPECIES", species))
+"""
+
+import hashlib
+import re
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_JS = PROJECT_ROOT / "js" / "data.js"
+ASSETS_DIR = PROJECT_ROOT / "assets"
+INDEX_HTML = PROJECT_ROOT / "index.html"
+
+# Length of the content hash in the ?v= of generated includes
+VERSION_LENGTH = 10
+
+# Extensions the front end tries for an image named after an id (js/utils.js IMAGE_EXTENSIONS)
+IMAGE_EXTENSIONS = ("png", "webp", "jpg", "jpeg", "gif")
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")
+  | (?P<number>[-+]?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>[\[\]{}:,])
+""", re.S | re.X)
+
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+CONSTANTS = {"true": True, "false": False, "null": None, "undefined": None}
+
+
+def _unquote(literal: str) -> str:
+    return re.sub(r"\\(u[0-9a-fA-F]{4}|.)",
+                  lambda m: chr(int(m.group(1)[1:], 16)) if len(m.group(1)) == 5
+                  else ESCAPES.get(m.group(1), m.group(1)),
+                  literal[1:-1], flags=re.S)
+
+
+class _Parser:
+    """Recursive-descent reader for one JavaScript literal."""
+
+    def __init__(self, source: str, pos: int):
+        self.source, self.pos = source, pos
+
+    def next(self) -> tuple[str, str]:
+        while self.pos < len(self.source):
+            match = TOKEN_RE.match(self.source, self.pos)
+            if match is None:
+                raise ValueError(f"Unexpected {self.source[self.pos:self.pos + 20]!r} in data.js")
+            self.pos = match.end()
+            if match.lastgroup != "space":
+                return match.lastgroup, match.group()
+        raise ValueError("Unexpected end of data.js")
+
+    def peek(self) -> str:
+        pos = self.pos
+        _, text = self.next()
+        self.pos = pos
+        return text
+
+    def value(self) -> object:
+        kind, text = self.next()
+        if kind == "string":
+            return _unquote(text)
+        if kind == "number":
+            return float(text) if any(c in text for c in ".eE") else int(text)
+        if kind == "name":
+            if text not in CONSTANTS:
+                raise ValueError(f"Unsupported expression {text!r} in data.js")
+            return CONSTANTS[text]
+        if text == "[":
+            items = []
+            while self.peek() != "]":
+                items.append(self.value())
+                if self.peek() == ",":
+                    self.next()
+            self.next()
+            return items
+        if text == "{":
+            obj = {}
+            while self.peek() != "}":
+                kind, key = self.next()
+                if self.next()[1] != ":":
+                    raise ValueError(f"Expected ':' after {key!r} in data.js")
+                obj[_unquote(key) if kind == "string" else key] = self.value()
+                if self.peek() == ",":
+                    self.next()
+            self.next()
+            return obj
+        raise ValueError(f"Unexpected {text!r} in data.js")
+
+
+def read_table(name: str, path: Path = DATA_JS) -> list | dict:
+    """The literal assigned to `const <name>` in data.js."""
+    source = path.read_text(encoding="utf-8")
+    if name == "FACTIONS":
+        return [{**faction, "section": section["id"]}
+                for section in read_table("FACTION_SECTIONS", path)
+                for faction in section["factions"]]
+    match = re.search(rf"^const {re.escape(name)}\s*=\s*", source, re.M)
+    if match is None:
+        raise KeyError(f"No `const {name}` in {path}")
+    return _Parser(source, match.end()).value()
+
+
+def _first_existing(folder: Path, stem: str) -> Path | None:
+    return next((folder / f"{stem}.{ext}" for ext in IMAGE_EXTENSIONS if (folder / f"{stem}.{ext}").exists()), None)
+
+
+def entity_images(table: str, entity: dict, assets_dir: Path = ASSETS_DIR) -> dict[str, Path]:
+    """{role: file} of the images the front end shows for one entry of `table`."""
+    if table == "SPECIES":
+        images = {"image": _first_existing(assets_dir / "species", entity["id"])}
+    elif table == "PLANETES":
+        # js/tooltip.js names location files after the planet (nar_shaddaa -> NarShaddaa)
+        stem = "".join(part.capitalize() for part in entity["id"].split("_"))
+        images = {"banner": _first_existing(assets_dir / "locations" / "ambiance", stem),
+                  "view": _first_existing(assets_dir / "locations" / "planets", stem)}
+    else:
+        folder = {"FACTIONS": "factions", "DRAFT_CARDS": "cards"}[table]
+        path = assets_dir / folder / entity["image"] if entity.get("image") else None
+        images = {"image": path if path and path.exists() else None}
+    return {role: path for role, path in images.items() if path is not None}
+
+
+def version_include(path: Path, index_html: Path = INDEX_HTML) -> bool:
+    """
+    Set the ?v= of the href / src of `path` in index_html to the content hash
+    of the file. Returns whether index_html changed; raises ValueError when
+    the page does not include the file.
+    """
+    url = "./" + path.resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    version = hashlib.sha256(path.read_bytes()).hexdigest()[:VERSION_LENGTH]
+    include_re = re.compile(rf'((?:href|src)="){re.escape(url)}(?:\?v=[^"]*)?"')
+    html = index_html.read_text(encoding="utf-8")
+    updated, found = include_re.subn(rf'\g<1>{url}?v={version}"', html)
+    if not found:
+        raise ValueError(f"{index_html.name} does not include {url}")
+    if updated == html:
+        return False
+    index_html.write_text(updated, encoding="utf-8")
+    return True
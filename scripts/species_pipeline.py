@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+"""
+Single-pass species pipeline.
+
+The SWSE species pages used to be fetched by three scripts that each kept
+one thing (image + intro, ability mods/traits/languages, fallback intro).
+Here every extractor registers against a page type, each unique URL is
+fetched and parsed once per run (concurrent requests for the same URL share
+one in-flight fetch), all extractors for that page type run on the same
+parsed document, and the results are merged into one record per species.
+
+With --workers N, parsing and extraction (BeautifulSoup + regex, CPU-bound)
+move out of the event loop into a pool of N processes: the fetcher streams
+raw HTML to the pool, at most PENDING_PER_WORKER pages per worker are
+fetched-but-not-yet-extracted at any time (fetching waits when the workers
+fall behind), and extracted fields come back to the main process, which
+alone merges and writes the records. A page that fails to fetch or parse
+is recorded in `store.errors` and contributes no fields; the other pages
+carry on.
+
+With --swse-dump / --wookieepedia-dump the pages come from MediaWiki XML
+dumps instead of the network (see wiki_dump): each dump is streamed once,
+the wanted pages are rendered from wikitext and go through the same
+extractors, and no HTTP request is made. --category adds a record for
+every page of the SWSE dump in Category:Species, and the Wookieepedia dump
+also yields the FACTION_PAGES / CARD_PAGES of download_faction_images
+(intro and lead image file) in page_records.json.
+
+Requirements:
+    pip install requests beautifulsoup4 lxml
+
+Usage:
+    python species_pipeline.py
+    python species_pipeline.py --limit 5 --offline
+    python species_pipeline.py --workers 4
+    python species_pipeline.py --swse-dump swse_pages_current.xml.bz2 \
+        --wookieepedia-dump starwars_pages_current.xml.bz2 --category
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+import wiki_http
+from async_fetch import AsyncFetcher
+from download_faction_images import CARD_PAGES, FACTION_PAGES
+from download_species_images import extract_species_data
+from infobox import species_facts
+from mediawiki_api import page_title
+from metrics import METRICS, count, run_report, stage
+from profiling import add_profile_argument, profiled
+from scrape_species import (
+    PENDING_PER_WORKER,
+    extract_ability_mods,
+    extract_languages,
+    extract_species_traits,
+    species_id_for,
+)
+from scrape_species_descriptions import (
+    REQUEST_DELAY,
+    SPECIES_PAGES,
+    describe_from_swse,
+    describe_from_wookieepedia,
+    get_intro_paragraphs,
+    swse_url,
+    wookieepedia_url,
+)
+from web_archive import add_archive_arguments
+from wiki_dump import iter_dump_pages, normalize_title, render_wikitext
+from wiki_parse import parse_page
+
+OUTPUT_FILE = Path(__file__).parent / "species_records.json"
+PAGE_RECORDS_FILE = Path(__file__).parent / "page_records.json"
+
+# SWSE category whose members --category turns into records
+SPECIES_CATEGORY = "Species"
+
+# page type -> [(field name(s), extractor(soup) -> value)]
+EXTRACTORS: dict[str, list[tuple[str | tuple[str, ...], Callable]]] = {}
+
+
+def extractor(page_type: str, field: str | tuple[str, ...]):
+    """
+    Register a function as the extractor of `field` for pages of `page_type`.
+    An extractor may fill several fields at once by returning a tuple.
+    """
+    def register(func):
+        EXTRACTORS.setdefault(page_type, []).append((field, func))
+        return func
+    return register
+
+
+# --- SWSE species page -------------------------------------------------------
+
+@extractor("swse", ("image_url", "intro"))
+def swse_image_and_intro(soup: BeautifulSoup) -> tuple[str | None, str | None]:
+    return extract_species_data(soup)
+
+
+@extractor("swse", "abilityMods")
+def swse_ability_mods(soup: BeautifulSoup) -> str:
+    return extract_ability_mods(soup)
+
+
+@extractor("swse", "traits")
+def swse_traits(soup: BeautifulSoup) -> list[str]:
+    return extract_species_traits(soup)
+
+
+@extractor("swse", "languages")
+def swse_languages(soup: BeautifulSoup) -> list[str]:
+    return extract_languages(soup)
+
+
+@extractor("swse", "swse_description")
+def swse_description(soup: BeautifulSoup) -> str | None:
+    return describe_from_swse(soup)
+
+
+# --- Wookieepedia species page ------------------------------------------------
+
+@extractor("wookieepedia", "lore")
+def wookieepedia_lore(soup: BeautifulSoup) -> str | None:
+    return describe_from_wookieepedia(soup)
+
+
+@extractor("wookieepedia", "facts")
+def wookieepedia_facts(soup: BeautifulSoup) -> dict:
+    facts = species_facts(soup)
+    return {key: facts[key] for key in ("height", "lifespan", "homeworld")}
+
+
+# --- Faction / card page (dump mode) ------------------------------------------
+
+@extractor("page", "intro")
+def page_intro(soup: BeautifulSoup) -> str | None:
+    return get_intro_paragraphs(soup, max_chars=600) or None
+
+
+@extractor("page", "image_name")
+def page_image_name(soup: BeautifulSoup) -> str | None:
+    img = soup.select_one("figure.pi-image img[data-image-name]")
+    return img["data-image-name"] if img else None
+
+
+class DocumentStore:
+    """Fetch-once, parse-once document source with single-flight deduplication."""
+
+    def __init__(self, fetcher: AsyncFetcher):
+        self.fetcher = fetcher
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.requested = 0
+        self.errors: dict[str, str] = {}  # url -> why it produced no fields
+
+    async def get(self, url: str) -> BeautifulSoup | None:
+        self.requested += 1
+        if url not in self._inflight:
+            self._inflight[url] = asyncio.ensure_future(self.fetcher.fetch_soup(url))
+        return await self._inflight[url]
+
+    async def fields(self, page_type: str, url: str) -> dict:
+        """Extractor output of one page (parsed in a thread)."""
+        soup = await self.get(url)
+        return await asyncio.to_thread(run_extractors, page_type, soup)
+
+    @property
+    def fetched(self) -> int:
+        return len(self._inflight)
+
+
+class ProcessDocumentStore(DocumentStore):
+    """
+    Fetch raw HTML on the event loop and parse + extract in worker processes.
+    Only picklable data crosses the process boundary: the HTML going in and
+    the extracted fields coming back.
+    """
+
+    def __init__(self, fetcher: AsyncFetcher, pool: ProcessPoolExecutor, workers: int):
+        super().__init__(fetcher)
+        self.pool = pool
+        self._slots = asyncio.Semaphore(workers * PENDING_PER_WORKER)
+
+    async def fields(self, page_type: str, url: str) -> dict:
+        self.requested += 1
+        key = f"{page_type} {url}"
+        if key not in self._inflight:
+            self._inflight[key] = asyncio.ensure_future(self._fetch_and_extract(page_type, url))
+        return await self._inflight[key]
+
+    async def _fetch_and_extract(self, page_type: str, url: str) -> dict:
+        async with self._slots:
+            try:
+                html = await self.fetcher.fetch_text(url)
+            except Exception as e:
+                print(f"    Error: {e}")
+                self.errors[url] = str(e)
+                count("pages.failed")
+                return {}
+            loop = asyncio.get_running_loop()
+            try:
+                fields, timings, error = await loop.run_in_executor(self.pool, extract_page, page_type, html)
+            except Exception as e:  # the worker itself died (BrokenProcessPool, ...)
+                fields, timings, error = {}, None, f"{type(e).__name__}: {e}"
+            if timings:
+                METRICS.merge(timings)
+            if error:
+                print(f"    {url}: {error}")
+                self.errors[url] = error
+                count("pages.failed")
+            return fields
+
+
+def run_extractors(page_type: str, soup: BeautifulSoup | None) -> dict:
+    """Run every extractor registered for `page_type` on one parsed document."""
+    fields = {}
+    if soup is None:
+        return fields
+    for field, func in EXTRACTORS.get(page_type, []):
+        try:
+            with stage(f"extract.{page_type}.{func.__name__}"):
+                value = func(soup)
+        except Exception as e:
+            print(f"    {page_type}.{func.__name__} failed: {e}")
+            continue
+        if isinstance(field, tuple):
+            fields.update(zip(field, value))
+        else:
+            fields[field] = value
+    return fields
+
+
+def extract_page(page_type: str, html: str) -> tuple[dict, dict, str | None]:
+    """
+    Worker-process body: parse one page and run its extractors.
+    Returns (fields, timings, error); a page that fails to parse gives no
+    fields and the error, instead of failing the whole gather.
+    """
+    METRICS.reset()
+    try:
+        soup = parse_page(html)
+    except Exception as e:
+        return {}, METRICS.snapshot(), f"parse failed: {type(e).__name__}: {e}"
+    return run_extractors(page_type, soup), METRICS.snapshot(), None
+
+
+def merge_record(species_id: str, swse_page: str | None, wookieepedia_page: str | None,
+                 swse: dict, wookieepedia: dict) -> dict:
+    """Merge per-page extractor output into one species record."""
+    return {
+        "id": species_id,
+        "swse_page": swse_page,
+        "wookieepedia_page": wookieepedia_page,
+        "image_url": swse.get("image_url"),
+        "intro": swse.get("intro"),
+        "description": wookieepedia.get("lore") or swse.get("swse_description"),
+        "facts": wookieepedia.get("facts", {}),
+        "hidden": {
+            "abilityMods": swse.get("abilityMods", "Aucun"),
+            "languages": swse.get("languages", []),
+            "traits": swse.get("traits", []),
+        },
+    }
+
+
+async def process_species(store: DocumentStore, species_id: str,
+                          swse_page: str | None, wookieepedia_page: str | None) -> dict:
+    """Fetch both pages of a species (deduplicated) and build its merged record."""
+    async def page_fields(page_type: str, url: str | None) -> dict:
+        if not url:
+            return {}
+        return await store.fields(page_type, url)
+
+    swse, wookieepedia = await asyncio.gather(
+        page_fields("swse", swse_url(swse_page) if swse_page else None),
+        page_fields("wookieepedia", wookieepedia_url(wookieepedia_page) if wookieepedia_page else None),
+    )
+    return merge_record(species_id, swse_page, wookieepedia_page, swse, wookieepedia)
+
+
+async def run_pipeline(species: dict[str, tuple], rate: float,
+                       workers: int = 0) -> tuple[list[dict], DocumentStore]:
+    """Process every species; `workers` > 0 parses in that many processes."""
+    fetcher = AsyncFetcher(rate=rate)
+    pool = ProcessPoolExecutor(workers) if workers else None
+    store = ProcessDocumentStore(fetcher, pool, workers) if pool else DocumentStore(fetcher)
+    try:
+        records = await asyncio.gather(*(
+            process_species(store, species_id, *pages) for species_id, pages in species.items()
+        ))
+    finally:
+        if pool:
+            pool.shutdown()
+    return list(records), store
+
+
+def scan_dump(path: Path, wanted: dict[str, set[str]], category_type: str | None = None) -> dict[str, dict]:
+    """
+    One streaming pass over a dump: run the extractors of every page type in
+    `wanted[title]` on each wanted page (parsed once), and those of
+    `category_type` on each other page in SPECIES_CATEGORY.
+    Returns {title: {page type: fields}}.
+    """
+    redirects: dict[str, str] = {}
+    fields = {}
+    print(f"\nReading {path}...")
+    pages = iter_dump_pages(path, titles=set(wanted), redirects=redirects,
+                            category=SPECIES_CATEGORY if category_type else None)
+    for page in pages:
+        title = normalize_title(page.title)
+        title = redirects.get(title, title)
+        soup = parse_page(render_wikitext(page.text))
+        fields[title] = {page_type: run_extractors(page_type, soup)
+                         for page_type in wanted.get(title, {category_type})}
+        soup.decompose()
+    missing = sorted(set(wanted) - set(fields))
+    print(f"  {len(fields)} pages extracted, {len(missing)} wanted pages not in the dump")
+    for title in missing:
+        print(f"    missing: {title}")
+    count("dump.missing", len(missing))
+    return fields
+
+
+def run_dump_pipeline(species: dict[str, tuple], swse_dump: Path | None, wookieepedia_dump: Path | None,
+                      category: bool = False) -> tuple[list[dict], dict]:
+    """Build the species records (and faction/card page records) from dumps, without HTTP."""
+    def dump_title(wiki_page: str) -> str:
+        return normalize_title(page_title(wiki_page))
+
+    swse, wookieepedia, page_records = {}, {}, {}
+    if swse_dump:
+        wanted = {dump_title(s): {"swse"} for s, _ in species.values() if s}
+        swse = scan_dump(swse_dump, wanted, "swse" if category else None)
+    if wookieepedia_dump:
+        wanted = {dump_title(w): {"wookieepedia"} for _, w in species.values() if w}
+        groups = {"factions": FACTION_PAGES, "cards": CARD_PAGES}
+        for pages in groups.values():
+            for wiki_page in pages.values():
+                wanted.setdefault(dump_title(wiki_page), set()).add("page")
+        wookieepedia = scan_dump(wookieepedia_dump, wanted)
+        page_records = {
+            group: {page_id: {"wiki_page": wiki_page, **wookieepedia.get(dump_title(wiki_page), {}).get("page", {})}
+                    for page_id, wiki_page in pages.items()}
+            for group, pages in groups.items()
+        }
+
+    def page_fields(scanned: dict, wiki_page: str | None, page_type: str) -> dict:
+        return scanned.get(dump_title(wiki_page), {}).get(page_type, {}) if wiki_page else {}
+
+    records = [
+        merge_record(species_id, swse_page, wookieepedia_page,
+                     page_fields(swse, swse_page, "swse"), page_fields(wookieepedia, wookieepedia_page, "wookieepedia"))
+        for species_id, (swse_page, wookieepedia_page) in species.items()
+    ]
+    if category:
+        known = {dump_title(s) for s, _ in species.values() if s}
+        records += [
+            merge_record(species_id_for(title), title.replace(" ", "_"), None, fields["swse"], {})
+            for title, fields in sorted(swse.items()) if title not in known
+        ]
+    return records, page_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fetch each species page once and run every extractor on it")
+    parser.add_argument("--limit", type=int, default=0, help="Limit number of species (0 = all)")
+    parser.add_argument("--rate", type=float, default=1 / REQUEST_DELAY,
+                        help=f"Starting requests per second per wiki host, adapted at run time "
+                             f"(default: {1 / REQUEST_DELAY:g})")
+    parser.add_argument("--offline", action="store_true",
+                        help="Serve pages from the on-disk cache only (no network)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"Parse in N worker processes (0 = threads; this machine has {os.cpu_count()} cores)")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help="Output JSON file")
+    parser.add_argument("--swse-dump", type=Path,
+                        help="Read SWSE pages from this MediaWiki XML dump (.xml, .bz2, .gz) instead of the network")
+    parser.add_argument("--wookieepedia-dump", type=Path,
+                        help="Read Wookieepedia pages from this MediaWiki XML dump instead of the network")
+    parser.add_argument("--category", action="store_true",
+                        help=f"Dump mode: also build a record for every page in Category:{SPECIES_CATEGORY}")
+    add_profile_argument(parser)
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+
+    if args.offline:
+        wiki_http.set_cache_mode("offline")
+
+    species = dict(SPECIES_PAGES)
+    if args.limit > 0:
+        species = dict(list(species.items())[:args.limit])
+
+    print("=" * 60)
+    print("Star Wars JDR - Species Pipeline")
+    print("=" * 60)
+    print(f"Species: {len(species)}")
+    for page_type, extractors in EXTRACTORS.items():
+        names = [", ".join(f) if isinstance(f, tuple) else f for f, _ in extractors]
+        print(f"  {page_type}: {', '.join(names)}")
+
+    dump_mode = args.swse_dump or args.wookieepedia_dump
+    if dump_mode:
+        records, page_records = run_dump_pipeline(species, args.swse_dump, args.wookieepedia_dump, args.category)
+    else:
+        records, store = asyncio.run(run_pipeline(species, args.rate, args.workers))
+
+    with open(args.output, "w", encoding="utf-8") as f, stage("write"):
+        json.dump(records, f, ensure_ascii=False, indent=2)
+    if dump_mode and page_records:
+        with open(PAGE_RECORDS_FILE, "w", encoding="utf-8") as f, stage("write"):
+            json.dump(page_records, f, ensure_ascii=False, indent=2)
+        print(f"Faction / card pages saved to: {PAGE_RECORDS_FILE}")
+
+    described = sum(1 for r in records if r["description"])
+    print("\n" + "=" * 60)
+    if dump_mode:
+        print(f"Pages: read from dumps, {METRICS.counters.get('dump.matched', 0)} extracted")
+    else:
+        print(f"Pages: {store.requested} requested, {store.fetched} fetched, {len(store.errors)} failed")
+        for url, error in store.errors.items():
+            print(f"  {url}: {error}")
+    print(f"Records: {len(records)} ({described} with description)")
+    print(f"Saved to: {args.output}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    with run_report("species_pipeline"), profiled("species_pipeline"):
+        main()
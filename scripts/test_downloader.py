@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Checksum verification of downloader.py against a local MockWiki.
+
+The expected digest comes from the wiki, as in the download scripts
+(MediaWikiAPI.image_digests, prop=imageinfo); the corrupted case flips a
+byte of the image body after the digest was read.
+
+Requirements:
+    pip install requests beautifulsoup4 lxml pytest
+
+Usage:
+    python -m pytest test_downloader.py
+"""
+
+import pytest
+
+import wiki_http
+from downloader import DownloadError, download_scaled_image
+from mediawiki_api import MediaWikiAPI
+from mock_wiki import MockWiki
+
+
+@pytest.fixture
+def wiki():
+    wiki_http.set_cache_mode("off")
+    with MockWiki.synthetic(10) as wiki:
+        yield wiki
+
+
+def original_and_digest(wiki: MockWiki) -> tuple[str, str]:
+    url = f"{wiki.image_url('Zabrak')}/revision/latest"
+    api = MediaWikiAPI(f"{wiki.site_url('starwars')}/wiki/", delay=0)
+    return url, api.image_digests([url])[url]
+
+
+def test_original_matching_the_wiki_digest_is_kept(wiki, tmp_path):
+    url, sha1 = original_and_digest(wiki)
+    result = download_scaled_image(url, tmp_path / "zabrak", original_sha1=sha1)
+    assert result.path == tmp_path / "zabrak.png"
+    assert result.path.exists()
+
+
+def test_corrupted_body_raises_download_error(wiki, tmp_path, monkeypatch):
+    url, sha1 = original_and_digest(wiki)
+    intact = wiki.image
+
+    def corrupted(path: str) -> bytes:
+        body = bytearray(intact(path))
+        body[len(body) // 2] ^= 0xFF
+        return bytes(body)
+
+    monkeypatch.setattr(wiki, "image", corrupted)
+    with pytest.raises(DownloadError, match="Checksum mismatch"):
+        download_scaled_image(url, tmp_path / "zabrak", original_sha1=sha1)
+    # No image, and no .part / .part.json to resume the bad bytes from
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+WARC record / replay of the scripts' HTTP traffic.
+
+With --record-warc FILE every response that wiki_http hands to a script
+(pages, api.php answers, images; after retries) is appended to FILE as a
+WARC/1.1 `response` record. Each record is its own gzip member, the usual
+.warc.gz layout, so a record can be decompressed on its own from its
+offset.
+
+With --replay-warc FILE no request leaves the machine: wiki_http answers
+every GET from the archive, byte for byte what was recorded, without
+pacing. A URL missing from the archive raises ReplayMiss (a
+requests.RequestException, so scripts record it as a failed page).
+
+Lookups go through a sidecar index, FILE + ".idx", that is built when a
+recording ends (or on first replay if it is missing or older than the
+archive). It holds fixed-size entries sorted by URL hash,
+
+    16-byte blake2b(url) | offset (u64) | length (u64)
+
+and is memory-mapped and binary-searched, as is the archive itself, so
+replay reads only the record it serves and startup cost does not grow
+with the archive. Recording appends to an existing archive; the newest
+record of a URL wins.
+
+Bodies are stored decoded (no Content-Encoding) with a matching
+Content-Length. Page cache revalidation would record 304s, so both modes
+turn the page cache off.
+
+Both modes can also be set through WIKI_RECORD_WARC / WIKI_REPLAY_WARC,
+e.g. for scripts without an argument parser.
+
+Usage:
+    python scrape_species_descriptions.py --record-warc run.warc.gz
+    python scrape_species_descriptions.py --replay-warc run.warc.gz
+
+    from web_archive import add_archive_arguments
+    add_archive_arguments(parser)
+    args = parser.parse_args()
+    wiki_http.set_archive(record=args.record_warc, replay=args.replay_warc)
+"""
+
+import argparse
+import atexit
+import base64
+import bisect
+import gzip
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import uuid
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import metrics
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"WARCIDX1"
+INDEX_HEADER = struct.Struct("<8sQQ")   # magic, archive size, entries
+INDEX_ENTRY = struct.Struct("<16sQQ")   # url hash, offset, length
+
+# Hop-by-hop / transport headers that no longer describe the stored body
+DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection", "keep-alive"}
+
+READ_CHUNK = 1 << 16
+
+
+class ReplayMiss(requests.RequestException):
+    """The URL was never recorded in the replayed archive."""
+
+
+def add_archive_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record-warc", type=Path, metavar="WARC", default=os.environ.get("WIKI_RECORD_WARC"),
+                       help="Record every HTTP response of the run to this .warc.gz file")
+    group.add_argument("--replay-warc", type=Path, metavar="WARC", default=os.environ.get("WIKI_REPLAY_WARC"),
+                       help="Answer every HTTP request from this .warc.gz file (no network)")
+
+
+def url_key(url: str) -> bytes:
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+
+
+def index_path(archive: Path) -> Path:
+    return archive.with_name(archive.name + INDEX_SUFFIX)
+
+
+def _warc_date() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _warc_record(warc_type: str, block: bytes, content_type: str, fields: dict[str, str]) -> bytes:
+    headers = {
+        "WARC-Type": warc_type,
+        "WARC-Record-ID": f"<urn:uuid:{uuid.uuid4()}>",
+        "WARC-Date": _warc_date(),
+        **fields,
+        "Content-Type": content_type,
+        "Content-Length": str(len(block)),
+    }
+    head = "WARC/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+    return gzip.compress(head.encode("utf-8") + block + b"\r\n\r\n", mtime=0)
+
+
+def http_block(response: requests.Response, body: bytes) -> bytes:
+    """HTTP/1.1 status line, headers and decoded body of a response."""
+    lines = [f"HTTP/1.1 {response.status_code} {response.reason or ''}".rstrip()]
+    lines += [f"{k}: {v}" for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS]
+    lines.append(f"Content-Length: {len(body)}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("iso-8859-1", "replace") + body
+
+
+def read_record(data: bytes) -> tuple[dict[str, str], bytes]:
+    """Split one decompressed WARC record into its headers and block."""
+    head, _, rest = data.partition(b"\r\n\r\n")
+    headers = {}
+    for line in head.decode("utf-8").split("\r\n")[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return headers, rest[:int(headers.get("content-length", len(rest)))]
+
+
+def response_from_block(url: str, block: bytes) -> requests.Response:
+    """Rebuild a fully-read requests.Response from an HTTP block."""
+    head, _, body = block.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("iso-8859-1").split("\r\n")
+    _, status, *reason = status_line.split(" ", 2)
+
+    response = requests.Response()
+    response.url = url
+    response.status_code = int(status)
+    response.reason = reason[0] if reason else ""
+    response.headers = CaseInsensitiveDict(
+        (name.strip(), value.strip()) for name, _, value in (line.partition(":") for line in header_lines)
+    )
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class WarcWriter:
+    """Appends response records to a .warc.gz archive (thread-safe)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        new = not self.path.exists() or self.path.stat().st_size == 0
+        self._file = open(self.path, "ab")
+        if new:
+            info = b"software: swse-scraping-scripts\r\nformat: WARC File Format 1.1\r\n"
+            self._file.write(_warc_record("warcinfo", info, "application/warc-fields",
+                                          {"WARC-Filename": self.path.name}))
+
+    def write(self, url: str, response: requests.Response) -> None:
+        """Append `response` (body read here) as the record of the requested `url`."""
+        body = response.content
+        block = http_block(response, body)
+        digest = base64.b32encode(hashlib.sha1(body).digest()).decode("ascii")
+        record = _warc_record("response", block, "application/http;msgtype=response",
+                              {"WARC-Target-URI": url, "WARC-Payload-Digest": f"sha1:{digest}"})
+        with self._lock:
+            self._file.write(record)
+        metrics.count("archive.recorded")
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+                build_index(self.path)
+
+
+def iter_members(data) -> Iterator[tuple[int, int, bytes]]:
+    """(offset, length, decompressed bytes) of each gzip member of `data`."""
+    offset = 0
+    while offset < len(data):
+        decompressor = zlib.decompressobj(31)
+        out, position = [], offset
+        while not decompressor.eof and position < len(data):
+            chunk = data[position:position + READ_CHUNK]
+            out.append(decompressor.decompress(chunk))
+            position += len(chunk)
+        if not decompressor.eof:  # the recording run was killed mid-write
+            print(f"    Ignoring truncated record at offset {offset}")
+            return
+        end = position - len(decompressor.unused_data)
+        yield offset, end - offset, b"".join(out)
+        offset = end
+
+
+def build_index(archive: Path) -> Path:
+    """Write the sorted URL-hash index of `archive` (newest record of a URL wins)."""
+    entries: dict[bytes, tuple[int, int]] = {}
+    size = archive.stat().st_size
+    if size:
+        with open(archive, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for offset, length, record in iter_members(data):
+                headers, _ = read_record(record)
+                if headers.get("warc-type") == "response":
+                    entries[url_key(headers["warc-target-uri"])] = (offset, length)
+
+    path = index_path(archive)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, size, len(entries)))
+        for key in sorted(entries):
+            f.write(INDEX_ENTRY.pack(key, *entries[key]))
+    os.replace(tmp, path)
+    return path
+
+
+class _Keys:
+    """Sequence view of the url hashes in a mapped index, for bisect."""
+
+    def __init__(self, index: mmap.mmap, count: int):
+        self.index, self.count = index, count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i: int) -> bytes:
+        start = INDEX_HEADER.size + i * INDEX_ENTRY.size
+        return self.index[start:start + 16]
+
+
+class WarcReplay:
+    """Serves recorded responses from a memory-mapped archive and index."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"No such archive: {self.path}")
+        size = self.path.stat().st_size
+        idx = index_path(self.path)
+        if not idx.exists() or self._indexed_size(idx) != size:
+            print(f"Indexing {self.path}...")
+            build_index(self.path)
+
+        self._archive_file = open(self.path, "rb")
+        self._index_file = open(idx, "rb")
+        self.archive = mmap.mmap(self._archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, count = INDEX_HEADER.unpack_from(self.index, 0)
+        self.keys = _Keys(self.index, count)
+
+    @staticmethod
+    def _indexed_size(idx: Path) -> int | None:
+        with open(idx, "rb") as f:
+            header = f.read(INDEX_HEADER.size)
+        if len(header) < INDEX_HEADER.size:
+            return None
+        magic, size, _ = INDEX_HEADER.unpack(header)
+        return size if magic == INDEX_MAGIC else None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def locate(self, url: str) -> tuple[int, int] | None:
+        key = url_key(url)
+        i = bisect.bisect_left(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            return None
+        _, offset, length = INDEX_ENTRY.unpack_from(self.index, INDEX_HEADER.size + i * INDEX_ENTRY.size)
+        return offset, length
+
+    def get(self, url: str) -> requests.Response:
+        location = self.locate(url)
+        if location is None:
+            metrics.count("archive.miss")
+            raise ReplayMiss(f"Not in archive {self.path.name}: {url}")
+        offset, length = location
+        with metrics.stage("archive.read"):
+            _, block = read_record(zlib.decompress(self.archive[offset:offset + length], 31))
+        metrics.count("archive.replayed")
+        return response_from_block(url, block)
+
+    def close(self) -> None:
+        self.archive.close()
+        self.index.close()
+        self._archive_file.close()
+        self._index_file.close()
+
+
+def open_archive(record: Path | None = None, replay: Path | None = None) -> WarcWriter | WarcReplay | None:
+    """The writer or replayer for a run (None for neither); a writer is indexed at exit."""
+    if record:
+        writer = WarcWriter(record)
+        atexit.register(writer.close)
+        return writer
+    if replay:
+        return WarcReplay(replay)
+    return None
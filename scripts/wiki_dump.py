@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for MediaWiki XML exports (Special:Export, Fandom dumps).
+
+A dump is read with ElementTree.iterparse: each <page> is handed out as
+soon as its closing tag has been parsed and then cleared from the tree,
+so memory stays at one page however large the file is. .bz2 and .gz
+dumps are decompressed on the fly.
+
+Dumps carry wikitext, while the extractors (infobox, scrape_species,
+scrape_species_descriptions) read rendered HTML. render_wikitext turns
+the parts they look at into the same markup Fandom renders:
+
+    {{Species|height=...|homeworld=...}}   aside.portable-infobox, one
+                                           div.pi-data row per parameter,
+                                           `image` as figure.pi-image with
+                                           data-image-name (no src)
+    == Heading ==                          <h2><span class="mw-headline">
+    '''bold''' / ''italic''                <b> / <i>
+    * item / # item                        <ul>/<ol><li>
+    blank-line separated text              <p>
+
+inside a div.mw-parser-output. Links keep their label, references,
+comments, categories, files and other templates are dropped. That is
+enough for descriptions, stat blocks and infobox facts; it is not a
+MediaWiki parser (no template expansion, no tables).
+
+Usage:
+    from wiki_dump import iter_dump_pages, render_wikitext
+
+    for page in iter_dump_pages("swse-pages-current.xml.bz2", titles={"Human", "Chiss"}):
+        soup = parse_page(render_wikitext(page.text))
+"""
+
+import bz2
+import gzip
+import html
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+import metrics
+
+# Main (article) namespace
+ARTICLE_NS = 0
+
+COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+REF_RE = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.S | re.I)
+HEADING_RE = re.compile(r"^(={2,6})\s*(.*?)\s*\1\s*$")
+LINK_RE = re.compile(r"\[\[([^\[\]|]*)(?:\|([^\[\]]*))?\]\]")
+EXTERNAL_LINK_RE = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+BOLD_RE = re.compile(r"'''(.+?)'''")
+ITALIC_RE = re.compile(r"''(.+?)''")
+CATEGORY_RE = re.compile(r"\[\[\s*Category\s*:\s*([^\]|]+)", re.I)
+FILE_RE = re.compile(r"\[\[\s*(?:File|Image)\s*:\s*([^\]|]+)", re.I)
+FILE_PREFIXES = ("file:", "image:", "category:")
+
+
+class DumpPage(NamedTuple):
+    title: str
+    ns: int
+    revid: int | None
+    timestamp: str | None
+    redirect: str | None
+    text: str
+
+
+def normalize_title(title: str) -> str:
+    """MediaWiki title form: spaces for underscores, first letter upper-case."""
+    title = re.sub(r"[_\s]+", " ", title).strip()
+    return title[:1].upper() + title[1:]
+
+
+def open_dump(path: Path):
+    path = Path(path)
+    if path.suffix == ".bz2":
+        return bz2.open(path, "rb")
+    if path.suffix == ".gz":
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _local(tag: str) -> str:
+    """Tag name without the export-0.x XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _page_fields(elem: ET.Element) -> DumpPage:
+    title, ns, redirect = "", ARTICLE_NS, None
+    revid = timestamp = None
+    text = ""
+    for child in elem:
+        tag = _local(child.tag)
+        if tag == "title":
+            title = child.text or ""
+        elif tag == "ns":
+            ns = int(child.text or 0)
+        elif tag == "redirect":
+            redirect = child.get("title")
+        elif tag == "revision":
+            # Current-revision dumps have one; full-history dumps end with the latest
+            for field in child:
+                name = _local(field.tag)
+                if name == "id":
+                    revid = int(field.text)
+                elif name == "timestamp":
+                    timestamp = field.text
+                elif name == "text":
+                    text = field.text or ""
+    return DumpPage(title, ns, revid, timestamp, redirect, text)
+
+
+def iter_dump_pages(path: Path, titles: set[str] | None = None, category: str | None = None,
+                    namespaces: tuple[int, ...] = (ARTICLE_NS,),
+                    redirects: dict[str, str] | None = None) -> Iterator[DumpPage]:
+    """
+    Yield the pages of a dump in file order, one at a time.
+
+    With `titles` and/or `category`, only pages whose (normalised) title is
+    in `titles` or whose wikitext lists `category` are yielded. Redirects
+    from a wanted title are followed when the target comes later in the
+    dump (it is read once) and recorded in `redirects` as
+    {target: wanted title}.
+    """
+    wanted = {normalize_title(t) for t in titles} if titles is not None else None
+    category = normalize_title(category) if category else None
+    root = None
+    with open_dump(path) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or _local(elem.tag) != "page":
+                continue
+            page = _page_fields(elem)
+            root.clear()  # drop the page (and everything before it) from the tree
+            metrics.count("dump.pages")
+
+            if page.ns not in namespaces:
+                continue
+            if wanted is not None or category:
+                title = normalize_title(page.title)
+                if page.redirect:
+                    if wanted is not None and title in wanted:
+                        target = normalize_title(page.redirect)
+                        wanted.add(target)
+                        if redirects is not None:
+                            redirects[target] = redirects.get(title, title)
+                    continue
+                in_category = category is not None and category in page_categories(page.text)
+                if not in_category and (wanted is None or title not in wanted):
+                    continue
+            metrics.count("dump.matched")
+            yield page
+
+
+def page_categories(wikitext: str) -> set[str]:
+    """Categories a page's wikitext puts it in (not those added by templates)."""
+    return {normalize_title(name) for name in CATEGORY_RE.findall(wikitext)}
+
+
+# --- Wikitext -> HTML ---------------------------------------------------------
+
+def _split_top_level(text: str, sep: str = "|") -> list[str]:
+    """Split on `sep` outside of nested [[...]] and {{...}}."""
+    parts, depth, start, i = [], 0, 0, 0
+    while i < len(text):
+        pair = text[i:i + 2]
+        if pair in ("[[", "{{"):
+            depth += 1
+            i += 2
+        elif pair in ("]]", "}}") and depth:
+            depth -= 1
+            i += 2
+        else:
+            if text[i] == sep and not depth:
+                parts.append(text[start:i])
+                start = i + 1
+            i += 1
+    parts.append(text[start:])
+    return parts
+
+
+def _template_spans(text: str) -> Iterator[tuple[int, int]]:
+    """(start, end) of each top-level {{...}} in `text`."""
+    depth, start, i = 0, 0, 0
+    while i < len(text) - 1:
+        pair = text[i:i + 2]
+        if pair == "{{":
+            if not depth:
+                start = i
+            depth += 1
+            i += 2
+        elif pair == "}}" and depth:
+            depth -= 1
+            i += 2
+            if not depth:
+                yield start, i
+        else:
+            i += 1
+
+
+def templates(wikitext: str) -> list[tuple[str, dict[str, str]]]:
+    """Top-level templates of a page as (name, {named parameter: value})."""
+    found = []
+    for start, end in _template_spans(wikitext):
+        name, *args = _split_top_level(wikitext[start + 2:end - 2])
+        params = {}
+        for arg in args:
+            key, eq, value = arg.partition("=")
+            if eq:
+                params[key.strip().lower()] = value.strip()
+        found.append((name.strip(), params))
+    return found
+
+
+def _inline(text: str) -> str:
+    """Render links, bold and italic; drop files, categories and leftover markup."""
+    def link(match: re.Match) -> str:
+        target, label = match.group(1), match.group(2)
+        if target.strip().lower().startswith(FILE_PREFIXES):
+            return ""
+        return label if label is not None else target.split("#")[0]
+
+    text = LINK_RE.sub(link, text)
+    text = EXTERNAL_LINK_RE.sub(r"\1", text)
+    text = BOLD_RE.sub(r"<b>\1</b>", text)
+    text = ITALIC_RE.sub(r"<i>\1</i>", text)
+    return text.replace("[[", "").replace("]]", "")
+
+
+def _infobox(params: dict[str, str]) -> str:
+    figure = ""
+    if params.get("image"):
+        match = FILE_RE.search(params["image"])
+        name = normalize_title(match.group(1) if match else params["image"])
+        figure = (f'<figure class="pi-item pi-image"><img class="pi-image-thumbnail" '
+                  f'data-image-name="{html.escape(name)}" alt=""></figure>')
+    rows = "".join(
+        f'<div class="pi-item pi-data" data-source="{key}">'
+        f'<h3 class="pi-data-label">{key.replace("_", " ").capitalize()}</h3>'
+        f'<div class="pi-data-value">{_inline(value)}</div></div>'
+        for key, value in params.items()
+        if key not in ("image", "imagecaption", "caption", "name", "title") and value
+    )
+    return f'<aside class="portable-infobox">{figure}{rows}</aside>'
+
+
+def _blocks(lines: list[str]) -> Iterator[str]:
+    paragraph: list[str] = []
+    items: list[str] = []
+    list_tag = "ul"
+
+    def flush_paragraph():
+        text = _inline(" ".join(paragraph)).strip()
+        if text:
+            yield f"<p>{text}</p>"
+        paragraph.clear()
+
+    def flush_list():
+        if items:
+            yield f"<{list_tag}>" + "".join(f"<li>{_inline(item)}</li>" for item in items) + f"</{list_tag}>"
+            items.clear()
+
+    for line in lines:
+        line = line.strip()
+        heading = HEADING_RE.match(line)
+        if heading or not line:
+            yield from flush_paragraph()
+            yield from flush_list()
+            if heading:
+                level = min(len(heading.group(1)), 6)
+                yield f'<h{level}><span class="mw-headline">{_inline(heading.group(2))}</span></h{level}>'
+        elif line[0] in "*#:;":
+            yield from flush_paragraph()
+            tag = "ol" if line[0] == "#" else "ul"
+            if items and tag != list_tag:
+                yield from flush_list()
+            list_tag = tag
+            items.append(line.lstrip("*#:; "))
+        else:
+            yield from flush_list()
+            paragraph.append(line)
+    yield from flush_paragraph()
+    yield from flush_list()
+
+
+@metrics.timed("dump.render")
+def render_wikitext(wikitext: str) -> str:
+    """Render the parts of a page the extractors read as Fandom-style HTML (see module docstring)."""
+    text = REF_RE.sub("", COMMENT_RE.sub("", wikitext))
+
+    # Multi-line templates with named parameters are infoboxes; everything else is dropped
+    parts, infoboxes, last = [], [], 0
+    for start, end in _template_spans(text):
+        parts.append(text[last:start])
+        body = text[start:end]
+        if "\n" in body:
+            _, params = templates(body)[0]
+            if params:
+                infoboxes.append(_infobox(params))
+        last = end
+    parts.append(text[last:])
+    text = "".join(parts)
+
+    body = "\n".join(_blocks(text.split("\n")))
+    return f'<div class="mw-parser-output">{"".join(infoboxes)}\n{body}\n</div>'
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP layer for the scraping scripts.
+
+Every script goes through one pooled requests.Session so that pages and
+images on *.fandom.com and static.wikia.nocookie.net reuse keep-alive
+connections instead of paying a TCP+TLS handshake per request.
+
+Page HTML is cached on disk (see http_cache) and revalidated with
+conditional requests; images are always fetched directly.
+
+Requests are paced per host by pacing.HostPacer, which adapts the interval
+to the host's response times, honours Retry-After, retries 429/5xx and
+connection errors with jittered backoff and opens a circuit breaker when a
+host keeps failing. The scripts' REQUEST_DELAY is only the starting
+interval.
+
+The wiki roots come from SWSE_WIKI_URL / WOOKIEEPEDIA_WIKI_URL so every
+script can be pointed at a local stand-in wiki (see mock_wiki.py), and
+WIKI_DELAY_SCALE scales the pacing intervals (0 for local load tests only).
+
+With set_archive (the scripts' --record-warc / --replay-warc) the traffic
+is recorded to, or answered from, a WARC file instead (see web_archive).
+
+Requirements:
+    pip install requests beautifulsoup4 lxml
+
+Usage:
+    from wiki_http import get_soup, http_get
+
+    soup = get_soup("https://swse.fandom.com/wiki/Human", delay=0.5)
+    response = http_get(image_url, stream=True)
+"""
+
+import os
+import threading
+import time
+
+try:
+    import requests
+    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+import metrics
+import pacing
+import web_archive
+from http_cache import CacheMiss, HttpCache
+from wiki_parse import parse_page
+
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "Chrome/120.0.0.0 Safari/537.36 StarWarsJDR-Scraper/1.0"
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# (connect, read) timeout in seconds
+TIMEOUT = (10, 30)
+
+# Connection pool sizing: one pool per host, a few sockets per pool
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 8
+
+# Wiki roots (no trailing slash); override to crawl a local stand-in
+SWSE_WIKI = os.environ.get("SWSE_WIKI_URL", "https://swse.fandom.com").rstrip("/")
+WOOKIEEPEDIA_WIKI = os.environ.get("WOOKIEEPEDIA_WIKI_URL", "https://starwars.fandom.com").rstrip("/")
+
+# Multiplier applied to every pacing interval
+DELAY_SCALE = pacing.DELAY_SCALE
+
+class TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        with metrics.stage("http.connect"):
+            super().connect()
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        with metrics.stage("http.connect"):
+            super().connect()
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pools time every new connection (metrics stage http.connect)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+_session: requests.Session | None = None
+_cache: HttpCache | None = None
+_archive: web_archive.WarcWriter | web_archive.WarcReplay | None = None
+_archive_loaded = False
+_archive_lock = threading.Lock()
+
+
+def build_session() -> requests.Session:
+    """Create a session with keep-alive pools mounted.
+
+    Retries are left to paced_get, so that every attempt goes through the
+    host's pacer.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+
+    adapter = TimedHTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide shared session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = build_session()
+    return _session
+
+
+def get_cache() -> HttpCache:
+    """Return the shared page cache (mode from the WIKI_CACHE env variable)."""
+    global _cache
+    if _cache is None:
+        _cache = HttpCache(mode=os.environ.get("WIKI_CACHE", "on"))
+    return _cache
+
+
+def set_cache_mode(mode: str) -> None:
+    """Switch the shared page cache to 'on', 'offline' or 'off'."""
+    global _cache
+    _cache = HttpCache(mode=mode)
+
+
+def set_archive(record=None, replay=None) -> None:
+    """Record the run's responses to, or replay them from, a WARC file (see web_archive)."""
+    global _archive, _archive_loaded
+    _archive = web_archive.open_archive(record, replay)
+    _archive_loaded = True
+    if _archive is not None:
+        set_cache_mode("off")  # revalidation would record 304s / bypass the archive
+
+
+def get_archive() -> web_archive.WarcWriter | web_archive.WarcReplay | None:
+    """The run's archive, from WIKI_RECORD_WARC / WIKI_REPLAY_WARC unless set_archive was called."""
+    with _archive_lock:
+        if not _archive_loaded:
+            set_archive(os.environ.get("WIKI_RECORD_WARC") or None, os.environ.get("WIKI_REPLAY_WARC") or None)
+    return _archive
+
+
+def replaying() -> bool:
+    """True when responses come from a WARC replay (no network, no pacing)."""
+    return isinstance(get_archive(), web_archive.WarcReplay)
+
+
+def cache_only() -> bool:
+    """True when pages must be served from the cache without any network access."""
+    return get_cache().mode == "offline"
+
+
+def paced_get(url: str, delay: float | None = None, reserved: bool = False,
+              read_body: bool = False, **kwargs) -> requests.Response:
+    """GET a URL through the host's pacer, retrying transient failures.
+
+    `delay` is the host's starting interval (first use only). With
+    `reserved` the caller already waited for the first attempt's slot (see
+    async_fetch). With `read_body` the body is read here, so a cut-off body
+    is retried too. After the last attempt a 429/5xx response is returned
+    as is; connection errors are raised. When recording, the final response
+    is read and archived; when replaying, it comes from the archive.
+    """
+    archive = get_archive()
+    if isinstance(archive, web_archive.WarcReplay):
+        return archive.get(url)
+
+    pacer = pacing.pacer_for(url, delay)
+    kwargs.setdefault("timeout", TIMEOUT)
+
+    for attempt in range(pacing.RETRY_ATTEMPTS):
+        if attempt:
+            metrics.count("http.retries")
+            time.sleep(pacing.backoff_delay(attempt - 1))
+        if attempt or not reserved:
+            pacer.wait()
+
+        start = time.perf_counter()
+        try:
+            with metrics.stage("http.ttfb"):
+                response = get_session().get(url, **kwargs)
+            latency = time.perf_counter() - start
+            if read_body and response.status_code not in pacing.RETRY_STATUSES:
+                with metrics.stage("http.download"):
+                    response.content
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            pacer.record(None, time.perf_counter() - start)
+            if attempt + 1 == pacing.RETRY_ATTEMPTS:
+                raise
+            print(f"    Retrying {url}: {e.__class__.__name__}")
+            continue
+
+        retry_after = pacing.parse_retry_after(response.headers.get("Retry-After"))
+        pacer.record(response.status_code, latency, retry_after)
+        if response.status_code not in pacing.RETRY_STATUSES or attempt + 1 == pacing.RETRY_ATTEMPTS:
+            if archive is not None:
+                archive.write(url, response)
+            return response
+        print(f"    Retrying {url}: HTTP {response.status_code}")
+        response.close()
+
+
+def http_get(url: str, delay: float | None = None, reserved: bool = False, **kwargs) -> requests.Response:
+    """GET a URL through the shared session (paced, see paced_get) and raise on HTTP errors."""
+    response = paced_get(url, delay=delay, reserved=reserved, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def fetch_page_text(url: str, delay: float | None = None, reserved: bool = False) -> tuple[str, bool]:
+    """Return (html, from_network) for a wiki page, going through the cache.
+
+    `delay` and `reserved` are passed on to paced_get. Raises CacheMiss in
+    offline mode when the page was never cached.
+    """
+    cache = get_cache()
+    meta = cache.lookup(url) if cache.mode != "off" else None
+
+    if cache.mode == "offline":
+        if meta is None:
+            metrics.count("cache.miss")
+            raise CacheMiss(f"Not in cache (offline mode): {url}")
+        metrics.count("cache.hit")
+        return cache.read_text(meta), False
+
+    response = paced_get(url, delay=delay, reserved=reserved, read_body=True,
+                         headers=cache.conditional_headers(meta), stream=True)
+    if response.status_code == 304 and meta:
+        metrics.count("cache.revalidated")
+        cache.touch(url, meta)
+        return cache.read_text(meta), True
+    response.raise_for_status()
+
+    body = response.content
+    metrics.count("bytes.pages", len(body))
+    metrics.count("cache.miss" if cache.mode != "off" else "cache.bypass")
+
+    if cache.mode != "off":
+        cache.store(url, body, response.headers, response.encoding)
+    return response.text, True
+
+
+def get_soup(url: str, delay: float | None = None, fast: bool = True) -> BeautifulSoup:
+    """Fetch a page and return a BeautifulSoup object.
+
+    Raises requests.RequestException (or CacheMiss) on failure. `delay` is
+    the host's starting request interval, see pacing. With `fast` (the
+    default) only the article subtrees are parsed, see wiki_parse.
+    """
+    html, _ = fetch_page_text(url, delay=delay)
+    return parse_page(html, fast=fast)
+
+
+def try_get_soup(url: str, delay: float | None = None, fast: bool = True) -> BeautifulSoup | None:
+    """Like get_soup, but print the error and return None on failure."""
+    try:
+        return get_soup(url, delay=delay, fast=fast)
+    except Exception as e:
+        print(f"    Error fetching page: {e}")
+        return None
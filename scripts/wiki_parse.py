@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+HTML parsing entry point for the scraping scripts.
+
+A rendered Fandom page is mostly navigation, ads and scripts; the
+extractors only ever look inside `div.mw-parser-output`,
+`aside.portable-infobox` and `figure.pi-image`. The fast mode builds the
+tree for those subtrees only (a bs4 SoupStrainer on top of lxml), which is
+both quicker and far lighter on memory than materialising the whole page.
+
+Pages whose interesting parts live outside the article body (category
+listings, "every image on the page") must be parsed with fast=False.
+page_revision reads the revision ID MediaWiki embeds in the page's
+<head> straight from the HTML, so the strainer does not matter for it.
+
+Usage:
+    from wiki_parse import page_revision, parse_page
+
+    soup = parse_page(html)              # article subtrees only
+    soup = parse_page(html, fast=False)  # the whole document
+    revid = page_revision(html)
+"""
+
+import re
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    print("Please install required packages:")
+    print("  pip install requests beautifulsoup4 lxml")
+    exit(1)
+
+import metrics
+
+# Subtrees the extractors read; anything else on the page is skipped
+CONTENT_STRAINER = SoupStrainer(
+    ["div", "aside", "figure"],
+    class_=re.compile(r"^(mw-parser-output|portable-infobox|pi-image)$"),
+)
+
+# RLCONF in every rendered MediaWiki page: ..."wgRevisionId":1234567,...
+REVISION_ID_RE = re.compile(r'"wgRevisionId":\s*(\d+)')
+
+
+@metrics.timed("parse")
+def parse_page(html: str, fast: bool = True) -> BeautifulSoup:
+    """Parse a wiki page, keeping only the article subtrees when `fast` is set."""
+    if fast:
+        return BeautifulSoup(html, "lxml", parse_only=CONTENT_STRAINER)
+    return BeautifulSoup(html, "lxml")
+
+
+def page_revision(html: str) -> int | None:
+    """Revision ID of the rendered page, if the page carries one."""
+    match = REVISION_ID_RE.search(html)
+    return int(match.group(1)) if match else None